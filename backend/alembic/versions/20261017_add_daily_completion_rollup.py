@@ -0,0 +1,84 @@
+"""Add daily_completion_rollup table
+
+Materialized per-day slot counts by completion status, override flag and
+calorie/protein sums, backfilled from existing weekly plan data.
+
+Revision ID: 20261017_rollup
+Revises: 20260212_adhoc
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_rollup'
+down_revision = '20260212_adhoc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_completion_rollup',
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('unmarked', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('followed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('adjusted', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('skipped', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('replaced', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('social', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('is_override', sa.Boolean(), nullable=False, server_default='false'),
+        sa.Column('calories', sa.Integer(), nullable=True),
+        sa.Column('protein', sa.Numeric(precision=8, scale=1), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('date'),
+    )
+
+    # Backfill from existing slots and plan days
+    op.execute("""
+        INSERT INTO daily_completion_rollup (
+            date, total, unmarked, followed, adjusted, skipped, replaced, social,
+            is_override, calories, protein, updated_at
+        )
+        SELECT
+            COALESCE(s.date, d.date),
+            COALESCE(s.total, 0),
+            COALESCE(s.unmarked, 0),
+            COALESCE(s.followed, 0),
+            COALESCE(s.adjusted, 0),
+            COALESCE(s.skipped, 0),
+            COALESCE(s.replaced, 0),
+            COALESCE(s.social, 0),
+            COALESCE(d.is_override, false),
+            s.calories,
+            s.protein,
+            now()
+        FROM (
+            SELECT
+                slot.date,
+                count(slot.id) AS total,
+                count(slot.id) FILTER (WHERE slot.completion_status IS NULL) AS unmarked,
+                count(slot.id) FILTER (WHERE slot.completion_status = 'followed') AS followed,
+                count(slot.id) FILTER (WHERE slot.completion_status = 'adjusted') AS adjusted,
+                count(slot.id) FILTER (WHERE slot.completion_status = 'skipped') AS skipped,
+                count(slot.id) FILTER (WHERE slot.completion_status = 'replaced') AS replaced,
+                count(slot.id) FILTER (WHERE slot.completion_status = 'social') AS social,
+                sum(meal.calories_kcal) AS calories,
+                sum(meal.protein_g) AS protein
+            FROM weekly_plan_slot slot
+            LEFT JOIN meal ON meal.id = slot.meal_id
+            GROUP BY slot.date
+        ) s
+        FULL OUTER JOIN (
+            SELECT date, bool_or(is_override) AS is_override
+            FROM weekly_plan_instance_day
+            GROUP BY date
+        ) d ON d.date = s.date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('daily_completion_rollup')
@@ -0,0 +1,30 @@
+"""Add data_version table for response cache keys
+
+Revision ID: 20261017_data_version
+Revises: 20261017_rollup_macros
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_data_version'
+down_revision = '20261017_rollup_macros'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'data_version',
+        sa.Column('scope', sa.String(length=32), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='1'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('scope'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('data_version')
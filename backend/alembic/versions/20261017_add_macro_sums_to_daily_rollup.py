@@ -0,0 +1,52 @@
+"""Add carbs, sugar, fat, saturated fat and fiber sums to daily_completion_rollup
+
+Revision ID: 20261017_rollup_macros
+Revises: 20261017_rollup
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_rollup_macros'
+down_revision = '20261017_rollup'
+branch_labels = None
+depends_on = None
+
+MACRO_COLUMNS = {
+    'carbs': 'carbs_g',
+    'sugar': 'sugar_g',
+    'fat': 'fat_g',
+    'saturated_fat': 'saturated_fat_g',
+    'fiber': 'fiber_g',
+}
+
+
+def upgrade() -> None:
+    for column in MACRO_COLUMNS:
+        op.add_column(
+            'daily_completion_rollup',
+            sa.Column(column, sa.Numeric(precision=8, scale=1), nullable=True),
+        )
+
+    # Backfill from the meals assigned to each day's slots
+    op.execute(f"""
+        UPDATE daily_completion_rollup r
+        SET {', '.join(f'{column} = s.{column}' for column in MACRO_COLUMNS)}
+        FROM (
+            SELECT
+                slot.date,
+                {', '.join(f'sum(meal.{source}) AS {column}' for column, source in MACRO_COLUMNS.items())}
+            FROM weekly_plan_slot slot
+            JOIN meal ON meal.id = slot.meal_id
+            GROUP BY slot.date
+        ) s
+        WHERE s.date = r.date
+    """)
+
+
+def downgrade() -> None:
+    for column in reversed(list(MACRO_COLUMNS)):
+        op.drop_column('daily_completion_rollup', column)
@@ -0,0 +1,42 @@
+"""Add trigram, full-text and keyset indexes for meal search
+
+Revision ID: 20261017_meal_search
+Revises: 20261017_data_version
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_meal_search'
+down_revision = '20261017_data_version'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Infix (ILIKE '%term%') name matching
+    op.execute(
+        "CREATE INDEX ix_meal_name_trgm ON meal USING gin (name gin_trgm_ops)"
+    )
+    # Ranked full-text search; must match app.models.meal.meal_search_document
+    op.execute(
+        "CREATE INDEX ix_meal_search_document ON meal USING gin ("
+        "to_tsvector('simple'::regconfig, "
+        "name || ' ' || portion_description || ' ' || coalesce(notes, '')))"
+    )
+    # Keyset pagination order; supersedes the plain name index
+    op.create_index('ix_meal_name_id', 'meal', ['name', 'id'], unique=False)
+    op.drop_index('ix_meal_name', table_name='meal')
+
+
+def downgrade() -> None:
+    op.create_index('ix_meal_name', 'meal', ['name'], unique=False)
+    op.drop_index('ix_meal_name_id', table_name='meal')
+    op.drop_index('ix_meal_search_document', table_name='meal')
+    op.drop_index('ix_meal_name_trgm', table_name='meal')
+    # pg_trgm is left installed; other objects may depend on it
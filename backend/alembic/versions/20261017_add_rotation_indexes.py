@@ -0,0 +1,35 @@
+"""Add indexes for server-side round-robin successor lookups
+
+Revision ID: 20261017_rotation_indexes
+Revises: 20261017_meal_search
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_rotation_indexes'
+down_revision = '20261017_meal_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rotation members of a meal type (the primary key leads with meal_id)
+    op.create_index(
+        'ix_meal_to_meal_type_meal_type_id_meal_id',
+        'meal_to_meal_type',
+        ['meal_type_id', 'meal_id'],
+        unique=False,
+    )
+    # Rotation order; supersedes the plain created_at index
+    op.create_index('ix_meal_created_at_id', 'meal', ['created_at', 'id'], unique=False)
+    op.drop_index('ix_meal_created_at', table_name='meal')
+
+
+def downgrade() -> None:
+    op.create_index('ix_meal_created_at', 'meal', ['created_at'], unique=False)
+    op.drop_index('ix_meal_created_at_id', table_name='meal')
+    op.drop_index('ix_meal_to_meal_type_meal_type_id_meal_id', table_name='meal_to_meal_type')
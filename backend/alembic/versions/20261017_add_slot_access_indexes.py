@@ -0,0 +1,51 @@
+"""Add covering and partial indexes matching weekly_plan_slot access paths
+
+Revision ID: 20261017_slot_indexes
+Revises: 20261017_rotation_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_slot_indexes'
+down_revision = '20261017_rotation_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Date-range aggregates (stats, daily rollup); supersedes the plain date index
+    op.create_index(
+        'ix_weekly_plan_slot_date_covering',
+        'weekly_plan_slot',
+        ['date'],
+        unique=False,
+        postgresql_include=['completion_status', 'meal_type_id', 'meal_id'],
+    )
+    op.drop_index('ix_weekly_plan_slot_date', table_name='weekly_plan_slot')
+    # Slots still to be marked (week regeneration)
+    op.create_index(
+        'ix_weekly_plan_slot_unmarked',
+        'weekly_plan_slot',
+        ['weekly_plan_instance_id', 'date', 'position'],
+        unique=False,
+        postgresql_where=sa.text('completion_status IS NULL'),
+    )
+    # uq_weekly_plan_slot_position (weekly_plan_instance_id, date, position)
+    # already serves instance lookups
+    op.drop_index('ix_weekly_plan_slot_weekly_plan_instance_id', table_name='weekly_plan_slot')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_weekly_plan_slot_weekly_plan_instance_id',
+        'weekly_plan_slot',
+        ['weekly_plan_instance_id'],
+        unique=False,
+    )
+    op.drop_index('ix_weekly_plan_slot_unmarked', table_name='weekly_plan_slot')
+    op.create_index('ix_weekly_plan_slot_date', 'weekly_plan_slot', ['date'], unique=False)
+    op.drop_index('ix_weekly_plan_slot_date_covering', table_name='weekly_plan_slot')
@@ -0,0 +1,40 @@
+"""Add weekly_plan_archive_day for compacted history of past weeks
+
+Revision ID: 20261017_plan_archive
+Revises: 20261017_partition_history
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_plan_archive'
+down_revision = '20261017_partition_history'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'weekly_plan_archive_day',
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('weekly_plan_instance_id', sa.UUID(), nullable=False),
+        sa.Column('week_start_date', sa.Date(), nullable=False),
+        sa.Column('week_plan_id', sa.UUID(), nullable=True),
+        sa.Column('day_template_id', sa.UUID(), nullable=True),
+        sa.Column('is_override', sa.Boolean(), nullable=False),
+        sa.Column('override_reason', sa.Text(), nullable=True),
+        sa.Column('slots', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'[]'::jsonb"), nullable=False),
+        sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('date'),
+    )
+    op.create_index('ix_weekly_plan_archive_day_week_start_date', 'weekly_plan_archive_day', ['week_start_date'], unique=False)
+
+
+def downgrade() -> None:
+    # Archived weeks are not restored to the live tables
+    op.drop_index('ix_weekly_plan_archive_day_week_start_date', table_name='weekly_plan_archive_day')
+    op.drop_table('weekly_plan_archive_day')
@@ -0,0 +1,147 @@
+"""Partition weekly_plan_instance_day and weekly_plan_slot by year
+
+Revision ID: 20261017_partition_history
+Revises: 20261017_slot_indexes
+Create Date: 2026-10-17
+
+Postgres cannot partition an existing table in place, so each table is
+copied aside, recreated as a partitioned table (primary key (id, date), as
+keys must include the partition key), given a DEFAULT partition plus one
+partition per year from the oldest to the newest existing row (the same
+years for both tables, so the result depends only on the data), and
+refilled. Without rows only the DEFAULT partition is created. The current
+and next year are added by the background scheduler
+(app.services.partitions.ensure_upcoming_partitions), which moves their
+rows out of the DEFAULT partition.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017_partition_history'
+down_revision = '20261017_slot_indexes'
+branch_labels = None
+depends_on = None
+
+
+DAY_COLUMNS = [
+    'id', 'weekly_plan_instance_id', 'date', 'day_template_id', 'is_override',
+    'override_reason', 'created_at', 'updated_at',
+]
+SLOT_COLUMNS = [
+    'id', 'weekly_plan_instance_id', 'date', 'position', 'meal_type_id', 'meal_id',
+    'is_adhoc', 'completion_status', 'completed_at',
+]
+
+
+def _day_table_args(partitioned: bool) -> tuple:
+    return (
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('weekly_plan_instance_id', sa.UUID(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('day_template_id', sa.UUID(), nullable=True),
+        sa.Column('is_override', sa.Boolean(), nullable=False),
+        sa.Column('override_reason', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['day_template_id'], ['day_template.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['weekly_plan_instance_id'], ['weekly_plan_instance.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint(*(['id', 'date'] if partitioned else ['id']), name='weekly_plan_instance_day_pkey'),
+        sa.UniqueConstraint('weekly_plan_instance_id', 'date', name='uq_weekly_plan_instance_day_date'),
+    )
+
+
+def _slot_table_args(partitioned: bool) -> tuple:
+    return (
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('weekly_plan_instance_id', sa.UUID(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('meal_type_id', sa.UUID(), nullable=True),
+        sa.Column('meal_id', sa.UUID(), nullable=True),
+        sa.Column('is_adhoc', sa.Boolean(), server_default='false', nullable=False),
+        sa.Column('completion_status', sa.Text(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint("completion_status IS NULL OR completion_status IN ('followed', 'adjusted', 'skipped', 'replaced', 'social')", name='ck_weekly_plan_slot_status'),
+        sa.ForeignKeyConstraint(['meal_id'], ['meal.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['meal_type_id'], ['meal_type.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['weekly_plan_instance_id'], ['weekly_plan_instance.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint(*(['id', 'date'] if partitioned else ['id']), name='weekly_plan_slot_pkey'),
+        sa.UniqueConstraint('weekly_plan_instance_id', 'date', 'position', name='uq_weekly_plan_slot_position'),
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_weekly_plan_instance_day_date', 'weekly_plan_instance_day', ['date'], unique=False)
+    op.create_index(
+        'ix_weekly_plan_slot_date_covering',
+        'weekly_plan_slot',
+        ['date'],
+        unique=False,
+        postgresql_include=['completion_status', 'meal_type_id', 'meal_id'],
+    )
+    op.create_index(
+        'ix_weekly_plan_slot_unmarked',
+        'weekly_plan_slot',
+        ['weekly_plan_instance_id', 'date', 'position'],
+        unique=False,
+        postgresql_where=sa.text('completion_status IS NULL'),
+    )
+
+
+def _set_aside(table: str) -> None:
+    op.execute(f"CREATE TABLE {table}_staging AS TABLE {table}")
+    op.drop_table(table)
+
+
+def _refill(table: str, columns: list[str]) -> None:
+    column_list = ', '.join(columns)
+    op.execute(f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {table}_staging")
+    op.drop_table(f"{table}_staging")
+
+
+def upgrade() -> None:
+    _set_aside('weekly_plan_slot')
+    _set_aside('weekly_plan_instance_day')
+
+    op.create_table(
+        'weekly_plan_instance_day', *_day_table_args(partitioned=True),
+        postgresql_partition_by='RANGE (date)',
+    )
+    op.create_table(
+        'weekly_plan_slot', *_slot_table_args(partitioned=True),
+        postgresql_partition_by='RANGE (date)',
+    )
+    _create_indexes()
+
+    oldest, newest = op.get_bind().execute(sa.text(
+        "SELECT min(extract(year FROM date))::int, max(extract(year FROM date))::int "
+        "FROM (SELECT date FROM weekly_plan_instance_day_staging "
+        "UNION ALL SELECT date FROM weekly_plan_slot_staging) AS history"
+    )).one()
+    years = range(oldest, newest + 1) if oldest is not None else ()
+    for table in ('weekly_plan_instance_day', 'weekly_plan_slot'):
+        for year in years:
+            op.execute(
+                f"CREATE TABLE {table}_{year} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    _refill('weekly_plan_instance_day', DAY_COLUMNS)
+    _refill('weekly_plan_slot', SLOT_COLUMNS)
+
+
+def downgrade() -> None:
+    # Dropping the partitioned tables drops their partitions
+    _set_aside('weekly_plan_slot')
+    _set_aside('weekly_plan_instance_day')
+
+    op.create_table('weekly_plan_instance_day', *_day_table_args(partitioned=False))
+    op.create_table('weekly_plan_slot', *_slot_table_args(partitioned=False))
+    _create_indexes()
+
+    _refill('weekly_plan_instance_day', DAY_COLUMNS)
+    _refill('weekly_plan_slot', SLOT_COLUMNS)
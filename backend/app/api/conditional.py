@@ -0,0 +1,49 @@
+"""
+Conditional GET support (ETag / If-None-Match) for polled read endpoints.
+
+ETags are derived from data-version cache keys (services/data_version.py),
+so checking freshness costs one version lookup. When the client's
+If-None-Match matches, the endpoint answers 304 without loading or
+serializing the response body.
+
+Responses carry Cache-Control: no-cache, so browsers keep the body but
+revalidate on every request. fetch() then sends If-None-Match by itself and
+turns a 304 back into the cached 200 for the caller.
+"""
+import hashlib
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(version_key: str) -> str:
+    """Strong ETag for a data-version key."""
+    digest = hashlib.sha256(version_key.encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header matches the ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison: ignore any W/ prefix
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current validators."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_validators(response: Response, etag: str) -> None:
+    """Attach the ETag and revalidation policy to a full response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
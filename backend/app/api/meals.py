@@ -4,18 +4,24 @@ API routes for meal endpoints.
 Provides CRUD operations and CSV import for meals.
 Per Tech Spec section 4.5 (CRUD) and frozen spec MEAL_IMPORT_GUIDE.md (import).
 """
+import asyncio
+import io
+import itertools
 import logging
+from collections.abc import Iterable
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, UploadFile, File, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_db
+from ..metrics import MEAL_IMPORT_ROWS
 from ..schemas.meal import (
     MealCreate,
     MealImportResult,
     MealListItem,
     MealResponse,
+    MealSearchResponse,
     MealUpdate,
 )
 from ..schemas.common import PaginatedResponse
@@ -25,7 +31,10 @@ from ..services.meals import (
     get_meal_by_id,
     import_meals_from_csv,
     list_meals,
+    search_meals,
     update_meal,
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_MAX_LIMIT,
 )
 
 logger = logging.getLogger(__name__)
@@ -33,6 +42,23 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/meals", tags=["Meals"])
 
 
+def build_list_item(meal) -> MealListItem:
+    """Build a list item from a Meal with meal_types loaded."""
+    return MealListItem(
+        id=meal.id,
+        name=meal.name,
+        portion_description=meal.portion_description,
+        calories_kcal=meal.calories_kcal,
+        protein_g=meal.protein_g,
+        carbs_g=meal.carbs_g,
+        sugar_g=meal.sugar_g,
+        fat_g=meal.fat_g,
+        saturated_fat_g=meal.saturated_fat_g,
+        fiber_g=meal.fiber_g,
+        meal_types=[{"id": mt.id, "name": mt.name} for mt in meal.meal_types],
+    )
+
+
 @router.get("", response_model=PaginatedResponse[MealListItem])
 async def get_meals(
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
@@ -46,25 +72,44 @@ async def get_meals(
         db, page=page, page_size=page_size, search=search, meal_type_id=meal_type_id
     )
 
-    items = [
-        MealListItem(
-            id=m.id,
-            name=m.name,
-            portion_description=m.portion_description,
-            calories_kcal=m.calories_kcal,
-            protein_g=m.protein_g,
-            carbs_g=m.carbs_g,
-            sugar_g=m.sugar_g,
-            fat_g=m.fat_g,
-            saturated_fat_g=m.saturated_fat_g,
-            fiber_g=m.fiber_g,
-            meal_types=[{"id": mt.id, "name": mt.name} for mt in m.meal_types],
+    return PaginatedResponse.create(
+        items=[build_list_item(m) for m in meals], total=total, page=page, page_size=page_size
+    )
+
+
+@router.get("/search", response_model=MealSearchResponse)
+async def search_meals_endpoint(
+    q: str | None = Query(default=None, description="Search text"),
+    meal_type_id: UUID | None = Query(default=None, description="Filter by meal type ID"),
+    limit: int = Query(default=SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT, description="Items per page"),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
+    ranked: bool = Query(default=False, description="Rank full-text matches on name, portion and notes"),
+    include_total: bool = Query(default=False, description="Also count all matches"),
+    db: AsyncSession = Depends(get_db),
+) -> MealSearchResponse:
+    """
+    Search meals for the meal picker, paginated by cursor.
+
+    Matches meal names containing q; with ranked=true, also full-text matches
+    on portion description and notes, best matches first.
+    """
+    try:
+        meals, next_cursor, total = await search_meals(
+            db,
+            query=q,
+            meal_type_id=meal_type_id,
+            limit=limit,
+            cursor=cursor,
+            ranked=ranked,
+            include_total=include_total,
         )
-        for m in meals
-    ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return PaginatedResponse.create(
-        items=items, total=total, page=page, page_size=page_size
+    return MealSearchResponse(
+        items=[build_list_item(m) for m in meals],
+        next_cursor=next_cursor,
+        total=total,
     )
 
 
@@ -157,6 +202,16 @@ async def delete_meal_endpoint(
     await delete_meal(db, meal)
 
 
+def _read_leading_lines(lines: Iterable[str]) -> list[str]:
+    """Lines up to and including the first non-blank one (blocking)."""
+    leading = []
+    for line in lines:
+        leading.append(line)
+        if line.strip():
+            break
+    return leading
+
+
 @router.post("/import", response_model=MealImportResult)
 async def import_meals(
     file: UploadFile = File(..., description="CSV file to import"),
@@ -170,6 +225,11 @@ async def import_meals(
     - Optional columns: calories_kcal, protein_g, carbs_g, fat_g, meal_types, notes
     - Rows with errors are skipped, others are imported
     - Unknown meal types generate warnings but don't block meal creation
+
+    The file is parsed as a stream and written in batches, so large
+    libraries are never held in memory as a whole. The upload may be
+    spooled to disk, so it is read and parsed in worker threads; only the
+    batch writes run on the event loop.
     """
     # Validate file type
     if file.content_type and file.content_type not in (
@@ -183,21 +243,27 @@ async def import_meals(
             detail=f"Invalid file type: {file.content_type}. Expected CSV file.",
         )
 
-    # Read file content
+    # Stream the upload instead of reading it into memory
+    csv_lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")  # Handle BOM from Excel
     try:
-        raw_bytes = await file.read()
-        csv_content = raw_bytes.decode("utf-8-sig")  # Handle BOM from Excel
+        # Find the first non-blank line to reject empty files up front
+        leading = await asyncio.to_thread(_read_leading_lines, csv_lines)
+        if not leading or not leading[-1].strip():
+            raise HTTPException(
+                status_code=400,
+                detail="CSV file is empty.",
+            )
+
+        result = await import_meals_from_csv(db, itertools.chain(leading, csv_lines))
     except UnicodeDecodeError:
         raise HTTPException(
             status_code=400,
             detail="File encoding error. Please save the file as UTF-8.",
         )
+    finally:
+        # Leave closing the underlying file to the UploadFile
+        csv_lines.detach()
 
-    if not csv_content.strip():
-        raise HTTPException(
-            status_code=400,
-            detail="CSV file is empty.",
-        )
-
-    result = await import_meals_from_csv(db, csv_content)
+    MEAL_IMPORT_ROWS.labels("created").inc(result.summary.created)
+    MEAL_IMPORT_ROWS.labels("skipped").inc(result.summary.skipped)
     return result
@@ -0,0 +1,93 @@
+"""
+Responses for internally built payloads.
+
+FastAPI validates whatever a route returns against its response_model and
+encodes the result with the standard json module; a returned Pydantic model
+is dumped and validated a second time. For the large payloads the
+application builds itself (app/schemas/payloads.py) that is pure overhead,
+so payload_response returns them as finished responses instead:
+
+- By default the payload is validated into its response model once (see
+  validated_payload, which lets the response cache keep validated models)
+  and encoded by Pydantic, as ModelJSONResponse.
+- When settings.fast_json_responses is enabled, FastJSONResponse encodes
+  the dataclasses directly with orjson, without validation.
+
+benchmarks/bench_serialization.py compares both paths with FastAPI's own
+processing.
+
+Both paths produce the same JSON as FastAPI would: UUIDs, dates and
+datetimes in ISO 8601 (UTC as "Z", as Pydantic writes it) and Decimals as
+strings.
+"""
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from ..config import settings
+from ..schemas.base import BaseSchema
+
+
+def _encode_default(value: Any) -> Any:
+    """Types orjson does not encode natively."""
+    # asyncpg returns its own UUID subclass, which orjson does not accept
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson, without response_model validation."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_encode_default, option=orjson.OPT_UTC_Z)
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response encoded by Pydantic from an already validated model."""
+
+    def render(self, content: BaseSchema) -> bytes:
+        return content.model_dump_json(by_alias=True).encode()
+
+
+def validated_payload(payload: Any, response_model: type[BaseSchema]) -> Any:
+    """
+    Prepare a payload for the response cache.
+
+    On the default path the payload is validated into its response model
+    here, once, so cache hits are served without validating again. With
+    fast JSON enabled it is kept as built.
+    """
+    if settings.fast_json_responses:
+        return payload
+    return response_model.model_validate(payload, from_attributes=True)
+
+
+def payload_response(
+    payload: Any, response: Response, response_model: type[BaseSchema]
+) -> JSONResponse:
+    """
+    Return a payload from a route, bypassing FastAPI's response processing.
+
+    Args:
+        payload: Dataclass payload matching the route's response_model, or
+            that response model already (see validated_payload)
+        response: The route's Response parameter, whose headers (e.g. ETag)
+            are carried over; FastAPI ignores them once a route returns its
+            own Response
+        response_model: The route's response_model
+
+    Returns:
+        A ModelJSONResponse, validating the payload first unless it already
+        is a model, or a FastJSONResponse if fast JSON is enabled
+    """
+    if isinstance(payload, BaseSchema):
+        return ModelJSONResponse(payload, headers=response.headers)
+    if settings.fast_json_responses:
+        return FastJSONResponse(payload, headers=response.headers)
+    model = response_model.model_validate(payload, from_attributes=True)
+    return ModelJSONResponse(model, headers=response.headers)
@@ -5,18 +5,25 @@ API routes for adherence statistics.
 
 See Tech Spec section 4.3 for full specification.
 """
-from fastapi import APIRouter, Depends, Query
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_db
 from ..schemas.stats import StatsResponse
+from ..services.data_version import stats_cache_key
 from ..services.stats import get_stats
+from .conditional import etag_matches, make_etag, not_modified, set_validators
+from .responses import payload_response
 
 router = APIRouter(prefix="/api/v1", tags=["Stats"])
 
 
 @router.get("/stats", response_model=StatsResponse)
 async def stats(
+    request: Request,
+    response: Response,
     days: int = Query(default=30, ge=1, le=365, description="Number of days to analyze"),
     db: AsyncSession = Depends(get_db),
 ) -> StatsResponse:
@@ -28,5 +35,13 @@ async def stats(
 
     Query parameters:
     - days: Number of days to look back (1-365, default 30)
+
+    Supports conditional requests: responses carry an ETag, and a matching
+    If-None-Match returns 304 Not Modified.
     """
-    return await get_stats(db, days)
+    etag = make_etag(await stats_cache_key(db, date.today(), days))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_validators(response, etag)
+    return payload_response(await get_stats(db, days), response, StatsResponse)
@@ -7,6 +7,7 @@ These are the primary endpoints for the Today View:
 - POST /today/slots - Add an ad-hoc meal to today
 - POST /slots/{slot_id}/complete - Mark slot complete with status
 - DELETE /slots/{slot_id}/complete - Undo completion
+- POST /slots/completions - Apply queued completion changes in one batch
 - DELETE /slots/{slot_id} - Remove an ad-hoc slot
 
 See Tech Spec section 4.3 for full specification.
@@ -14,29 +15,64 @@ See Tech Spec section 4.3 for full specification.
 from datetime import date, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import response_cache
 from ..database import get_db
 from ..schemas.common import ErrorCode
 from ..schemas.meal import MealCompact
 from ..schemas.meal_type import MealTypeCompact
 from ..schemas.today import TodayResponse
-from ..schemas.weekly_plan import AddAdhocSlotRequest, CompleteSlotRequest, CompleteSlotResponse, WeeklyPlanSlotWithNext
+from ..schemas.weekly_plan import (
+    AddAdhocSlotRequest,
+    BatchCompleteRequest,
+    BatchCompleteResponse,
+    CompleteSlotRequest,
+    CompleteSlotResponse,
+    WeeklyPlanSlotWithNext,
+)
+from ..services.data_version import today_cache_key
 from ..services.today import (
     get_today_response,
     complete_slot,
     uncomplete_slot,
+    apply_slot_completions,
     get_slot_by_id,
     create_adhoc_slot,
     delete_adhoc_slot,
 )
+from .conditional import etag_matches, make_etag, not_modified, set_validators
 
 router = APIRouter(prefix="/api/v1", tags=["Daily Use"])
 
 
+async def _conditional_today_response(
+    request: Request, response: Response, db: AsyncSession, target_date: date
+) -> TodayResponse | Response:
+    """
+    Serve the TodayResponse for a date, honouring If-None-Match.
+
+    Answers 304 when the client's ETag is current; otherwise serves the
+    response from the response cache, keyed by data versions.
+    """
+    key = await today_cache_key(db, target_date)
+    etag = make_etag(key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_validators(response, etag)
+    return await response_cache.get_or_build(
+        key, lambda: get_today_response(db, target_date)
+    )
+
+
 @router.get("/today", response_model=TodayResponse)
-async def get_today(db: AsyncSession = Depends(get_db)) -> TodayResponse:
+async def get_today(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+) -> TodayResponse:
     """
     Get today's meal plan with completion status.
 
@@ -47,13 +83,20 @@ async def get_today(db: AsyncSession = Depends(get_db)) -> TodayResponse:
     - Stats (completed count, total, streak)
 
     If no plan exists for today, returns an empty slots list with stats.
+
+    Supports conditional requests: responses carry an ETag, and a matching
+    If-None-Match returns 304 Not Modified.
     """
     today = date.today()
-    return await get_today_response(db, today)
+    return await _conditional_today_response(request, response, db, today)
 
 
 @router.get("/yesterday", response_model=TodayResponse)
-async def get_yesterday(db: AsyncSession = Depends(get_db)) -> TodayResponse:
+async def get_yesterday(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+) -> TodayResponse:
     """
     Get yesterday's meal plan for review/catch-up.
 
@@ -61,7 +104,7 @@ async def get_yesterday(db: AsyncSession = Depends(get_db)) -> TodayResponse:
     Useful for the Yesterday Review modal to catch up on unmarked meals.
     """
     yesterday = date.today() - timedelta(days=1)
-    return await get_today_response(db, yesterday)
+    return await _conditional_today_response(request, response, db, yesterday)
 
 
 @router.post(
@@ -205,6 +248,31 @@ async def uncomplete_meal_slot(
     )
 
 
+@router.post(
+    "/slots/completions",
+    response_model=BatchCompleteResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def batch_complete_slots(
+    request: BatchCompleteRequest,
+    db: AsyncSession = Depends(get_db),
+) -> BatchCompleteResponse:
+    """
+    Apply many completion changes in one transaction.
+
+    Used by the offline queue to sync actions taken while offline. Each
+    operation sets a status (or null to undo completion) with the client
+    timestamp of the action; the latest operation per slot wins.
+
+    Returns one result per operation, in request order: applied,
+    superseded (a later operation on the same slot won, or the slot was
+    completed after the operation's timestamp) or not_found. Unknown slots
+    don't fail the batch.
+    """
+    results = await apply_slot_completions(db, request.operations)
+    return BatchCompleteResponse(results=results)
+
+
 @router.delete(
     "/slots/{slot_id}",
     status_code=status.HTTP_204_NO_CONTENT,
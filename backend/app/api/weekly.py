@@ -4,6 +4,8 @@ API routes for weekly planning endpoints.
 These are the endpoints for week generation and management:
 - GET /weekly-plans/current - Current week's plan
 - POST /weekly-plans/generate - Generate a new week
+- POST /weekly-plans/generate-range - Generate several consecutive weeks
+- GET /weekly-plans/scheduler - Background week pre-generation status
 - PUT /weekly-plans/current/days/{date}/template - Switch day template
 - PUT /weekly-plans/current/days/{date}/override - Mark day as "no plan"
 - DELETE /weekly-plans/current/days/{date}/override - Remove override
@@ -13,47 +15,63 @@ See Tech Spec section 4.4 for full specification.
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import response_cache
+from ..config import settings
 from ..database import get_db
+from ..metrics import WEEKS_GENERATED
+from ..scheduler import week_scheduler
 from ..schemas.common import ErrorCode, WEEKDAY_NAMES
+from ..schemas.payloads import (
+    CompletionSummaryPayload,
+    MealPayload,
+    RefPayload,
+    WeeklyPlanInstanceDayPayload,
+    WeeklyPlanInstancePayload,
+    WeeklyPlanSlotPayload,
+)
 from ..schemas.weekly_plan import (
     WeeklyPlanInstanceResponse,
     WeeklyPlanInstanceDayResponse,
     WeeklyPlanGenerateRequest,
+    WeeklyPlanRangeGenerateRequest,
+    GeneratedWeekSummary,
+    WeeklyPlanRangeResponse,
+    SchedulerStatusResponse,
     SwitchTemplateRequest,
     SetOverrideRequest,
     OverrideResponse,
-    WeeklyPlanSlotResponse,
-    CompletionSummary,
 )
-from ..schemas.day_template import DayTemplateCompact
 from ..schemas.week_plan import WeekPlanCompact
-from ..schemas.meal import MealCompact
-from ..schemas.meal_type import MealTypeCompact
+from ..services.data_version import week_cache_key
 from ..services.weekly import (
     generate_weekly_plan,
+    generate_weekly_plans,
+    get_missing_weeks,
     regenerate_weekly_plan,
     get_current_week_instance,
     get_week_instance,
-    get_full_weekly_instance,
     get_instance_day,
     get_slots_for_instance_day,
+    get_week_view,
     switch_day_template,
     set_day_override,
     clear_day_override,
     is_date_in_week,
 )
+from .conditional import etag_matches, make_etag, not_modified, set_validators
+from .responses import payload_response, validated_payload
 
 router = APIRouter(prefix="/api/v1/weekly-plans", tags=["Weekly Planning"])
 
 
-def build_slot_response(slot) -> WeeklyPlanSlotResponse:
+def build_slot_response(slot) -> WeeklyPlanSlotPayload:
     """Build a slot response from ORM object."""
     meal_compact = None
     if slot.meal:
-        meal_compact = MealCompact(
+        meal_compact = MealPayload(
             id=slot.meal.id,
             name=slot.meal.name,
             portion_description=slot.meal.portion_description,
@@ -68,12 +86,12 @@ def build_slot_response(slot) -> WeeklyPlanSlotResponse:
 
     meal_type_compact = None
     if slot.meal_type:
-        meal_type_compact = MealTypeCompact(
+        meal_type_compact = RefPayload(
             id=slot.meal_type.id,
             name=slot.meal_type.name,
         )
 
-    return WeeklyPlanSlotResponse(
+    return WeeklyPlanSlotPayload(
         id=slot.id,
         position=slot.position,
         meal_type=meal_type_compact,
@@ -85,28 +103,29 @@ def build_slot_response(slot) -> WeeklyPlanSlotResponse:
 
 
 async def build_day_response(
-    db: AsyncSession, instance_id: UUID, instance_day
-) -> WeeklyPlanInstanceDayResponse:
-    """Build a day response with slots."""
-    slots = await get_slots_for_instance_day(db, instance_id, instance_day.date)
+    db: AsyncSession, instance_id: UUID, instance_day, slots=None
+) -> WeeklyPlanInstanceDayPayload:
+    """Build a day response with slots (loaded unless already provided)."""
+    if slots is None:
+        slots = await get_slots_for_instance_day(db, instance_id, instance_day.date)
 
     template_compact = None
     if instance_day.day_template:
-        template_compact = DayTemplateCompact(
+        template_compact = RefPayload(
             id=instance_day.day_template.id,
             name=instance_day.day_template.name,
         )
 
     completed_count = sum(1 for s in slots if s.completion_status is not None)
 
-    return WeeklyPlanInstanceDayResponse(
+    return WeeklyPlanInstanceDayPayload(
         date=instance_day.date,
         weekday=WEEKDAY_NAMES.get(instance_day.date.weekday(), "Unknown"),
         template=template_compact,
         is_override=instance_day.is_override,
         override_reason=instance_day.override_reason,
         slots=[build_slot_response(s) for s in slots],
-        completion_summary=CompletionSummary(
+        completion_summary=CompletionSummaryPayload(
             completed=completed_count,
             total=len(slots),
         ),
@@ -115,14 +134,14 @@ async def build_day_response(
 
 async def build_instance_response(
     db: AsyncSession, instance
-) -> WeeklyPlanInstanceResponse:
+) -> WeeklyPlanInstancePayload:
     """Build a full instance response with all days and slots."""
-    # Get full instance with relations
-    full_instance = await get_full_weekly_instance(db, instance.id)
+    # Load the instance, days, templates and all slots in two queries
+    full_instance, slots_by_date = await get_week_view(db, instance.id)
 
     week_plan_compact = None
     if full_instance.week_plan:
-        week_plan_compact = WeekPlanCompact(
+        week_plan_compact = RefPayload(
             id=full_instance.week_plan.id,
             name=full_instance.week_plan.name,
         )
@@ -130,10 +149,12 @@ async def build_instance_response(
     # Build day responses
     days = []
     for instance_day in sorted(full_instance.days, key=lambda d: d.date):
-        day_response = await build_day_response(db, instance.id, instance_day)
+        day_response = await build_day_response(
+            db, instance.id, instance_day, slots_by_date[instance_day.date]
+        )
         days.append(day_response)
 
-    return WeeklyPlanInstanceResponse(
+    return WeeklyPlanInstancePayload(
         id=full_instance.id,
         week_start_date=full_instance.week_start_date,
         week_plan=week_plan_compact,
@@ -143,6 +164,8 @@ async def build_instance_response(
 
 @router.get("/current", response_model=WeeklyPlanInstanceResponse)
 async def get_current_week(
+    request: Request,
+    response: Response,
     week_start_date: date | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> WeeklyPlanInstanceResponse:
@@ -159,6 +182,9 @@ async def get_current_week(
     - week_start_date (optional): Monday of the target week. Defaults to current week.
 
     If no plan exists for the specified week, returns 404.
+
+    Supports conditional requests: responses carry an ETag, and a matching
+    If-None-Match returns 304 Not Modified.
     """
     instance = await get_week_instance(db, week_start_date)
 
@@ -174,7 +200,18 @@ async def get_current_week(
             },
         )
 
-    return await build_instance_response(db, instance)
+    key = await week_cache_key(db, instance.id, instance.week_start_date)
+    etag = make_etag(key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_validators(response, etag)
+    async def build():
+        payload = await build_instance_response(db, instance)
+        return validated_payload(payload, WeeklyPlanInstanceResponse)
+
+    payload = await response_cache.get_or_build(key, build)
+    return payload_response(payload, response, WeeklyPlanInstanceResponse)
 
 
 @router.post(
@@ -206,6 +243,7 @@ async def generate_week(
 
     Request body:
     - week_start_date (optional): Monday of the target week. Defaults to next Monday.
+    - regenerate_from (optional): Only regenerate slots on or after this date.
 
     Returns the generated/regenerated weekly plan with all days and slots.
 
@@ -218,6 +256,7 @@ async def generate_week(
             week_start_date=request.week_start_date,
         )
         response.status_code = status.HTTP_201_CREATED
+        WEEKS_GENERATED.labels("created").inc()
         return await build_instance_response(db, instance)
 
     except ValueError as e:
@@ -229,9 +268,11 @@ async def generate_week(
                 instance = await regenerate_weekly_plan(
                     db,
                     week_start_date=request.week_start_date,
+                    from_date=request.regenerate_from,
                 )
                 # Return 200 OK for regeneration (not 201 Created)
                 response.status_code = status.HTTP_200_OK
+                WEEKS_GENERATED.labels("regenerated").inc()
                 return await build_instance_response(db, instance)
             except ValueError as regen_error:
                 raise HTTPException(
@@ -255,6 +296,103 @@ async def generate_week(
             )
 
 
+@router.post(
+    "/generate-range",
+    response_model=WeeklyPlanRangeResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def generate_week_range(
+    request: WeeklyPlanRangeGenerateRequest,
+    db: AsyncSession = Depends(get_db),
+) -> WeeklyPlanRangeResponse:
+    """
+    Generate several consecutive weeks in one transaction.
+
+    Uses the default week plan and assigns meals via round-robin exactly as
+    the same number of POST /generate calls would, but loads the plan,
+    templates and rotations once. Returns a per-week summary instead of the
+    full nested plans; fetch a week with GET /current?week_start_date=...
+
+    Request body:
+    - week_start_date (optional): Monday of the first week. Defaults to next Monday.
+    - weeks: Number of weeks (1-52)
+
+    Errors:
+    - 400 Bad Request: No default week plan, or invalid date
+    - 409 Conflict: One of the weeks already exists (nothing is generated)
+    """
+    try:
+        weeks = await generate_weekly_plans(
+            db,
+            week_start_date=request.week_start_date,
+            week_count=request.weeks,
+        )
+    except ValueError as e:
+        error_message = str(e)
+        conflict = "already exists" in error_message
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT if conflict else status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "code": ErrorCode.CONFLICT if conflict else ErrorCode.VALIDATION_ERROR,
+                    "message": error_message,
+                }
+            },
+        )
+
+    WEEKS_GENERATED.labels("created").inc(len(weeks))
+    week_plan = weeks[0].week_plan
+    return WeeklyPlanRangeResponse(
+        week_plan=WeekPlanCompact(id=week_plan.id, name=week_plan.name),
+        weeks=[
+            GeneratedWeekSummary(
+                id=week.instance.id,
+                week_start_date=week.instance.week_start_date,
+                days=week.days,
+                slots=week.slots,
+                unassigned_slots=week.unassigned_slots,
+            )
+            for week in weeks
+        ],
+        total_slots=sum(week.slots for week in weeks),
+    )
+
+
+@router.get("/scheduler", response_model=SchedulerStatusResponse)
+async def get_scheduler_status(
+    db: AsyncSession = Depends(get_db),
+) -> SchedulerStatusResponse:
+    """
+    Get the status of background week pre-generation.
+
+    Run statistics are those of the worker answering the request; only the
+    worker that wins the advisory lock generates in a given run, so the
+    others count skipped runs. missing_weeks is read from the database and
+    is the same on every worker.
+    """
+    stats = week_scheduler.stats
+    return SchedulerStatusResponse(
+        enabled=settings.pregeneration_enabled,
+        running=week_scheduler.running,
+        weeks_ahead=week_scheduler.weeks_ahead,
+        interval_seconds=week_scheduler.interval_seconds,
+        runs=stats.runs,
+        skipped_runs=stats.skipped_runs,
+        failed_runs=stats.failed_runs,
+        weeks_generated=stats.weeks_generated,
+        archive_retention_days=week_scheduler.archive_retention_days,
+        archive_runs=stats.archive_runs,
+        failed_archive_runs=stats.failed_archive_runs,
+        weeks_archived=stats.weeks_archived,
+        last_archive_error=stats.last_archive_error,
+        last_run_at=stats.last_run_at,
+        last_duration_ms=stats.last_duration_ms,
+        last_generated=stats.last_generated,
+        last_error=stats.last_error,
+        missing_weeks=await get_missing_weeks(db, week_scheduler.weeks_ahead),
+    )
+
+
 @router.put(
     "/current/days/{target_date}/template",
     response_model=WeeklyPlanInstanceDayResponse,
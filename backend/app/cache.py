@@ -0,0 +1,176 @@
+"""
+In-process response cache for read-heavy views.
+
+The Today and week views are read far more often than they change. Their
+responses are cached under keys built from data versions (see
+services/data_version.py): any write bumps the versions of the data it
+touched, so later reads compute a new key and stale entries simply age out.
+Nothing has to be purged explicitly, and per-process caches stay correct
+when several workers run side by side.
+
+LRUCacheBackend, which keeps entries in process memory with a size bound
+and a TTL, is the only backend shipped and supported: every worker holds
+its own entries and warms up on its own, so the hit rate drops as workers
+are added. Cached values are live Pydantic response models or dataclass
+payloads returned as they are, so a shared backend (e.g. Redis) would also
+have to serialize them on every hit; there is none (ADR-012).
+
+VersionedCache is the simpler in-process cache behind the round-robin
+rotations and plan definition snapshots.
+"""
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Protocol, TypeVar
+
+from app.config import settings
+
+T = TypeVar("T")
+
+
+class CacheBackend(Protocol):
+    """Storage used by ResponseCache."""
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None on a miss."""
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value."""
+
+    def clear(self) -> None:
+        """Drop all entries."""
+
+
+class LRUCacheBackend:
+    """
+    Bounded in-memory LRU storage with a per-entry time-to-live.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted
+        ttl_seconds: Age after which an entry is treated as a miss
+        clock: Monotonic time source (overridable for tests)
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """Counts hits and misses in front of a CacheBackend."""
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_build(self, key: str, build: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for key, building and storing it on a miss."""
+        if not self.enabled:
+            return await build()
+
+        value = self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = await build()
+        self.backend.set(key, value)
+        return value
+
+    def use_backend(self, backend: CacheBackend) -> None:
+        """Swap the storage backend (e.g. for one with other bounds)."""
+        self.backend = backend
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+class VersionedCache:
+    """
+    Per-process cache of values that are all valid for one data version.
+
+    For small, rarely changing structures read on hot paths (round-robin
+    rotations, plan definitions). The caller reads the current version of
+    the data's scope (one indexed query, see services/data_version.py);
+    entries stored under an older version are dropped on the first store
+    under a newer one, so every worker process picks up changes made by any
+    other on its next lookup.
+    """
+
+    def __init__(self):
+        self._version: int | None = None
+        self._entries: dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable, version: int) -> Any | None:
+        """Return the value stored under key for this version, or None."""
+        if version != self._version:
+            return None
+        return self._entries.get(key)
+
+    def put(self, key: Hashable, version: int, value: Any) -> None:
+        """Store a value for this version."""
+        if version != self._version:
+            self._version = version
+            self._entries = {}
+        self._entries[key] = value
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._version = None
+        self._entries = {}
+
+
+# Global response cache for Today and week views
+response_cache = ResponseCache(
+    LRUCacheBackend(
+        max_entries=settings.response_cache_max_entries,
+        ttl_seconds=settings.response_cache_ttl_seconds,
+    ),
+    enabled=settings.response_cache_enabled,
+)
@@ -32,6 +32,34 @@ class Settings(BaseSettings):
     # Server configuration
     debug: bool = False
 
+    # Response cache for the Today and week views (see app/cache.py)
+    response_cache_enabled: bool = True
+    response_cache_max_entries: int = 256
+    response_cache_ttl_seconds: float = 300.0
+
+    # Encode the week view and stats with orjson, skipping response_model
+    # validation of these internally built payloads (see app/api/responses.py)
+    fast_json_responses: bool = False
+
+    # Per-request SQL instrumentation (see app/instrumentation.py)
+    db_instrumentation_enabled: bool = True
+    db_slow_query_ms: float = 200.0
+
+    # Prometheus metrics at /metrics (see app/metrics.py)
+    metrics_enabled: bool = True
+
+    # Background week pre-generation (see app/scheduler.py)
+    pregeneration_enabled: bool = True
+    pregeneration_weeks_ahead: int = 1
+    pregeneration_interval_seconds: float = 900.0
+
+    # Archival of past weeks, run by the pre-generation scheduler (see
+    # app/services/archive.py); weeks that ended more than this many days
+    # ago are moved to the archive. Destructive (deletes live rows, drops
+    # emptied year partitions), so operators must opt in
+    archive_enabled: bool = False
+    archive_retention_days: int = 365
+
     @field_validator("cors_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
@@ -0,0 +1,145 @@
+"""
+Per-request SQL instrumentation.
+
+Engine events count the statements each request sends to the database and
+time them; the middleware reports the totals on every response:
+
+- X-DB-Queries: number of statements
+- Server-Timing: db (total statement time) and app (whole request) durations,
+  shown in the browser dev tools' network timing
+- One structured log line per request, plus a warning with the statement
+  text when a statement is slower than settings.db_slow_query_ms
+
+The per-request counters live in a ContextVar, so statements are only
+recorded while a request is being served, and concurrent requests never
+see each other's numbers. The cost per statement is two perf_counter calls.
+"""
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while serving one request."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: str | None = None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Stats of the request being served, or None outside a request."""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    start_times = conn.info.get("query_start_times")
+    if stats is None or not start_times:
+        return
+    stats.record(statement, (time.perf_counter() - start_times.pop()) * 1000)
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """
+    Register the statement timing listeners on an engine (idempotent).
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    ASGI middleware reporting per-request statement counts and timings.
+
+    Args:
+        app: Wrapped ASGI application
+        slow_query_ms: Statements slower than this are logged with their SQL
+    """
+
+    def __init__(self, app: ASGIApp, slow_query_ms: float | None = None):
+        self.app = app
+        self.slow_query_ms = (
+            settings.db_slow_query_ms if slow_query_ms is None else slow_query_ms
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                app_ms = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append("X-DB-Queries", str(stats.count))
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", app;dur={app_ms:.1f}',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_stats.reset(token)
+            self._log(scope, status_code, stats, (time.perf_counter() - started) * 1000)
+
+    def _log(self, scope: Scope, status_code: int, stats: QueryStats, duration_ms: float) -> None:
+        logger.info(
+            "request method=%s path=%s status=%d duration_ms=%.1f "
+            "db_queries=%d db_ms=%.1f db_slowest_ms=%.1f",
+            scope["method"],
+            scope["path"],
+            status_code,
+            duration_ms,
+            stats.count,
+            stats.total_ms,
+            stats.slowest_ms,
+        )
+        if stats.slowest_statement is not None and stats.slowest_ms >= self.slow_query_ms:
+            logger.warning(
+                "slow query path=%s db_ms=%.1f statement=%s",
+                scope["path"],
+                stats.slowest_ms,
+                " ".join(stats.slowest_statement.split())[:500],
+            )
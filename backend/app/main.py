@@ -7,11 +7,15 @@ including middleware, lifecycle events, and route registration.
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.cache import response_cache
 from app.config import settings
-from app.database import close_db, init_db
+from app.database import close_db, engine, init_db
+from app.instrumentation import QueryInstrumentationMiddleware, install_query_instrumentation
+from app.metrics import CONTENT_TYPE_LATEST, MetricsMiddleware, install_pool_metrics, render_metrics
+from app.scheduler import week_scheduler
 from app.api import (
     today_router,
     weekly_router,
@@ -29,13 +33,16 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Initialize database connection
-    - Shutdown: Close database connection pool
+    - Startup: Initialize database connection, start week pre-generation
+    - Shutdown: Stop week pre-generation, close database connection pool
     """
     # Startup
     await init_db()
+    if settings.pregeneration_enabled:
+        week_scheduler.start()
     yield
     # Shutdown
+    await week_scheduler.stop()
     await close_db()
 
 
@@ -56,6 +63,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL counts and timings (X-DB-Queries / Server-Timing headers)
+if settings.db_instrumentation_enabled:
+    install_query_instrumentation(engine.sync_engine)
+    app.add_middleware(QueryInstrumentationMiddleware)
+
+# Prometheus request/pool metrics (scraped at /metrics)
+if settings.metrics_enabled:
+    install_pool_metrics(engine.sync_engine)
+    app.add_middleware(MetricsMiddleware)
+
 
 # Register API routers
 app.include_router(today_router)
@@ -84,10 +101,19 @@ async def health():
     Detailed health check endpoint.
 
     Returns:
-        dict: Health status with API version
+        dict: Health status with API version and response cache counters
     """
     return {
         "status": "healthy",
         "version": settings.api_version,
         "service": "mealframe-api",
+        "response_cache": response_cache.stats(),
     }
+
+
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Prometheus metrics (aggregated over all workers in multiprocess mode)."""
+        return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,148 @@
+"""
+Prometheus metrics.
+
+Request latency, in-flight requests, database pool usage and domain
+counters, exposed in the Prometheus text format at /metrics.
+
+Production runs several gunicorn UvicornWorker processes, and a scrape only
+reaches one of them. When PROMETHEUS_MULTIPROC_DIR is set (entrypoint.sh
+does this), every process writes its samples to files in that directory,
+and /metrics aggregates all of them through a MultiProcessCollector.
+gunicorn.conf.py marks exited workers dead so their live gauges drop out.
+Without the variable (development, tests) the default in-process registry
+is used.
+"""
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Route label of requests that matched no route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_DURATION = Histogram(
+    "mealframe_http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route"],
+)
+REQUESTS = Counter(
+    "mealframe_http_requests_total",
+    "HTTP requests by route and status code",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "mealframe_http_requests_in_progress",
+    "HTTP requests being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "mealframe_db_pool_checked_out",
+    "Database connections checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "mealframe_db_pool_overflow",
+    "Database connections checked out beyond the pool size",
+    multiprocess_mode="livesum",
+)
+WEEKS_GENERATED = Counter(
+    "mealframe_weeks_generated_total",
+    "Weekly plans generated",
+    ["mode"],
+)
+MEAL_IMPORT_ROWS = Counter(
+    "mealframe_meal_import_rows_total",
+    "CSV meal import rows by outcome",
+    ["outcome"],
+)
+
+
+def render_metrics() -> bytes:
+    """Current metrics in the Prometheus text format (all workers if multiprocess)."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def install_pool_metrics(engine: Engine) -> None:
+    """
+    Track the engine's connection pool in the pool gauges.
+
+    The gauges are updated on every checkout and checkin, so each worker
+    process reports its own pool (summed across workers when scraped).
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+    """
+    pool = engine.pool
+    if not hasattr(pool, "overflow"):
+        # NullPool / StaticPool keep no checkout accounting
+        return
+
+    def update_pool_gauges(checked_out: int) -> None:
+        DB_POOL_CHECKED_OUT.set(checked_out)
+        DB_POOL_OVERFLOW.set(max(checked_out - pool.size(), 0))
+
+    def on_checkout(*_):
+        update_pool_gauges(pool.checkedout())
+
+    def on_checkin(*_):
+        # Fired before the pool takes the connection back
+        update_pool_gauges(max(pool.checkedout() - 1, 0))
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route request latency and status codes.
+
+    Requests are labelled with the route's path template (e.g.
+    /api/v1/meals/{meal_id}), not the raw path.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # The router stores the matched route in the (shared) scope
+            route = scope.get("route")
+            route_label = getattr(route, "path", UNMATCHED_ROUTE)
+            REQUEST_DURATION.labels(method, route_label).observe(time.perf_counter() - started)
+            REQUESTS.labels(method, route_label, str(status_code)).inc()
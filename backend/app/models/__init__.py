@@ -9,6 +9,9 @@ from .week_plan import WeekPlan, WeekPlanDay
 from .weekly_plan import WeeklyPlanInstance, WeeklyPlanInstanceDay, WeeklyPlanSlot
 from .round_robin import RoundRobinState
 from .app_config import AppConfig
+from .daily_rollup import DailyCompletionRollup
+from .data_version import DataVersion
+from .archive import WeeklyPlanArchiveDay
 
 __all__ = [
     "MealType",
@@ -23,4 +26,7 @@ __all__ = [
     "WeeklyPlanSlot",
     "RoundRobinState",
     "AppConfig",
+    "DailyCompletionRollup",
+    "DataVersion",
+    "WeeklyPlanArchiveDay",
 ]
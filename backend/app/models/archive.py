@@ -0,0 +1,37 @@
+"""WeeklyPlanArchiveDay model - compacted history of archived weeks."""
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, Date, DateTime, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from ..database import Base
+
+
+class WeeklyPlanArchiveDay(Base):
+    """
+    One day of an archived week, with its slots packed into a JSONB array.
+
+    Weeks past the retention window are moved here from weekly_plan_instance,
+    weekly_plan_instance_day and weekly_plan_slot (see app/services/archive.py).
+    Week-level columns repeat on each of the week's days. The IDs of the
+    original rows are kept, so archived weeks are served with the same IDs.
+    Referenced meals, meal types, templates and plans are plain IDs without
+    foreign keys; deleted ones read back as missing.
+
+    Each element of slots holds id, position, meal_type_id, meal_id,
+    is_adhoc, completion_status and completed_at, in position order.
+    """
+    __tablename__ = "weekly_plan_archive_day"
+
+    date = Column(Date, primary_key=True)
+    weekly_plan_instance_id = Column(UUID(as_uuid=True), nullable=False)
+    week_start_date = Column(Date, nullable=False, index=True)
+    week_plan_id = Column(UUID(as_uuid=True))
+    day_template_id = Column(UUID(as_uuid=True))
+    is_override = Column(Boolean, default=False, nullable=False)
+    override_reason = Column(Text)
+    slots = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
+    archived_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<WeeklyPlanArchiveDay(date={self.date}, week_start={self.week_start_date})>"
@@ -0,0 +1,43 @@
+"""DailyCompletionRollup model - materialized per-day completion counts."""
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, Date, DateTime, Integer, Numeric
+
+from ..database import Base
+
+
+class DailyCompletionRollup(Base):
+    """
+    Materialized per-day completion summary.
+
+    One row per date that has a plan day or slots. Counts mirror the
+    completion statuses of that day's weekly_plan_slot rows, and the macro
+    columns are the sums over the assigned meals (NULL when no meal on the
+    day has that value). Maintained by the services that mutate slots and
+    days, so stats and streaks can read one row per day instead of
+    scanning slots.
+
+    Rebuild with: python -m app.rebuild_rollup
+    """
+    __tablename__ = "daily_completion_rollup"
+
+    date = Column(Date, primary_key=True)
+    total = Column(Integer, default=0, nullable=False)
+    unmarked = Column(Integer, default=0, nullable=False)
+    followed = Column(Integer, default=0, nullable=False)
+    adjusted = Column(Integer, default=0, nullable=False)
+    skipped = Column(Integer, default=0, nullable=False)
+    replaced = Column(Integer, default=0, nullable=False)
+    social = Column(Integer, default=0, nullable=False)
+    is_override = Column(Boolean, default=False, nullable=False)
+    calories = Column(Integer)
+    protein = Column(Numeric(8, 1))
+    carbs = Column(Numeric(8, 1))
+    sugar = Column(Numeric(8, 1))
+    fat = Column(Numeric(8, 1))
+    saturated_fat = Column(Numeric(8, 1))
+    fiber = Column(Numeric(8, 1))
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<DailyCompletionRollup(date={self.date}, total={self.total}, unmarked={self.unmarked})>"
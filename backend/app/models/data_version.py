@@ -0,0 +1,26 @@
+"""DataVersion model - change counters for cached read models."""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, String
+
+from ..database import Base
+
+
+class DataVersion(Base):
+    """
+    Monotonic change counter per data scope.
+
+    Scopes are "day:YYYY-MM-DD" (slots and plan day of one date), "history"
+    (any day changed; streaks depend on it) and "catalog" (meals, meal types,
+    templates and week plans). Services bump the scopes they touch in the same
+    transaction as the change, so versions read from here identify the
+    committed state of the data a cached response was built from.
+    """
+    __tablename__ = "data_version"
+
+    scope = Column(String(32), primary_key=True)
+    version = Column(BigInteger, default=1, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<DataVersion(scope={self.scope!r}, version={self.version})>"
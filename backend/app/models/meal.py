@@ -2,7 +2,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Integer, Numeric, Text
+from sqlalchemy import Column, DateTime, Index, Integer, Numeric, Text, func, literal_column, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -17,9 +17,15 @@ class Meal(Base):
     include nutritional information. Meals can be assigned to multiple meal types.
     """
     __tablename__ = "meal"
+    __table_args__ = (
+        # Keyset pagination order of the meal search
+        Index("ix_meal_name_id", "name", "id"),
+        # Round-robin rotation order (successor lookups)
+        Index("ix_meal_created_at_id", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    name = Column(Text, nullable=False, index=True)
+    name = Column(Text, nullable=False)
     portion_description = Column(Text, nullable=False)  # MANDATORY - invariant
     calories_kcal = Column(Integer)
     protein_g = Column(Numeric(6, 1))
@@ -29,7 +35,7 @@ class Meal(Base):
     saturated_fat_g = Column(Numeric(6, 1))
     fiber_g = Column(Numeric(6, 1))
     notes = Column(Text)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # Relationships
@@ -38,3 +44,31 @@ class Meal(Base):
 
     def __repr__(self):
         return f"<Meal(id={self.id}, name='{self.name}', portion='{self.portion_description}')>"
+
+
+# Text search configuration of the meal search document ('simple': no
+# stemming or stop words, so short dish names and brands match as typed)
+MEAL_SEARCH_CONFIG = "simple"
+
+
+def meal_search_document():
+    """
+    Full-text document of a meal: name, portion description and notes.
+
+    The expression is repeated verbatim by the ix_meal_search_document GIN
+    index, so queries must build it through this function (constants are
+    inlined rather than bound, otherwise the planner cannot match the index).
+    """
+    space = literal_column("' '")
+    return func.to_tsvector(
+        text(f"'{MEAL_SEARCH_CONFIG}'::regconfig"),
+        Meal.name + space + Meal.portion_description + space
+        + func.coalesce(Meal.notes, literal_column("''")),
+    )
+
+
+Index("ix_meal_search_document", meal_search_document(), postgresql_using="gin")
+
+# The trigram index behind infix name matching (ix_meal_name_trgm, GIN with
+# gin_trgm_ops) needs the pg_trgm extension and only exists in the Alembic
+# migration; name searches fall back to a scan where it is missing.
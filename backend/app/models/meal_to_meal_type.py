@@ -1,5 +1,5 @@
 """Junction table for Meal-MealType many-to-many relationship."""
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 from sqlalchemy.dialects.postgresql import UUID
 
 from ..database import Base
@@ -11,4 +11,6 @@ meal_to_meal_type = Table(
     Base.metadata,
     Column("meal_id", UUID(as_uuid=True), ForeignKey("meal.id", ondelete="CASCADE"), primary_key=True),
     Column("meal_type_id", UUID(as_uuid=True), ForeignKey("meal_type.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key leads with meal_id; rotations are looked up by meal type
+    Index("ix_meal_to_meal_type_meal_type_id_meal_id", "meal_type_id", "meal_id"),
 )
@@ -1,8 +1,32 @@
-"""WeeklyPlan models - generated instances of weeks with concrete meal assignments."""
+"""
+WeeklyPlan models - generated instances of weeks with concrete meal assignments.
+
+weekly_plan_instance_day and weekly_plan_slot grow with every generated week
+and are range-partitioned by date, one partition per calendar year plus a
+DEFAULT partition for dates outside them (see app.services.partitions).
+Primary and unique keys of a partitioned table must include the partition
+key, so their primary key is (id, date); the ORM still identifies rows by
+id alone.
+"""
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, Text, UniqueConstraint, CheckConstraint
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    CheckConstraint,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    Text,
+    UniqueConstraint,
+    event,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -42,10 +66,12 @@ class WeeklyPlanInstanceDay(Base):
     """
     __tablename__ = "weekly_plan_instance_day"
     __table_args__ = (
+        PrimaryKeyConstraint("id", "date", name="weekly_plan_instance_day_pkey"),
         UniqueConstraint("weekly_plan_instance_id", "date", name="uq_weekly_plan_instance_day_date"),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), default=uuid4)
     weekly_plan_instance_id = Column(UUID(as_uuid=True), ForeignKey("weekly_plan_instance.id", ondelete="CASCADE"), nullable=False)
     date = Column(Date, nullable=False, index=True)
     day_template_id = Column(UUID(as_uuid=True), ForeignKey("day_template.id", ondelete="SET NULL"))
@@ -58,6 +84,8 @@ class WeeklyPlanInstanceDay(Base):
     weekly_plan_instance = relationship("WeeklyPlanInstance", back_populates="days")
     day_template = relationship("DayTemplate", back_populates="weekly_plan_instance_days")
 
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self):
         return f"<WeeklyPlanInstanceDay(id={self.id}, date={self.date}, is_override={self.is_override})>"
 
@@ -71,16 +99,33 @@ class WeeklyPlanSlot(Base):
     """
     __tablename__ = "weekly_plan_slot"
     __table_args__ = (
+        PrimaryKeyConstraint("id", "date", name="weekly_plan_slot_pkey"),
         CheckConstraint(
             "completion_status IS NULL OR completion_status IN ('followed', 'adjusted', 'skipped', 'replaced', 'social')",
             name="ck_weekly_plan_slot_status"
         ),
+        # Also serves the day and week reads (instance, date) ordered by position
         UniqueConstraint("weekly_plan_instance_id", "date", "position", name="uq_weekly_plan_slot_position"),
+        # Date-range aggregates (stats, daily rollup) as index-only scans
+        Index(
+            "ix_weekly_plan_slot_date_covering",
+            "date",
+            postgresql_include=["completion_status", "meal_type_id", "meal_id"],
+        ),
+        # Slots still to be marked (week regeneration)
+        Index(
+            "ix_weekly_plan_slot_unmarked",
+            "weekly_plan_instance_id",
+            "date",
+            "position",
+            postgresql_where=text("completion_status IS NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    weekly_plan_instance_id = Column(UUID(as_uuid=True), ForeignKey("weekly_plan_instance.id", ondelete="CASCADE"), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), default=uuid4)
+    weekly_plan_instance_id = Column(UUID(as_uuid=True), ForeignKey("weekly_plan_instance.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
     position = Column(Integer, nullable=False)
     meal_type_id = Column(UUID(as_uuid=True), ForeignKey("meal_type.id", ondelete="SET NULL"))
     meal_id = Column(UUID(as_uuid=True), ForeignKey("meal.id", ondelete="SET NULL"))
@@ -93,11 +138,17 @@ class WeeklyPlanSlot(Base):
     meal_type = relationship("MealType")
     meal = relationship("Meal", back_populates="weekly_plan_slots")
 
-    # Create composite index for efficient querying by instance and date
-    __table_args__ = (
-        __table_args__[0],  # Keep the CheckConstraint
-        __table_args__[1],  # Keep the UniqueConstraint
-    )
+    __mapper_args__ = {"primary_key": [id]}
 
     def __repr__(self):
         return f"<WeeklyPlanSlot(id={self.id}, date={self.date}, position={self.position}, status={self.completion_status})>"
+
+
+# Tables created from the metadata (tests, fresh databases) start with only
+# the DEFAULT partition; yearly partitions are added by ensure_year_partitions
+for _table in (WeeklyPlanInstanceDay.__table__, WeeklyPlanSlot.__table__):
+    event.listen(
+        _table,
+        "after_create",
+        DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"),
+    )
@@ -0,0 +1,50 @@
+"""
+Rebuild the daily completion rollup from weekly plan data.
+
+Run from backend directory:
+    python -m app.rebuild_rollup [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+
+Safe to re-run. Without a range every date is recomputed; use it after data
+fixes that bypass the service layer (manual SQL, restores).
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import date
+
+from app.database import AsyncSessionLocal, engine
+from app.services.rollup import rebuild_daily_rollup
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def run_rebuild(start_date: date | None, end_date: date | None) -> None:
+    """Recompute the rollup for the given range and commit."""
+    async with AsyncSessionLocal() as db:
+        try:
+            written = await rebuild_daily_rollup(db, start_date, end_date)
+            await db.commit()
+            logger.info("Rollup rebuild complete: %d days", written)
+
+        except Exception:
+            await db.rollback()
+            logger.exception("Rollup rebuild failed, rolled back")
+            raise
+        finally:
+            await db.close()
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--start", type=date.fromisoformat, help="first date (inclusive)")
+    parser.add_argument("--end", type=date.fromisoformat, help="last date (inclusive)")
+    args = parser.parse_args()
+    asyncio.run(run_rebuild(args.start, args.end))
+
+
+if __name__ == "__main__":
+    main()
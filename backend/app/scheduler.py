@@ -0,0 +1,209 @@
+"""
+Background week pre-generation.
+
+Generating a week is the most expensive write in the app. Rather than have
+the first visitor after the Monday rollover pay for it inside
+POST /weekly-plans/generate, a background task started from the application
+lifespan generates the next settings.pregeneration_weeks_ahead weeks with
+the default week plan, every settings.pregeneration_interval_seconds. The
+current week is not generated: it was generated as an upcoming week before
+the rollover, and otherwise it is left to the request path rather than
+raced.
+
+Each run first creates the plan history partitions for the current and
+next year if missing (app.services.partitions), so generated weeks never
+land in the DEFAULT partition. Once the generated weeks are committed, it
+moves weeks that ended more than settings.archive_retention_days ago into
+the archive (app.services.archive), one batch per run, in a separate
+transaction: a failed archival never undoes the generated weeks.
+
+Every gunicorn worker runs the task, but each step first takes a Postgres
+advisory lock (pg_try_advisory_xact_lock) in its transaction: the worker
+that gets it does the step, the others skip it. Generation and archival
+have their own locks and their own counters. The lock is released with
+the transaction, so a worker that dies mid-run never blocks the others.
+
+Run statistics are kept per process and served at
+GET /api/v1/weekly-plans/scheduler.
+"""
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.metrics import WEEKS_GENERATED
+from app.services.archive import archive_weeks
+from app.services.partitions import ensure_upcoming_partitions
+from app.services.weekly import pregenerate_weeks
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock keys of the pre-generation and archival runs (arbitrary,
+# unique to this app)
+PREGENERATION_LOCK_KEY = 0x6D65616C
+ARCHIVE_LOCK_KEY = 0x6D65616D
+
+
+@dataclass
+class SchedulerStats:
+    """Pre-generation and archival runs of this process."""
+
+    runs: int = 0
+    skipped_runs: int = 0
+    failed_runs: int = 0
+    weeks_generated: int = 0
+    last_run_at: datetime | None = None
+    last_duration_ms: float | None = None
+    last_generated: list[date] = field(default_factory=list)
+    last_error: str | None = None
+    archive_runs: int = 0
+    failed_archive_runs: int = 0
+    weeks_archived: int = 0
+    last_archive_error: str | None = None
+
+
+class WeekPregenerationScheduler:
+    """
+    Periodically generates upcoming weeks in the background.
+
+    Args:
+        session_factory: Creates the session of each run
+        weeks_ahead: Weeks after the current one to keep generated
+        interval_seconds: Pause between runs
+        archive_retention_days: Days after which ended weeks are archived,
+            None to never archive
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        weeks_ahead: int,
+        interval_seconds: float,
+        archive_retention_days: int | None = None,
+    ):
+        self.session_factory = session_factory
+        self.weeks_ahead = weeks_ahead
+        self.interval_seconds = interval_seconds
+        self.archive_retention_days = archive_retention_days
+        self.stats = SchedulerStats()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background task (no-op if already running)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run_forever(), name="week-pregeneration")
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run_forever(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def run_once(self) -> list[date] | None:
+        """
+        Generate the missing upcoming weeks if no other worker is doing so,
+        then archive weeks past the retention window.
+
+        Pre-generation commits before archival starts, and archival runs in
+        its own transaction under its own advisory lock, so an archival
+        failure never rolls back or blocks pre-generation. Errors are
+        logged and counted, never raised, so the loop keeps going.
+
+        Returns:
+            Week start dates generated, or None if the run was skipped or failed
+        """
+        generated = await self._pregenerate()
+        if self.archive_retention_days is not None:
+            await self._archive()
+        return generated
+
+    async def _pregenerate(self) -> list[date] | None:
+        started = time.perf_counter()
+        self.stats.last_run_at = datetime.now(timezone.utc)
+        try:
+            async with self.session_factory() as db:
+                async with db.begin():
+                    locked = await db.scalar(
+                        select(func.pg_try_advisory_xact_lock(PREGENERATION_LOCK_KEY))
+                    )
+                    if not locked:
+                        self.stats.skipped_runs += 1
+                        return None
+                    partitions = await ensure_upcoming_partitions(db)
+                    generated = await pregenerate_weeks(db, self.weeks_ahead)
+        except Exception as e:
+            self.stats.failed_runs += 1
+            self.stats.last_error = f"{type(e).__name__}: {e}"
+            logger.exception("week pre-generation failed")
+            return None
+        finally:
+            self.stats.last_duration_ms = (time.perf_counter() - started) * 1000
+
+        self.stats.runs += 1
+        self.stats.weeks_generated += len(generated)
+        self.stats.last_generated = generated
+        self.stats.last_error = None
+        if partitions:
+            logger.info("created partitions %s", ", ".join(partitions))
+        if generated:
+            WEEKS_GENERATED.labels("scheduled").inc(len(generated))
+            logger.info(
+                "pre-generated weeks %s", ", ".join(week.isoformat() for week in generated)
+            )
+        return generated
+
+    async def _archive(self) -> list[date] | None:
+        """Archive one batch of weeks past the retention window, in its own transaction."""
+        cutoff = date.today() - timedelta(days=self.archive_retention_days)
+        try:
+            async with self.session_factory() as db:
+                async with db.begin():
+                    locked = await db.scalar(
+                        select(func.pg_try_advisory_xact_lock(ARCHIVE_LOCK_KEY))
+                    )
+                    if not locked:
+                        return None
+                    archived = (await archive_weeks(db, cutoff)).weeks
+        except Exception as e:
+            self.stats.failed_archive_runs += 1
+            self.stats.last_archive_error = f"{type(e).__name__}: {e}"
+            logger.exception("week archival failed")
+            return None
+
+        self.stats.archive_runs += 1
+        self.stats.weeks_archived += len(archived)
+        self.stats.last_archive_error = None
+        if archived:
+            logger.info("archived %d weeks up to %s", len(archived), archived[-1].isoformat())
+        return archived
+
+
+# Global scheduler (started by the application lifespan when enabled)
+week_scheduler = WeekPregenerationScheduler(
+    AsyncSessionLocal,
+    weeks_ahead=settings.pregeneration_weeks_ahead,
+    interval_seconds=settings.pregeneration_interval_seconds,
+    archive_retention_days=(
+        settings.archive_retention_days if settings.archive_enabled else None
+    ),
+)
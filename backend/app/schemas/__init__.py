@@ -6,6 +6,7 @@ from .base import BaseSchema, TimestampMixin
 # Common schemas
 from .common import (
     CompletionStatus,
+    SlotOperationOutcome,
     Weekday,
     WEEKDAY_NAMES,
     PaginationParams,
@@ -35,6 +36,7 @@ from .meal import (
     MealResponse,
     MealCompact,
     MealListItem,
+    MealSearchResponse,
     MealImportRow,
     MealImportWarning,
     MealImportError,
@@ -78,11 +80,19 @@ from .weekly_plan import (
     WeeklyPlanInstanceDayResponse,
     WeeklyPlanInstanceResponse,
     WeeklyPlanGenerateRequest,
+    WeeklyPlanRangeGenerateRequest,
+    GeneratedWeekSummary,
+    WeeklyPlanRangeResponse,
+    SchedulerStatusResponse,
     SwitchTemplateRequest,
     SetOverrideRequest,
     OverrideResponse,
     CompleteSlotRequest,
     CompleteSlotResponse,
+    SlotCompletionOperation,
+    BatchCompleteRequest,
+    SlotCompletionResult,
+    BatchCompleteResponse,
 )
 
 # Today/Yesterday schemas
@@ -101,12 +111,27 @@ from .stats import (
     StatsQueryParams,
 )
 
+# Response payloads built without validation
+from .payloads import (
+    CompletionSummaryPayload,
+    DailyAdherencePayload,
+    MealPayload,
+    MealTypeAdherencePayload,
+    RefPayload,
+    StatsPayload,
+    StatusBreakdownPayload,
+    WeeklyPlanInstanceDayPayload,
+    WeeklyPlanInstancePayload,
+    WeeklyPlanSlotPayload,
+)
+
 __all__ = [
     # Base
     "BaseSchema",
     "TimestampMixin",
     # Common
     "CompletionStatus",
+    "SlotOperationOutcome",
     "Weekday",
     "WEEKDAY_NAMES",
     "PaginationParams",
@@ -130,6 +155,7 @@ __all__ = [
     "MealResponse",
     "MealCompact",
     "MealListItem",
+    "MealSearchResponse",
     "MealImportRow",
     "MealImportWarning",
     "MealImportError",
@@ -164,11 +190,19 @@ __all__ = [
     "WeeklyPlanInstanceDayResponse",
     "WeeklyPlanInstanceResponse",
     "WeeklyPlanGenerateRequest",
+    "WeeklyPlanRangeGenerateRequest",
+    "GeneratedWeekSummary",
+    "WeeklyPlanRangeResponse",
+    "SchedulerStatusResponse",
     "SwitchTemplateRequest",
     "SetOverrideRequest",
     "OverrideResponse",
     "CompleteSlotRequest",
     "CompleteSlotResponse",
+    "SlotCompletionOperation",
+    "BatchCompleteRequest",
+    "SlotCompletionResult",
+    "BatchCompleteResponse",
     # Today
     "TodayStats",
     "TodayResponse",
@@ -179,4 +213,15 @@ __all__ = [
     "MealTypeAdherence",
     "StatsResponse",
     "StatsQueryParams",
+    # Payloads
+    "CompletionSummaryPayload",
+    "DailyAdherencePayload",
+    "MealPayload",
+    "MealTypeAdherencePayload",
+    "RefPayload",
+    "StatsPayload",
+    "StatusBreakdownPayload",
+    "WeeklyPlanInstanceDayPayload",
+    "WeeklyPlanInstancePayload",
+    "WeeklyPlanSlotPayload",
 ]
@@ -1,7 +1,6 @@
 """Base Pydantic schema utilities for MealFrame API."""
 from datetime import datetime
 from typing import TypeVar
-from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
@@ -12,10 +11,6 @@ class BaseSchema(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,  # Enable ORM mode (formerly orm_mode)
         populate_by_name=True,  # Allow population by field name or alias
-        json_encoders={
-            datetime: lambda v: v.isoformat() if v else None,
-            UUID: lambda v: str(v) if v else None,
-        },
     )
 
 
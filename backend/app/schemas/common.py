@@ -21,6 +21,14 @@ class CompletionStatus(str, Enum):
     SOCIAL = "social"
 
 
+class SlotOperationOutcome(str, Enum):
+    """Outcome of one operation in a batch of slot completions."""
+
+    APPLIED = "applied"
+    SUPERSEDED = "superseded"  # a later change to the slot (in the batch or stored) won
+    NOT_FOUND = "not_found"
+
+
 class Weekday(int, Enum):
     """Weekday enumeration (0=Monday, 6=Sunday)."""
 
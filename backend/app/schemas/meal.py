@@ -100,6 +100,18 @@ class MealListItem(BaseSchema):
     meal_types: list[MealTypeCompact] = Field(default_factory=list)
 
 
+class MealSearchResponse(BaseSchema):
+    """One page of meal search results (keyset paginated)."""
+
+    items: list[MealListItem]
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to fetch the next page; null on the last page"
+    )
+    total: int | None = Field(
+        default=None, description="Total matches; only counted when include_total is set"
+    )
+
+
 class MealImportRow(BaseSchema):
     """Schema for a single row in CSV import.
 
@@ -0,0 +1,142 @@
+"""
+Lightweight payloads for the largest read responses.
+
+The week view (WeeklyPlanInstanceResponse) and the stats
+(StatsResponse) are built by the application itself, from rows it just
+read, so validating them while they are built buys nothing. They are
+built as these slotted dataclasses instead, field for field the same as
+their Pydantic response models, which stay the API contract:
+
+- By default the route validates the payload into its response model once
+  and has Pydantic encode it (see app/api/responses.py).
+- With settings.fast_json_responses, the route skips validation and encodes
+  the payload directly with orjson.
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class RefPayload:
+    """id and name of a referenced entity (MealTypeCompact, DayTemplateCompact, WeekPlanCompact)."""
+
+    id: UUID
+    name: str
+
+
+@dataclass(slots=True)
+class MealPayload:
+    """Mirrors MealCompact."""
+
+    id: UUID
+    name: str
+    portion_description: str
+    calories_kcal: int | None = None
+    protein_g: Decimal | None = None
+    carbs_g: Decimal | None = None
+    sugar_g: Decimal | None = None
+    fat_g: Decimal | None = None
+    saturated_fat_g: Decimal | None = None
+    fiber_g: Decimal | None = None
+
+
+@dataclass(slots=True)
+class WeeklyPlanSlotPayload:
+    """Mirrors WeeklyPlanSlotResponse."""
+
+    id: UUID
+    position: int
+    meal_type: RefPayload | None = None
+    meal: MealPayload | None = None
+    completion_status: str | None = None
+    completed_at: datetime | None = None
+    is_adhoc: bool = False
+
+
+@dataclass(slots=True)
+class CompletionSummaryPayload:
+    """Mirrors CompletionSummary."""
+
+    completed: int
+    total: int
+
+
+@dataclass(slots=True)
+class WeeklyPlanInstanceDayPayload:
+    """Mirrors WeeklyPlanInstanceDayResponse."""
+
+    date: date
+    weekday: str
+    template: RefPayload | None
+    is_override: bool
+    override_reason: str | None
+    slots: list[WeeklyPlanSlotPayload]
+    completion_summary: CompletionSummaryPayload
+
+
+@dataclass(slots=True)
+class WeeklyPlanInstancePayload:
+    """Mirrors WeeklyPlanInstanceResponse."""
+
+    id: UUID
+    week_start_date: date
+    week_plan: RefPayload | None = None
+    days: list[WeeklyPlanInstanceDayPayload] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class StatusBreakdownPayload:
+    """Mirrors StatusBreakdown."""
+
+    followed: int = 0
+    adjusted: int = 0
+    skipped: int = 0
+    replaced: int = 0
+    social: int = 0
+    unmarked: int = 0
+
+
+@dataclass(slots=True)
+class MealTypeAdherencePayload:
+    """Mirrors MealTypeAdherence."""
+
+    meal_type_id: UUID
+    name: str
+    total: int
+    followed: int
+    adherence_rate: Decimal
+
+
+@dataclass(slots=True)
+class DailyAdherencePayload:
+    """Mirrors DailyAdherence."""
+
+    date: date
+    total: int
+    followed: int
+    adherence_rate: Decimal
+
+
+@dataclass(slots=True)
+class StatsPayload:
+    """Mirrors StatsResponse."""
+
+    period_days: int
+    total_slots: int
+    completed_slots: int
+    by_status: StatusBreakdownPayload
+    adherence_rate: Decimal
+    current_streak: int
+    best_streak: int
+    override_days: int
+    by_meal_type: list[MealTypeAdherencePayload] = field(default_factory=list)
+    daily_adherence: list[DailyAdherencePayload] = field(default_factory=list)
+    avg_daily_calories: Decimal | None = None
+    avg_daily_protein: Decimal | None = None
+    avg_daily_carbs: Decimal | None = None
+    avg_daily_sugar: Decimal | None = None
+    avg_daily_fat: Decimal | None = None
+    avg_daily_saturated_fat: Decimal | None = None
+    avg_daily_fiber: Decimal | None = None
@@ -81,6 +81,26 @@ class StatsResponse(BaseSchema):
         default=None,
         description="Average daily protein (g) across days with meal data",
     )
+    avg_daily_carbs: Decimal | None = Field(
+        default=None,
+        description="Average daily carbohydrates (g) across days with meal data",
+    )
+    avg_daily_sugar: Decimal | None = Field(
+        default=None,
+        description="Average daily sugar (g) across days with meal data",
+    )
+    avg_daily_fat: Decimal | None = Field(
+        default=None,
+        description="Average daily fat (g) across days with meal data",
+    )
+    avg_daily_saturated_fat: Decimal | None = Field(
+        default=None,
+        description="Average daily saturated fat (g) across days with meal data",
+    )
+    avg_daily_fiber: Decimal | None = Field(
+        default=None,
+        description="Average daily fiber (g) across days with meal data",
+    )
 
 
 class StatsQueryParams(BaseSchema):
@@ -6,7 +6,7 @@ from uuid import UUID
 from pydantic import Field
 
 from .base import BaseSchema
-from .common import CompletionStatus, WEEKDAY_NAMES
+from .common import CompletionStatus, SlotOperationOutcome, WEEKDAY_NAMES
 from .day_template import DayTemplateCompact
 from .meal import MealCompact
 from .meal_type import MealTypeCompact
@@ -100,6 +100,68 @@ class WeeklyPlanGenerateRequest(BaseSchema):
         default=None,
         description="Monday of the target week. Defaults to next Monday if not provided.",
     )
+    regenerate_from: date | None = Field(
+        default=None,
+        description="When the week already exists, only regenerate slots from this date on (e.g. today).",
+    )
+
+
+class WeeklyPlanRangeGenerateRequest(BaseSchema):
+    """Request to generate several consecutive weeks at once."""
+
+    week_start_date: date | None = Field(
+        default=None,
+        description="Monday of the first week. Defaults to next Monday if not provided.",
+    )
+    weeks: int = Field(ge=1, le=52, description="Number of consecutive weeks to generate")
+
+
+class GeneratedWeekSummary(BaseSchema):
+    """Summary of one generated week."""
+
+    id: UUID
+    week_start_date: date
+    days: int
+    slots: int
+    unassigned_slots: int = Field(description="Slots left without a meal (meal type has no meals)")
+
+
+class WeeklyPlanRangeResponse(BaseSchema):
+    """Response for POST /weekly-plans/generate-range."""
+
+    week_plan: WeekPlanCompact | None = None
+    weeks: list[GeneratedWeekSummary] = Field(default_factory=list)
+    total_slots: int
+
+
+class SchedulerStatusResponse(BaseSchema):
+    """Week pre-generation status for GET /weekly-plans/scheduler."""
+
+    enabled: bool
+    running: bool = Field(description="Whether this worker's background task is running")
+    weeks_ahead: int
+    interval_seconds: float
+    runs: int = Field(description="Runs this worker completed as the elected worker")
+    skipped_runs: int = Field(description="Runs skipped because another worker held the lock")
+    failed_runs: int
+    weeks_generated: int
+    archive_retention_days: int | None = Field(
+        default=None, description="Retention of live weeks, None if archival is disabled"
+    )
+    archive_runs: int = Field(
+        default=0, description="Archival runs this worker completed as the elected worker"
+    )
+    failed_archive_runs: int = 0
+    weeks_archived: int = 0
+    last_archive_error: str | None = None
+    last_run_at: datetime | None = None
+    last_duration_ms: float | None = None
+    last_generated: list[date] = Field(default_factory=list)
+    last_error: str | None = None
+    missing_weeks: list[date] = Field(
+        default_factory=list,
+        description="Weeks in the pre-generation window that are not generated yet",
+    )
 
 
 class SwitchTemplateRequest(BaseSchema):
@@ -144,3 +206,36 @@ class CompleteSlotResponse(BaseSchema):
     id: UUID
     completion_status: CompletionStatus | None = None
     completed_at: datetime | None = None
+
+
+class SlotCompletionOperation(BaseSchema):
+    """One queued completion change of a slot."""
+
+    slot_id: UUID
+    status: CompletionStatus | None = Field(
+        description="Completion status to set; null undoes completion"
+    )
+    client_timestamp: datetime = Field(
+        description="When the action was taken on the client (orders operations, becomes completed_at)"
+    )
+
+
+class BatchCompleteRequest(BaseSchema):
+    """Request to apply many completion changes at once (offline queue sync)."""
+
+    operations: list[SlotCompletionOperation] = Field(min_length=1, max_length=500)
+
+
+class SlotCompletionResult(BaseSchema):
+    """Result of one operation of a batch, with the slot's resulting state."""
+
+    slot_id: UUID
+    outcome: SlotOperationOutcome
+    completion_status: CompletionStatus | None = None
+    completed_at: datetime | None = None
+
+
+class BatchCompleteResponse(BaseSchema):
+    """Per-operation results of a batch, in request order."""
+
+    results: list[SlotCompletionResult]
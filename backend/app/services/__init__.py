@@ -1,31 +1,52 @@
 """Business logic services for MealFrame application."""
 
 from .round_robin import (
+    RoundRobinAllocator,
+    Rotation,
+    allocate_meals,
     get_meals_for_type,
+    get_meals_for_types,
     get_next_meal_for_type,
+    get_rotations,
     get_round_robin_state,
+    get_successor_meal,
+    lock_round_robin_states,
     peek_next_meal_for_type,
     reset_round_robin_state,
     update_round_robin_state,
 )
 
+from .bulk import (
+    copy_rows,
+    insert_instance_days,
+    insert_plan_slots,
+    update_slot_completions,
+    update_slot_meals,
+)
+
 from .meals import (
     create_meal,
     delete_meal,
     get_meal_by_id,
     import_meals_from_csv,
     list_meals,
+    search_meals,
     update_meal,
 )
 
 from .weekly import (
+    GeneratedWeek,
     generate_weekly_plan,
+    generate_weekly_plans,
+    get_missing_weeks,
+    pregenerate_weeks,
     regenerate_weekly_plan,
     get_current_week_instance,
     get_week_instance,
     get_full_weekly_instance,
     get_instance_day,
     get_slots_for_instance_day,
+    get_week_view,
     switch_day_template,
     set_day_override,
     clear_day_override,
@@ -58,7 +79,48 @@ from .week_plans import (
     update_week_plan,
 )
 
+from .definitions import (
+    DayTemplateSnapshot,
+    WeekPlanSnapshot,
+    get_day_template_snapshot,
+    get_day_template_snapshots,
+    get_default_week_plan_snapshot,
+    get_week_plan_snapshot,
+)
+
+from .rollup import (
+    rebuild_daily_rollup,
+    refresh_daily_rollup,
+    refresh_daily_rollup_for_meal,
+)
+from .data_version import (
+    bump_versions,
+    get_versions,
+    record_catalog_change,
+    record_day_changes,
+    record_definition_change,
+    record_rotation_change,
+    stats_cache_key,
+    today_cache_key,
+    week_cache_key,
+)
 from .stats import get_stats
+from .partitions import (
+    create_year_partition,
+    drop_year_partition,
+    drop_year_partitions,
+    ensure_upcoming_partitions,
+    ensure_year_partitions,
+    get_partition_years,
+)
+from .archive import (
+    ArchiveResult,
+    ArchivedDay,
+    ArchivedSlot,
+    ArchivedWeek,
+    archive_weeks,
+    get_archived_week,
+)
 
 __all__ = [
     # Meals
@@ -67,22 +129,41 @@ __all__ = [
     "get_meal_by_id",
     "import_meals_from_csv",
     "list_meals",
+    "search_meals",
     "update_meal",
     # Round-robin
+    "RoundRobinAllocator",
+    "Rotation",
+    "allocate_meals",
     "get_meals_for_type",
+    "get_meals_for_types",
     "get_next_meal_for_type",
+    "get_rotations",
     "get_round_robin_state",
+    "get_successor_meal",
+    "lock_round_robin_states",
     "peek_next_meal_for_type",
     "reset_round_robin_state",
     "update_round_robin_state",
+    # Bulk persistence
+    "copy_rows",
+    "insert_instance_days",
+    "insert_plan_slots",
+    "update_slot_completions",
+    "update_slot_meals",
     # Weekly planning
+    "GeneratedWeek",
     "generate_weekly_plan",
+    "generate_weekly_plans",
+    "get_missing_weeks",
+    "pregenerate_weeks",
     "regenerate_weekly_plan",
     "get_current_week_instance",
     "get_week_instance",
     "get_full_weekly_instance",
     "get_instance_day",
     "get_slots_for_instance_day",
+    "get_week_view",
     "switch_day_template",
     "set_day_override",
     "clear_day_override",
@@ -107,6 +188,41 @@ __all__ = [
     "list_week_plans",
     "set_default_week_plan",
     "update_week_plan",
+    # Plan definition snapshots
+    "DayTemplateSnapshot",
+    "WeekPlanSnapshot",
+    "get_day_template_snapshot",
+    "get_day_template_snapshots",
+    "get_default_week_plan_snapshot",
+    "get_week_plan_snapshot",
+    # Daily rollup
+    "rebuild_daily_rollup",
+    "refresh_daily_rollup",
+    "refresh_daily_rollup_for_meal",
+    # Data versions (response cache keys)
+    "bump_versions",
+    "get_versions",
+    "record_catalog_change",
+    "record_day_changes",
+    "record_definition_change",
+    "record_rotation_change",
+    "stats_cache_key",
+    "today_cache_key",
+    "week_cache_key",
     # Stats
     "get_stats",
+    # History partitions
+    "create_year_partition",
+    "drop_year_partition",
+    "drop_year_partitions",
+    "ensure_upcoming_partitions",
+    "ensure_year_partitions",
+    "get_partition_years",
+    # Archive
+    "ArchiveResult",
+    "ArchivedDay",
+    "ArchivedSlot",
+    "ArchivedWeek",
+    "archive_weeks",
+    "get_archived_week",
 ]
@@ -0,0 +1,389 @@
+"""
+Archival of past weeks into weekly_plan_archive_day.
+
+Weeks that ended before the retention window are never read by /today or
+the week editor, yet their days and slots stay in every index the stats
+and rollup queries scan. archive_weeks compacts each such week into seven
+weekly_plan_archive_day rows (slots packed as JSONB) in one INSERT ...
+SELECT, then deletes the instance (its days and slots go with it by
+cascade). Partitions of years that end up fully archived are detached and
+dropped instead (see app.services.partitions).
+
+The daily rollup rows of archived dates are refreshed once before the live
+rows go, and are then kept as they are: refreshes and rebuilds leave dates
+with archive rows alone (see app.services.rollup). Archived history is
+read-only; meal macro edits no longer reach it.
+
+Archived weeks stay readable: get_archived_week rebuilds a week from its
+archive rows (used by weekly.get_week_instance and weekly.get_week_view),
+and archived_slots unpacks archived slots for SQL aggregates such as the
+per-meal-type stats.
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Integer,
+    Text,
+    and_,
+    column,
+    delete,
+    exists,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import (
+    DayTemplate,
+    Meal,
+    MealType,
+    WeekPlan,
+    WeeklyPlanArchiveDay,
+    WeeklyPlanInstance,
+    WeeklyPlanInstanceDay,
+    WeeklyPlanSlot,
+)
+from .data_version import record_day_changes
+from .partitions import (
+    PARTITIONED_TABLES,
+    drop_year_partitions,
+    get_partition_years,
+    partition_name,
+)
+from .rollup import refresh_daily_rollup
+
+# Archival never reaches the weeks /today and /yesterday read
+MIN_RETENTION_DAYS = 14
+
+# Weeks archived per call (keeps each archival transaction short)
+ARCHIVE_BATCH_WEEKS = 52
+
+# Keys of each element of WeeklyPlanArchiveDay.slots, with their SQL types
+ARCHIVED_SLOT_COLUMNS = {
+    "id": PG_UUID(as_uuid=True),
+    "position": Integer(),
+    "meal_type_id": PG_UUID(as_uuid=True),
+    "meal_id": PG_UUID(as_uuid=True),
+    "is_adhoc": Boolean(),
+    "completion_status": Text(),
+    "completed_at": DateTime(timezone=True),
+}
+
+
+@dataclass
+class ArchiveResult:
+    """What one archive_weeks call moved."""
+
+    weeks: list[date] = field(default_factory=list)
+    days: int = 0
+    slots: int = 0
+    partitions_dropped: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ArchivedSlot:
+    """A slot read back from the archive (attributes mirror WeeklyPlanSlot)."""
+
+    id: UUID
+    date: date
+    position: int
+    meal_type_id: Optional[UUID]
+    meal_id: Optional[UUID]
+    is_adhoc: bool
+    completion_status: Optional[str]
+    completed_at: Optional[datetime]
+    meal: Optional[Meal] = None
+    meal_type: Optional[MealType] = None
+
+    @classmethod
+    def from_json(cls, slot_date: date, data: dict[str, Any]) -> "ArchivedSlot":
+        def as_uuid(value: Optional[str]) -> Optional[UUID]:
+            return UUID(value) if value else None
+
+        completed_at = data.get("completed_at")
+        return cls(
+            id=UUID(data["id"]),
+            date=slot_date,
+            position=data["position"],
+            meal_type_id=as_uuid(data.get("meal_type_id")),
+            meal_id=as_uuid(data.get("meal_id")),
+            is_adhoc=data.get("is_adhoc", False),
+            completion_status=data.get("completion_status"),
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+        )
+
+
+@dataclass
+class ArchivedDay:
+    """A plan day read back from the archive (mirrors WeeklyPlanInstanceDay)."""
+
+    date: date
+    day_template_id: Optional[UUID]
+    is_override: bool
+    override_reason: Optional[str]
+    day_template: Optional[DayTemplate] = None
+
+
+@dataclass
+class ArchivedWeek:
+    """A week read back from the archive (mirrors WeeklyPlanInstance)."""
+
+    id: UUID
+    week_start_date: date
+    week_plan_id: Optional[UUID]
+    days: list[ArchivedDay]
+    week_plan: Optional[WeekPlan] = None
+
+
+def archived_slots():
+    """
+    The slots of an archive row as a table (jsonb_to_recordset).
+
+    Join it to WeeklyPlanArchiveDay on true(); its columns are those of
+    ARCHIVED_SLOT_COLUMNS.
+    """
+    return (
+        func.jsonb_to_recordset(WeeklyPlanArchiveDay.slots)
+        .table_valued(*(column(name, type_) for name, type_ in ARCHIVED_SLOT_COLUMNS.items()))
+        .render_derived(name="archived_slot", with_types=True)
+    )
+
+
+def _archive_source(instance_ids: list[UUID]):
+    """SELECT of the archive rows of the given instances (one per plan day or slot date)."""
+    slot_json = func.jsonb_build_object(
+        *(
+            part
+            for name in ARCHIVED_SLOT_COLUMNS
+            for part in (name, getattr(WeeklyPlanSlot, name))
+        )
+    )
+    slot_days = (
+        select(
+            WeeklyPlanSlot.weekly_plan_instance_id.label("instance_id"),
+            WeeklyPlanSlot.date.label("date"),
+            func.jsonb_agg(aggregate_order_by(slot_json, WeeklyPlanSlot.position)).label("slots"),
+        )
+        .where(WeeklyPlanSlot.weekly_plan_instance_id.in_(instance_ids))
+        .group_by(WeeklyPlanSlot.weekly_plan_instance_id, WeeklyPlanSlot.date)
+        .subquery("slot_days")
+    )
+    plan_days = (
+        select(
+            WeeklyPlanInstanceDay.weekly_plan_instance_id.label("instance_id"),
+            WeeklyPlanInstanceDay.date,
+            WeeklyPlanInstanceDay.day_template_id,
+            WeeklyPlanInstanceDay.is_override,
+            WeeklyPlanInstanceDay.override_reason,
+        )
+        .where(WeeklyPlanInstanceDay.weekly_plan_instance_id.in_(instance_ids))
+        .subquery("plan_days")
+    )
+    joined = plan_days.join(
+        slot_days,
+        and_(
+            plan_days.c.instance_id == slot_days.c.instance_id,
+            plan_days.c.date == slot_days.c.date,
+        ),
+        full=True,
+    ).join(
+        WeeklyPlanInstance,
+        WeeklyPlanInstance.id == func.coalesce(plan_days.c.instance_id, slot_days.c.instance_id),
+    )
+    return select(
+        func.coalesce(plan_days.c.date, slot_days.c.date),
+        WeeklyPlanInstance.id,
+        WeeklyPlanInstance.week_start_date,
+        WeeklyPlanInstance.week_plan_id,
+        plan_days.c.day_template_id,
+        func.coalesce(plan_days.c.is_override, false()),
+        plan_days.c.override_reason,
+        func.coalesce(slot_days.c.slots, literal_column("'[]'::jsonb")),
+        func.now(),
+    ).select_from(joined)
+
+
+async def _drop_archived_partitions(
+    db: AsyncSession, instance_ids: list[UUID], before: date
+) -> list[str]:
+    """
+    Drop the partitions of past years whose rows all belong to the given instances.
+
+    A year whose partitions cannot be locked in time is skipped (see
+    drop_year_partitions); its rows are deleted with the instances instead,
+    and the next run that archives weeks drops the emptied partitions.
+    """
+    tables = {
+        "weekly_plan_instance_day": WeeklyPlanInstanceDay,
+        "weekly_plan_slot": WeeklyPlanSlot,
+    }
+    years = set.intersection(*[await get_partition_years(db, table) for table in tables])
+    dropped = []
+    for year in sorted(y for y in years if y < before.year):
+        remaining = [
+            exists().where(
+                model.date >= date(year, 1, 1),
+                model.date < date(year + 1, 1, 1),
+                model.weekly_plan_instance_id.not_in(instance_ids),
+            )
+            for model in tables.values()
+        ]
+        if await db.scalar(select(or_(*remaining))):
+            continue
+        if await drop_year_partitions(db, year):
+            dropped.extend(partition_name(table, year) for table in PARTITIONED_TABLES)
+    return dropped
+
+
+async def archive_weeks(
+    db: AsyncSession,
+    before: date,
+    limit: int = ARCHIVE_BATCH_WEEKS,
+) -> ArchiveResult:
+    """
+    Move weeks that ended before a date into the archive.
+
+    Args:
+        db: Database session
+        before: Weeks whose last day (Sunday) is before this date are archived
+        limit: Maximum number of weeks (oldest first)
+
+    Returns:
+        The weeks archived and the number of days and slots moved
+
+    Raises:
+        ValueError: If before is within MIN_RETENTION_DAYS of today
+    """
+    if before > date.today() - timedelta(days=MIN_RETENTION_DAYS):
+        raise ValueError(
+            f"Cannot archive weeks ending within {MIN_RETENTION_DAYS} days, got cutoff {before}"
+        )
+
+    result = await db.execute(
+        select(WeeklyPlanInstance.id, WeeklyPlanInstance.week_start_date)
+        .where(WeeklyPlanInstance.week_start_date <= before - timedelta(days=7))
+        .order_by(WeeklyPlanInstance.week_start_date)
+        .limit(limit)
+    )
+    weeks = result.all()
+    if not weeks:
+        return ArchiveResult()
+
+    instance_ids = [week.id for week in weeks]
+    dates = [
+        week.week_start_date + timedelta(days=offset) for week in weeks for offset in range(7)
+    ]
+
+    # Fold the final state into the rollup while the live rows still exist
+    await refresh_daily_rollup(db, dates)
+
+    columns = [
+        "date",
+        "weekly_plan_instance_id",
+        "week_start_date",
+        "week_plan_id",
+        "day_template_id",
+        "is_override",
+        "override_reason",
+        "slots",
+        "archived_at",
+    ]
+    archived = await db.execute(
+        pg_insert(WeeklyPlanArchiveDay)
+        .from_select(columns, _archive_source(instance_ids))
+        .returning(func.jsonb_array_length(WeeklyPlanArchiveDay.slots))
+    )
+    slot_counts = archived.scalars().all()
+
+    partitions_dropped = await _drop_archived_partitions(db, instance_ids, before)
+    await db.execute(
+        delete(WeeklyPlanInstance)
+        .where(WeeklyPlanInstance.id.in_(instance_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await record_day_changes(db, dates)
+
+    return ArchiveResult(
+        weeks=[week.week_start_date for week in weeks],
+        days=len(slot_counts),
+        slots=sum(slot_counts),
+        partitions_dropped=partitions_dropped,
+    )
+
+
+async def _load_by_id(db: AsyncSession, model, ids) -> dict:
+    wanted = {id_ for id_ in ids if id_ is not None}
+    if not wanted:
+        return {}
+    result = await db.execute(select(model).where(model.id.in_(wanted)))
+    return {row.id: row for row in result.scalars().all()}
+
+
+async def get_archived_week(
+    db: AsyncSession,
+    week_start_date: Optional[date] = None,
+    instance_id: Optional[UUID] = None,
+) -> Optional[tuple[ArchivedWeek, dict[date, list[ArchivedSlot]]]]:
+    """
+    Rebuild an archived week, by its Monday or by its original instance ID.
+
+    Meals, meal types, day templates and the week plan are attached the same
+    way the live week view loads them, so the API can render the result with
+    the builders it uses for live weeks.
+
+    Returns:
+        (week, slots grouped by date and ordered by position), or None if
+        the week is not archived
+    """
+    criterion = (
+        WeeklyPlanArchiveDay.week_start_date == week_start_date
+        if instance_id is None
+        else WeeklyPlanArchiveDay.weekly_plan_instance_id == instance_id
+    )
+    result = await db.execute(
+        select(WeeklyPlanArchiveDay).where(criterion).order_by(WeeklyPlanArchiveDay.date)
+    )
+    rows = result.scalars().all()
+    if not rows:
+        return None
+
+    slots_by_date = {
+        row.date: [ArchivedSlot.from_json(row.date, item) for item in row.slots]
+        for row in rows
+    }
+    slots = [slot for day_slots in slots_by_date.values() for slot in day_slots]
+    meals = await _load_by_id(db, Meal, (slot.meal_id for slot in slots))
+    meal_types = await _load_by_id(db, MealType, (slot.meal_type_id for slot in slots))
+    templates = await _load_by_id(db, DayTemplate, (row.day_template_id for row in rows))
+    week_plans = await _load_by_id(db, WeekPlan, [rows[0].week_plan_id])
+    for slot in slots:
+        slot.meal = meals.get(slot.meal_id)
+        slot.meal_type = meal_types.get(slot.meal_type_id)
+
+    week = ArchivedWeek(
+        id=rows[0].weekly_plan_instance_id,
+        week_start_date=rows[0].week_start_date,
+        week_plan_id=rows[0].week_plan_id,
+        days=[
+            ArchivedDay(
+                date=row.date,
+                day_template_id=row.day_template_id,
+                is_override=row.is_override,
+                override_reason=row.override_reason,
+                day_template=templates.get(row.day_template_id),
+            )
+            for row in rows
+        ],
+        week_plan=week_plans.get(rows[0].week_plan_id),
+    )
+    return week, slots_by_date
@@ -0,0 +1,218 @@
+"""
+Set-based persistence helpers.
+
+Weekly plan days and slots are created in batches (a week at a time, or many
+weeks when backfilling). Adding them one ORM object at a time pays unit-of-work
+bookkeeping per row; these helpers instead send multi-row
+INSERT ... RETURNING statements and hand back persistent ORM objects that can
+be used directly to build API responses. update_slot_meals reassigns meals
+and update_slot_completions sets completion status of many existing slots,
+each with a single UPDATE ... FROM (VALUES ...).
+
+copy_rows serves large write-only loads (CSV imports): it streams rows with
+PostgreSQL COPY when the session runs on asyncpg.
+
+The plan history tables are partitioned by date, so their primary keys are
+(id, date) and the database no longer enforces that an id is unique on its
+own (ADR-011). insert_instance_days and insert_plan_slots are the only
+paths that create days and slots, and they always generate the ids
+themselves (uuid4 column default): rows that carry an id are rejected.
+"""
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Row, Table, Text, cast, column, insert, or_, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import WeeklyPlanInstanceDay, WeeklyPlanSlot
+
+
+def _check_generated_ids(rows: Sequence[dict[str, Any]]) -> None:
+    """Reject rows carrying an id (see the module docstring)."""
+    if any("id" in row for row in rows):
+        raise ValueError("Plan day and slot ids are generated on insert and cannot be given")
+
+
+async def insert_instance_days(
+    db: AsyncSession,
+    rows: Sequence[dict[str, Any]],
+) -> list[WeeklyPlanInstanceDay]:
+    """
+    Insert weekly plan instance days in one multi-row statement.
+
+    Args:
+        db: Database session
+        rows: Column values per day (weekly_plan_instance_id, date,
+            day_template_id, is_override, ...). Column defaults such as
+            id and timestamps are filled in automatically.
+
+    Returns:
+        The inserted WeeklyPlanInstanceDay objects, in the order of rows
+
+    Raises:
+        ValueError: If a row carries an id
+    """
+    if not rows:
+        return []
+    _check_generated_ids(rows)
+    result = await db.scalars(
+        insert(WeeklyPlanInstanceDay).returning(
+            WeeklyPlanInstanceDay, sort_by_parameter_order=True
+        ),
+        list(rows),
+    )
+    return list(result.all())
+
+
+async def insert_plan_slots(
+    db: AsyncSession,
+    rows: Sequence[dict[str, Any]],
+) -> list[WeeklyPlanSlot]:
+    """
+    Insert weekly plan slots in one multi-row statement.
+
+    Args:
+        db: Database session
+        rows: Column values per slot (weekly_plan_instance_id, date, position,
+            meal_type_id, meal_id, ...). Unspecified columns use their
+            defaults; the id is always generated.
+
+    Returns:
+        The inserted WeeklyPlanSlot objects, in the order of rows
+
+    Raises:
+        ValueError: If a row carries an id
+    """
+    if not rows:
+        return []
+    _check_generated_ids(rows)
+    result = await db.scalars(
+        insert(WeeklyPlanSlot).returning(WeeklyPlanSlot, sort_by_parameter_order=True),
+        list(rows),
+    )
+    return list(result.all())
+
+
+async def update_slot_meals(
+    db: AsyncSession,
+    assignments: Sequence[tuple[UUID, Optional[UUID]]],
+) -> None:
+    """
+    Set the meal of many weekly plan slots in one statement.
+
+    Slots already loaded in the session have their meal expired (matched
+    through the statement's RETURNING rows), so the next query reloads it.
+
+    Args:
+        db: Database session
+        assignments: (slot_id, meal_id) pairs; meal_id may be None
+    """
+    if not assignments:
+        return
+    # VALUES renders None as an untyped NULL literal (text to Postgres), so
+    # the SET expressions are cast to the column types
+    new_meals = values(
+        column("id", PG_UUID(as_uuid=True)),
+        column("meal_id", PG_UUID(as_uuid=True)),
+        name="new_meals",
+    ).data(list(assignments))
+    await db.execute(
+        update(WeeklyPlanSlot)
+        .where(WeeklyPlanSlot.id == new_meals.c.id)
+        .values(meal_id=cast(new_meals.c.meal_id, PG_UUID(as_uuid=True)))
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+async def update_slot_completions(
+    db: AsyncSession,
+    completions: Sequence[tuple[UUID, Optional[str], Optional[datetime], datetime]],
+) -> list[Row]:
+    """
+    Set the completion status of many weekly plan slots in one statement.
+
+    A change is stale, and skipped, when the slot's stored completed_at is
+    later than the change's own timestamp: the slot was completed after
+    the change was made (e.g. on another device).
+
+    Slots already loaded in the session have both columns expired, as in
+    update_slot_meals.
+
+    Args:
+        db: Database session
+        completions: (slot_id, completion_status, completed_at, changed_at)
+            tuples; status and completed_at are None to undo completion,
+            changed_at is when the change was made
+
+    Returns:
+        (id, date, completion_status, completed_at) rows of the updated
+        slots; IDs that match no slot and stale changes are left out
+    """
+    if not completions:
+        return []
+    new_completions = values(
+        column("id", PG_UUID(as_uuid=True)),
+        column("completion_status", Text),
+        column("completed_at", DateTime(timezone=True)),
+        column("changed_at", DateTime(timezone=True)),
+        name="new_completions",
+    ).data(list(completions))
+    changed_at = cast(new_completions.c.changed_at, DateTime(timezone=True))
+    result = await db.execute(
+        update(WeeklyPlanSlot)
+        .where(
+            WeeklyPlanSlot.id == new_completions.c.id,
+            or_(WeeklyPlanSlot.completed_at.is_(None), WeeklyPlanSlot.completed_at <= changed_at),
+        )
+        .values(
+            completion_status=cast(new_completions.c.completion_status, Text),
+            completed_at=cast(new_completions.c.completed_at, DateTime(timezone=True)),
+        )
+        .returning(
+            WeeklyPlanSlot.id,
+            WeeklyPlanSlot.date,
+            WeeklyPlanSlot.completion_status,
+            WeeklyPlanSlot.completed_at,
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+    return list(result.all())
+
+
+async def copy_rows(
+    db: AsyncSession,
+    table: Table,
+    rows: Sequence[dict[str, Any]],
+) -> None:
+    """
+    Bulk-load rows into a table without returning anything.
+
+    Uses COPY (asyncpg copy_records_to_table) on the session's connection, so
+    the rows share the caller's transaction; falls back to a multi-row INSERT
+    on other drivers. Column defaults are not applied by COPY, so every row
+    must carry the same keys with all required values filled in.
+
+    Args:
+        db: Database session
+        table: Target table (e.g. Meal.__table__)
+        rows: Column values per row
+    """
+    if not rows:
+        return
+
+    conn = await db.connection()
+    if conn.dialect.driver != "asyncpg":
+        await db.execute(insert(table), list(rows))
+        return
+
+    columns = list(rows[0])
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name,
+        records=[tuple(row[column] for column in columns) for row in rows],
+        columns=columns,
+        schema_name=table.schema,
+    )
@@ -0,0 +1,151 @@
+"""
+Service layer for data versions.
+
+Every change to plan or catalog data bumps a version counter in the
+data_version table within the same transaction. Cached read models (see
+app/cache.py) build their keys from the versions of the scopes they depend
+on, so a write invalidates exactly the entries built from the data it
+touched, in every worker process, without any explicit purge.
+
+Scopes:
+- day:YYYY-MM-DD: slots and plan day of one date
+- history: any day changed (the today streak looks back over past days)
+- catalog: meals, meal types, day templates or week plans changed
+- rotation: which meals belong to which meal type changed (round-robin
+  rotations, see services/round_robin.py); always bumped with catalog
+- definitions: day templates or week plans (including the default) changed
+  (cached snapshots, see services/definitions.py); always bumped with catalog
+"""
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import DataVersion
+from .rollup import refresh_daily_rollup
+
+HISTORY_SCOPE = "history"
+CATALOG_SCOPE = "catalog"
+ROTATION_SCOPE = "rotation"
+DEFINITIONS_SCOPE = "definitions"
+
+# Session.info flags: this session changed rotations / plan definitions
+# (see record_rotation_change and record_definition_change)
+ROTATION_CHANGED = "rotation_changed"
+DEFINITIONS_CHANGED = "definitions_changed"
+
+
+def day_scope(day: date) -> str:
+    """Version scope of a single date."""
+    return f"day:{day.isoformat()}"
+
+
+async def bump_versions(db: AsyncSession, scopes: Iterable[str]) -> None:
+    """
+    Increment the versions of the given scopes (creating them at 1).
+
+    Args:
+        db: Database session
+        scopes: Scopes whose data changed
+    """
+    # Sorted so concurrent writers lock version rows in the same order
+    targets = sorted(set(scopes))
+    if not targets:
+        return
+
+    stmt = pg_insert(DataVersion).values([{"scope": scope, "version": 1} for scope in targets])
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[DataVersion.scope],
+            set_={
+                "version": DataVersion.version + 1,
+                "updated_at": datetime.now(timezone.utc),
+            },
+        )
+    )
+
+
+async def get_versions(db: AsyncSession, scopes: Iterable[str]) -> dict[str, int]:
+    """
+    Read the current versions of the given scopes.
+
+    Scopes that have never changed are reported as version 0.
+    """
+    targets = list(scopes)
+    result = await db.execute(
+        select(DataVersion.scope, DataVersion.version).where(DataVersion.scope.in_(targets))
+    )
+    versions = dict.fromkeys(targets, 0)
+    versions.update({row.scope: row.version for row in result.all()})
+    return versions
+
+
+async def record_day_changes(db: AsyncSession, dates: Iterable[date]) -> None:
+    """
+    Record that slots or plan days changed on the given dates.
+
+    Refreshes the daily completion rollup for those dates and bumps their
+    day scopes plus the history scope. Call after flushing the change.
+
+    Args:
+        db: Database session
+        dates: Dates whose slots or plan day changed
+    """
+    changed = sorted(set(dates))
+    if not changed:
+        return
+
+    await refresh_daily_rollup(db, changed)
+    await bump_versions(db, [HISTORY_SCOPE, *(day_scope(d) for d in changed)])
+
+
+async def record_catalog_change(db: AsyncSession) -> None:
+    """Record that a meal, meal type, day template or week plan changed."""
+    await bump_versions(db, [CATALOG_SCOPE])
+
+
+async def record_rotation_change(db: AsyncSession) -> None:
+    """
+    Record that meals were added to, removed from or reordered in a rotation.
+
+    Also a catalog change. The session is flagged so that it stops using
+    cached rotations: its own uncommitted changes would otherwise be cached
+    under a version number that a rollback gives back.
+    """
+    db.info[ROTATION_CHANGED] = True
+    await bump_versions(db, [CATALOG_SCOPE, ROTATION_SCOPE])
+
+
+async def record_definition_change(db: AsyncSession) -> None:
+    """
+    Record that a day template or week plan was created, changed or deleted.
+
+    Also a catalog change. Like record_rotation_change, the session is
+    flagged so that it stops using cached definition snapshots.
+    """
+    db.info[DEFINITIONS_CHANGED] = True
+    await bump_versions(db, [CATALOG_SCOPE, DEFINITIONS_SCOPE])
+
+
+async def today_cache_key(db: AsyncSession, target_date: date) -> str:
+    """Cache key of the TodayResponse for a date (one query)."""
+    versions = await get_versions(db, [day_scope(target_date), HISTORY_SCOPE, CATALOG_SCOPE])
+    return "today:{}:{}".format(target_date.isoformat(), ":".join(map(str, versions.values())))
+
+
+async def week_cache_key(
+    db: AsyncSession, instance_id: UUID, week_start_date: date
+) -> str:
+    """Cache key of the WeeklyPlanInstanceResponse for a week (one query)."""
+    days = [day_scope(week_start_date + timedelta(days=offset)) for offset in range(7)]
+    versions = await get_versions(db, [*days, CATALOG_SCOPE])
+    return "week:{}:{}".format(instance_id, ":".join(map(str, versions.values())))
+
+
+async def stats_cache_key(db: AsyncSession, today: date, days: int) -> str:
+    """Version key of the stats for a period ending today (one query)."""
+    versions = await get_versions(db, [HISTORY_SCOPE, CATALOG_SCOPE])
+    return "stats:{}:{}:{}".format(today.isoformat(), days, ":".join(map(str, versions.values())))
@@ -7,12 +7,14 @@ Per Tech Spec section 4.5 (Setup/Admin Endpoints).
 import logging
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.day_template import DayTemplate, DayTemplateSlot
 from app.models.meal_type import MealType
+from app.services.data_version import record_definition_change
 from app.schemas.day_template import DayTemplateCreate, DayTemplateSlotCreate, DayTemplateUpdate
 
 logger = logging.getLogger(__name__)
@@ -22,31 +24,36 @@ async def list_day_templates(db: AsyncSession) -> list[dict]:
     """
     List all day templates with slot counts and previews.
 
+    Counts and previews are aggregated in the same query as the templates
+    (one round trip however many templates exist).
+
     Returns list of dicts with template info, slot_count, and slot_preview.
     """
-    result = await db.execute(
-        select(DayTemplate).order_by(DayTemplate.name)
+    # Meal type names joined in slot position order
+    slot_preview = func.string_agg(
+        MealType.name,
+        aggregate_order_by(literal_column("' → '"), DayTemplateSlot.position),
     )
-    templates = result.scalars().all()
-
-    items = []
-    for template in templates:
-        # Get meal type names ordered by slot position
-        mt_result = await db.execute(
-            select(MealType.name)
-            .join(DayTemplateSlot, DayTemplateSlot.meal_type_id == MealType.id)
-            .where(DayTemplateSlot.day_template_id == template.id)
-            .order_by(DayTemplateSlot.position)
+    result = await db.execute(
+        select(
+            DayTemplate,
+            func.count(DayTemplateSlot.id).label("slot_count"),
+            slot_preview.label("slot_preview"),
         )
-        meal_type_names = [row[0] for row in mt_result.all()]
-
-        items.append({
-            "template": template,
-            "slot_count": len(meal_type_names),
-            "slot_preview": " → ".join(meal_type_names) if meal_type_names else None,
-        })
+        .outerjoin(DayTemplateSlot, DayTemplateSlot.day_template_id == DayTemplate.id)
+        .outerjoin(MealType, MealType.id == DayTemplateSlot.meal_type_id)
+        .group_by(DayTemplate.id)
+        .order_by(DayTemplate.name)
+    )
 
-    return items
+    return [
+        {
+            "template": row.DayTemplate,
+            "slot_count": row.slot_count,
+            "slot_preview": row.slot_preview,
+        }
+        for row in result.all()
+    ]
 
 
 async def get_day_template_by_id(db: AsyncSession, template_id: UUID) -> DayTemplate | None:
@@ -70,6 +77,7 @@ async def create_day_template(db: AsyncSession, data: DayTemplateCreate) -> DayT
 
     # Create slots
     await _replace_slots(db, template.id, data.slots)
+    await record_definition_change(db)
 
     # Reload with relationships
     return await get_day_template_by_id(db, template.id)
@@ -89,6 +97,7 @@ async def update_day_template(
         await _replace_slots(db, template.id, data.slots)
 
     await db.flush()
+    await record_definition_change(db)
 
     # Capture ID before expunging (async SQLAlchemy can't lazy-load after expire)
     template_id = template.id
@@ -102,6 +111,7 @@ async def delete_day_template(db: AsyncSession, template: DayTemplate) -> None:
     """Delete a day template. Will fail if used by week plan days (RESTRICT)."""
     await db.delete(template)
     await db.flush()
+    await record_definition_change(db)
 
 
 async def _replace_slots(
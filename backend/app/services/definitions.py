@@ -0,0 +1,185 @@
+"""
+Cached snapshots of plan definitions (day templates and week plans).
+
+Week generation, template switches and override clears read the same day
+templates and the default week plan over and over, while these change
+rarely. They are served here as immutable snapshots from a per-process
+cache keyed by the "definitions" data version: the day template and week
+plan services bump it on every change (record_definition_change), so every
+worker reloads on its next lookup. A hit costs one indexed version query
+instead of the selectinload round trips.
+
+API reads of templates and week plans (services/day_templates.py,
+services/week_plans.py) still load ORM objects; they need meal type names
+and are not on the generation path.
+"""
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from ..cache import VersionedCache
+from ..models import DayTemplate, WeekPlan
+from .data_version import DEFINITIONS_CHANGED, DEFINITIONS_SCOPE, get_versions
+
+# Cache key of the default week plan's snapshot
+DEFAULT_WEEK_PLAN_KEY = "default_week_plan"
+
+
+@dataclass(frozen=True)
+class TemplateSlotSnapshot:
+    """One slot of a day template."""
+
+    position: int
+    meal_type_id: UUID
+
+
+@dataclass(frozen=True)
+class DayTemplateSnapshot:
+    """A day template with its slots in position order."""
+
+    id: UUID
+    name: str
+    slots: tuple[TemplateSlotSnapshot, ...]
+
+    @classmethod
+    def from_model(cls, template: DayTemplate) -> "DayTemplateSnapshot":
+        return cls(
+            id=template.id,
+            name=template.name,
+            slots=tuple(
+                TemplateSlotSnapshot(slot.position, slot.meal_type_id)
+                for slot in sorted(template.slots, key=lambda s: s.position)
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class WeekPlanSnapshot:
+    """A week plan with its day template per weekday (0=Monday)."""
+
+    id: UUID
+    name: str
+    is_default: bool
+    day_template_ids: dict[int, UUID]
+
+    @classmethod
+    def from_model(cls, week_plan: WeekPlan) -> "WeekPlanSnapshot":
+        return cls(
+            id=week_plan.id,
+            name=week_plan.name,
+            is_default=week_plan.is_default,
+            day_template_ids={day.weekday: day.day_template_id for day in week_plan.days},
+        )
+
+
+# Snapshots by id (plus the default week plan), valid for one definitions
+# version (one cache per worker process)
+definition_cache = VersionedCache()
+
+
+async def _definitions_version(db: AsyncSession) -> Optional[int]:
+    """
+    Current definitions version, or None if this session must not use the cache.
+
+    Sessions that changed definitions themselves read from the database, so
+    their uncommitted changes are never cached (see record_definition_change).
+    """
+    if db.info.get(DEFINITIONS_CHANGED, False):
+        return None
+    return (await get_versions(db, [DEFINITIONS_SCOPE]))[DEFINITIONS_SCOPE]
+
+
+async def get_day_template_snapshots(
+    db: AsyncSession,
+    template_ids: Iterable[UUID],
+) -> dict[UUID, DayTemplateSnapshot]:
+    """
+    Get day template snapshots by ID.
+
+    One query for the version; templates missing from the cache are loaded
+    together in one more.
+
+    Args:
+        db: Database session
+        template_ids: Templates to look up
+
+    Returns:
+        Dict of template_id -> snapshot (unknown IDs are left out)
+    """
+    wanted = set(template_ids)
+    if not wanted:
+        return {}
+
+    version = await _definitions_version(db)
+    snapshots: dict[UUID, DayTemplateSnapshot] = {}
+    if version is not None:
+        for template_id in wanted:
+            snapshot = definition_cache.get(template_id, version)
+            if snapshot is not None:
+                snapshots[template_id] = snapshot
+
+    missing = wanted - snapshots.keys()
+    if missing:
+        result = await db.execute(
+            select(DayTemplate)
+            .where(DayTemplate.id.in_(missing))
+            .options(selectinload(DayTemplate.slots))
+        )
+        for template in result.scalars().all():
+            snapshot = DayTemplateSnapshot.from_model(template)
+            snapshots[template.id] = snapshot
+            if version is not None:
+                definition_cache.put(template.id, version, snapshot)
+    return snapshots
+
+
+async def get_day_template_snapshot(
+    db: AsyncSession,
+    template_id: UUID,
+) -> Optional[DayTemplateSnapshot]:
+    """Get one day template snapshot, or None if the template doesn't exist."""
+    return (await get_day_template_snapshots(db, [template_id])).get(template_id)
+
+
+async def _load_week_plan_snapshot(db: AsyncSession, *criteria) -> Optional[WeekPlanSnapshot]:
+    result = await db.execute(
+        select(WeekPlan).where(*criteria).options(selectinload(WeekPlan.days))
+    )
+    week_plan = result.scalar_one_or_none()
+    return WeekPlanSnapshot.from_model(week_plan) if week_plan else None
+
+
+async def get_week_plan_snapshot(
+    db: AsyncSession,
+    week_plan_id: UUID,
+) -> Optional[WeekPlanSnapshot]:
+    """Get a week plan snapshot, or None if the plan doesn't exist."""
+    version = await _definitions_version(db)
+    if version is not None:
+        snapshot = definition_cache.get(week_plan_id, version)
+        if snapshot is not None:
+            return snapshot
+
+    snapshot = await _load_week_plan_snapshot(db, WeekPlan.id == week_plan_id)
+    if snapshot is not None and version is not None:
+        definition_cache.put(week_plan_id, version, snapshot)
+    return snapshot
+
+
+async def get_default_week_plan_snapshot(db: AsyncSession) -> Optional[WeekPlanSnapshot]:
+    """Get the default week plan's snapshot, or None if there is no default."""
+    version = await _definitions_version(db)
+    if version is not None:
+        snapshot = definition_cache.get(DEFAULT_WEEK_PLAN_KEY, version)
+        if snapshot is not None:
+            return snapshot
+
+    snapshot = await _load_week_plan_snapshot(db, WeekPlan.is_default.is_(True))
+    if snapshot is not None and version is not None:
+        definition_cache.put(DEFAULT_WEEK_PLAN_KEY, version, snapshot)
+    return snapshot
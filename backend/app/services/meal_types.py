@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.meal_type import MealType
 from app.models.meal_to_meal_type import meal_to_meal_type
+from app.services.data_version import record_catalog_change, record_rotation_change
 from app.schemas.meal_type import MealTypeCreate, MealTypeUpdate
 
 logger = logging.getLogger(__name__)
@@ -73,6 +74,7 @@ async def update_meal_type(db: AsyncSession, meal_type: MealType, data: MealType
         meal_type.tags = data.tags
 
     await db.flush()
+    await record_catalog_change(db)
     await db.refresh(meal_type)
     return meal_type
 
@@ -81,3 +83,4 @@ async def delete_meal_type(db: AsyncSession, meal_type: MealType) -> None:
     """Delete a meal type. Will fail if meal type is used by day template slots (RESTRICT)."""
     await db.delete(meal_type)
     await db.flush()
+    await record_rotation_change(db)
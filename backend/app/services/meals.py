@@ -4,19 +4,34 @@ Service layer for meal operations.
 Handles CRUD operations and CSV parsing/import with meal-type associations.
 Per frozen spec: MEAL_IMPORT_GUIDE.md (for import) and TECH_SPEC_v0.md section 4.5 (for CRUD).
 """
+import asyncio
+import base64
+import binascii
 import csv
 import io
+import itertools
+import json
 import logging
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import and_, delete, func, insert, or_, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.meal import Meal
+from app.models.meal import MEAL_SEARCH_CONFIG, Meal, meal_search_document
 from app.models.meal_type import MealType
 from app.models.meal_to_meal_type import meal_to_meal_type
+from app.models.weekly_plan import WeeklyPlanSlot
+from app.services.bulk import copy_rows
+from app.services.data_version import (
+    record_catalog_change,
+    record_day_changes,
+    record_rotation_change,
+)
+from app.services.rollup import MACRO_SOURCES, refresh_daily_rollup_for_meal
 from app.schemas.meal import (
     MealCreate,
     MealImportError,
@@ -34,13 +49,20 @@ OPTIONAL_COLUMNS = {"calories_kcal", "protein_g", "carbs_g", "sugar_g", "fat_g",
 ALL_COLUMNS = REQUIRED_COLUMNS | OPTIONAL_COLUMNS
 
 
+# Parsed rows are written in batches of this many meals
+IMPORT_BATCH_SIZE = 1000
+
+# Optional numeric columns and their parsers' types
+INT_COLUMNS = ("calories_kcal",)
+DECIMAL_COLUMNS = ("protein_g", "carbs_g", "sugar_g", "fat_g", "saturated_fat_g", "fiber_g")
+
+
 async def _resolve_meal_types(
     db: AsyncSession,
-) -> dict[str, MealType]:
-    """Build a lookup dict of meal type name -> MealType object (case-sensitive)."""
-    result = await db.execute(select(MealType))
-    meal_types = result.scalars().all()
-    return {mt.name: mt for mt in meal_types}
+) -> dict[str, UUID]:
+    """Build a lookup dict of meal type name -> meal type ID (case-sensitive)."""
+    result = await db.execute(select(MealType.id, MealType.name))
+    return {row.name: row.id for row in result.all()}
 
 
 def _parse_optional_int(value: str, field_name: str) -> tuple[int | None, str | None]:
@@ -63,9 +85,59 @@ def _parse_optional_decimal(value: str, field_name: str) -> tuple[Decimal | None
         return None, f"Invalid {field_name} value '{value}', imported with null value"
 
 
+def _parse_meal_row(row: dict[str, str]) -> tuple[dict | None, str | None, list[str]]:
+    """
+    Validate one stripped CSV row.
+
+    Returns (meal column values, error message, warning messages); the values
+    are None when the row has an error and must be skipped.
+    """
+    name = row.get("name", "")
+    portion_description = row.get("portion_description", "")
+
+    if not name:
+        return None, "Missing required field: name", []
+    if not portion_description:
+        return None, "Missing required field: portion_description", []
+
+    row_warnings: list[str] = []
+    values: dict = {"name": name, "portion_description": portion_description}
+
+    for column in INT_COLUMNS:
+        values[column], warning = _parse_optional_int(row.get(column, ""), column)
+        if warning:
+            row_warnings.append(warning)
+
+    for column in DECIMAL_COLUMNS:
+        values[column], warning = _parse_optional_decimal(row.get(column, ""), column)
+        if warning:
+            row_warnings.append(warning)
+
+    values["notes"] = row.get("notes", "") or None
+    return values, None, row_warnings
+
+
+async def _write_import_batch(
+    db: AsyncSession,
+    meal_type_rows: list[dict],
+    meal_rows: list[dict],
+    association_rows: list[dict],
+) -> None:
+    """Persist one batch of parsed rows: new meal types, meals, associations."""
+    if meal_type_rows:
+        await db.execute(insert(MealType), meal_type_rows)
+    await copy_rows(db, Meal.__table__, meal_rows)
+    await copy_rows(db, meal_to_meal_type, association_rows)
+
+
+def _read_rows(reader: csv.DictReader, count: int) -> list[dict]:
+    """Read up to count rows (blocking: runs in a worker thread)."""
+    return list(itertools.islice(reader, count))
+
+
 async def import_meals_from_csv(
     db: AsyncSession,
-    csv_content: str,
+    csv_content: str | Iterable[str],
 ) -> MealImportResult:
     """
     Import meals from CSV content.
@@ -76,9 +148,17 @@ async def import_meals_from_csv(
     - Unknown meal types are automatically created and assigned
     - Missing optional fields result in null values
 
+    The CSV is parsed incrementally, so csv_content may be a text stream (any
+    iterable of lines) as well as a string. The stream is read and parsed in
+    a worker thread, IMPORT_BATCH_SIZE rows at a time, so a file-backed
+    stream never blocks the event loop. Validated rows are written every
+    IMPORT_BATCH_SIZE meals: new meal types with one multi-row INSERT, meals
+    and meal type associations with COPY. Meals get strictly increasing
+    created_at values so they enter the round-robin rotation in file order.
+
     Args:
         db: Database session
-        csv_content: Raw CSV string content (UTF-8)
+        csv_content: CSV content (UTF-8), as a string or a stream of lines
 
     Returns:
         MealImportResult with summary, warnings, and errors
@@ -92,9 +172,11 @@ async def import_meals_from_csv(
     meal_type_lookup = await _resolve_meal_types(db)
 
     # Parse CSV
+    lines = io.StringIO(csv_content) if isinstance(csv_content, str) else csv_content
+    reader = csv.DictReader(lines)
     try:
-        reader = csv.DictReader(io.StringIO(csv_content))
-    except Exception as e:
+        fieldnames = await asyncio.to_thread(getattr, reader, "fieldnames")
+    except csv.Error as e:
         return MealImportResult(
             success=False,
             summary=MealImportSummary(total_rows=0, created=0, skipped=0, warnings=0),
@@ -102,7 +184,7 @@ async def import_meals_from_csv(
         )
 
     # Validate header
-    if reader.fieldnames is None:
+    if fieldnames is None:
         return MealImportResult(
             success=False,
             summary=MealImportSummary(total_rows=0, created=0, skipped=0, warnings=0),
@@ -110,7 +192,7 @@ async def import_meals_from_csv(
         )
 
     # Check required columns exist
-    header_set = {f.strip() for f in reader.fieldnames if f}
+    header_set = {f.strip() for f in fieldnames if f}
     missing_required = REQUIRED_COLUMNS - header_set
     if missing_required:
         return MealImportResult(
@@ -122,123 +204,67 @@ async def import_meals_from_csv(
             )],
         )
 
-    rows = list(reader)
-    total_rows = len(rows)
-
-    # Filter out completely empty rows (trailing blank rows)
-    rows = [row for row in rows if any(v.strip() for v in row.values() if v)]
-
-    for row_idx, row in enumerate(rows):
-        row_num = row_idx + 1  # 1-based row number (excluding header)
-
-        # Strip whitespace from all values
-        row = {k.strip(): (v.strip() if v else "") for k, v in row.items() if k}
-
-        # Validate required fields
-        name = row.get("name", "").strip()
-        portion_description = row.get("portion_description", "").strip()
-
-        if not name:
-            errors.append(MealImportError(
-                row=row_num,
-                message="Missing required field: name",
-            ))
-            continue
-
-        if not portion_description:
-            errors.append(MealImportError(
-                row=row_num,
-                message="Missing required field: portion_description",
-            ))
-            continue
-
-        # Parse optional numeric fields
-        row_warnings: list[str] = []
-
-        calories_kcal, cal_warn = _parse_optional_int(row.get("calories_kcal", ""), "calories_kcal")
-        if cal_warn:
-            row_warnings.append(cal_warn)
-
-        protein_g, pro_warn = _parse_optional_decimal(row.get("protein_g", ""), "protein_g")
-        if pro_warn:
-            row_warnings.append(pro_warn)
-
-        carbs_g, carb_warn = _parse_optional_decimal(row.get("carbs_g", ""), "carbs_g")
-        if carb_warn:
-            row_warnings.append(carb_warn)
-
-        sugar_g, sugar_warn = _parse_optional_decimal(row.get("sugar_g", ""), "sugar_g")
-        if sugar_warn:
-            row_warnings.append(sugar_warn)
-
-        fat_g, fat_warn = _parse_optional_decimal(row.get("fat_g", ""), "fat_g")
-        if fat_warn:
-            row_warnings.append(fat_warn)
-
-        saturated_fat_g, sat_fat_warn = _parse_optional_decimal(row.get("saturated_fat_g", ""), "saturated_fat_g")
-        if sat_fat_warn:
-            row_warnings.append(sat_fat_warn)
-
-        fiber_g, fiber_warn = _parse_optional_decimal(row.get("fiber_g", ""), "fiber_g")
-        if fiber_warn:
-            row_warnings.append(fiber_warn)
-
-        notes = row.get("notes", "").strip() or None
-
-        # Create meal
-        meal = Meal(
-            name=name,
-            portion_description=portion_description,
-            calories_kcal=calories_kcal,
-            protein_g=protein_g,
-            carbs_g=carbs_g,
-            sugar_g=sugar_g,
-            fat_g=fat_g,
-            saturated_fat_g=saturated_fat_g,
-            fiber_g=fiber_g,
-            notes=notes,
-        )
-        db.add(meal)
-        await db.flush()  # Get the meal ID
-
-        # Handle meal type associations
-        meal_types_str = row.get("meal_types", "").strip()
-        if meal_types_str:
-            type_names = [t.strip() for t in meal_types_str.split(",") if t.strip()]
-            for type_name in type_names:
-                mt = meal_type_lookup.get(type_name)
-                if mt is None:
-                    # Auto-create the meal type
-                    mt = MealType(name=type_name)
-                    db.add(mt)
-                    await db.flush()  # Get the ID
-
-                    # Add to lookup for subsequent rows (avoid duplicates in same import)
-                    meal_type_lookup[type_name] = mt
+    base_time = datetime.now(timezone.utc)
+    meal_type_rows: list[dict] = []
+    meal_rows: list[dict] = []
+    association_rows: list[dict] = []
+    total_rows = 0
+
+    while raw_rows := await asyncio.to_thread(_read_rows, reader, IMPORT_BATCH_SIZE):
+        for raw_row in raw_rows:
+            # Skip completely empty rows (trailing blank rows)
+            if not any(v.strip() for v in raw_row.values() if v):
+                continue
+
+            total_rows += 1
+            row_num = total_rows  # 1-based row number among non-empty rows
+
+            # Strip whitespace from all values
+            row = {k.strip(): (v.strip() if v else "") for k, v in raw_row.items() if k}
+
+            values, error, row_warnings = _parse_meal_row(row)
+            if error:
+                errors.append(MealImportError(row=row_num, message=error))
+                continue
+
+            meal_id = uuid4()
+            created_at = base_time + timedelta(microseconds=created_count)
+            meal_rows.append({
+                "id": meal_id,
+                **values,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+
+            # Handle meal type associations
+            type_names = [t.strip() for t in row.get("meal_types", "").split(",") if t.strip()]
+            for type_name in dict.fromkeys(type_names):
+                meal_type_id = meal_type_lookup.get(type_name)
+                if meal_type_id is None:
+                    # Auto-create the meal type (added to lookup for subsequent rows)
+                    meal_type_id = uuid4()
+                    meal_type_lookup[type_name] = meal_type_id
+                    meal_type_rows.append({"id": meal_type_id, "name": type_name})
 
                     # Track creation for info message
-                    if type_name not in created_meal_types:
-                        created_meal_types.append(type_name)
-                        row_warnings.append(
-                            f"Created new meal type: '{type_name}'"
-                        )
-
-                await db.execute(
-                    meal_to_meal_type.insert().values(
-                        meal_id=meal.id,
-                        meal_type_id=mt.id,
-                    )
-                )
-            await db.flush()
+                    created_meal_types.append(type_name)
+                    row_warnings.append(f"Created new meal type: '{type_name}'")
+
+                association_rows.append({"meal_id": meal_id, "meal_type_id": meal_type_id})
 
-        # Add any warnings from this row
-        for warn_msg in row_warnings:
-            warnings.append(MealImportWarning(row=row_num, message=warn_msg))
+            # Add any warnings from this row
+            for warn_msg in row_warnings:
+                warnings.append(MealImportWarning(row=row_num, message=warn_msg))
 
-        created_count += 1
+            created_count += 1
 
-    # Update total_rows to reflect non-empty rows
-    total_rows = len(rows)
+            if len(meal_rows) >= IMPORT_BATCH_SIZE:
+                await _write_import_batch(db, meal_type_rows, meal_rows, association_rows)
+                meal_type_rows, meal_rows, association_rows = [], [], []
+
+    await _write_import_batch(db, meal_type_rows, meal_rows, association_rows)
+    if created_count:
+        await record_rotation_change(db)
 
     return MealImportResult(
         success=True,
@@ -304,6 +330,141 @@ async def list_meals(
     return meals, total
 
 
+# Meal search (picker / library)
+SEARCH_DEFAULT_LIMIT = 30
+SEARCH_MAX_LIMIT = 100
+
+
+def encode_search_cursor(key: list) -> str:
+    """Encode the sort key of the last returned meal as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str, ranked: bool) -> tuple:
+    """
+    Decode a cursor produced by encode_search_cursor.
+
+    Returns (name, id) or, for ranked searches, (rank, name, id).
+
+    Raises:
+        ValueError: If the cursor is malformed or from the other search mode
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if ranked:
+            rank, name, meal_id = key
+            return float(rank), str(name), UUID(meal_id)
+        name, meal_id = key
+        return str(name), UUID(meal_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid search cursor") from e
+
+
+async def search_meals(
+    db: AsyncSession,
+    *,
+    query: str | None = None,
+    meal_type_id: UUID | None = None,
+    limit: int = SEARCH_DEFAULT_LIMIT,
+    cursor: str | None = None,
+    ranked: bool = False,
+    include_total: bool = False,
+) -> tuple[list[Meal], str | None, int | None]:
+    """
+    Search meals with keyset (cursor) pagination.
+
+    By default meals whose name contains the query (case-insensitive) are
+    returned in (name, id) order; the infix match is served by the pg_trgm
+    index on meal.name. With ranked=True, meals also match on full-text
+    terms in the name, portion description and notes, and are ordered by
+    text rank first. Each page continues strictly after the cursor's key,
+    so paging stays cheap however deep it goes and is stable under inserts.
+
+    Args:
+        db: Database session
+        query: Search text; all meals if empty
+        meal_type_id: Only meals assigned to this meal type
+        limit: Maximum meals per page
+        cursor: next_cursor of the previous page
+        ranked: Order by full-text rank instead of name
+        include_total: Also count all matches (one extra query)
+
+    Returns:
+        (meals, next_cursor, total) - next_cursor is None on the last page,
+        total is None unless include_total is set
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    term = (query or "").strip()
+    ranked = ranked and bool(term)
+
+    conditions = []
+    rank = None
+    if term:
+        name_match = Meal.name.icontains(term, autoescape=True)
+        if ranked:
+            ts_query = func.websearch_to_tsquery(text(f"'{MEAL_SEARCH_CONFIG}'::regconfig"), term)
+            document = meal_search_document()
+            rank = func.ts_rank(document, ts_query)
+            conditions.append(or_(document.op("@@")(ts_query), name_match))
+        else:
+            conditions.append(name_match)
+    if meal_type_id:
+        conditions.append(
+            Meal.id.in_(
+                select(meal_to_meal_type.c.meal_id).where(
+                    meal_to_meal_type.c.meal_type_id == meal_type_id
+                )
+            )
+        )
+
+    total = None
+    if include_total:
+        total_result = await db.execute(select(func.count(Meal.id)).where(*conditions))
+        total = total_result.scalar_one()
+
+    page_conditions = list(conditions)
+    if cursor:
+        if ranked:
+            after_rank, after_name, after_id = decode_search_cursor(cursor, ranked=True)
+            page_conditions.append(
+                or_(
+                    rank < after_rank,
+                    and_(rank == after_rank, tuple_(Meal.name, Meal.id) > (after_name, after_id)),
+                )
+            )
+        else:
+            after_name, after_id = decode_search_cursor(cursor, ranked=False)
+            page_conditions.append(tuple_(Meal.name, Meal.id) > (after_name, after_id))
+
+    columns = [Meal] if rank is None else [Meal, rank.label("rank")]
+    order_by = [Meal.name.asc(), Meal.id.asc()]
+    if rank is not None:
+        order_by.insert(0, rank.desc())
+
+    result = await db.execute(
+        select(*columns)
+        .options(selectinload(Meal.meal_types))
+        .where(*page_conditions)
+        .order_by(*order_by)
+        .limit(limit + 1)
+    )
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        key = [last.Meal.name, str(last.Meal.id)]
+        if rank is not None:
+            key.insert(0, last.rank)
+        next_cursor = encode_search_cursor(key)
+
+    return [row.Meal for row in rows], next_cursor, total
+
+
 async def get_meal_by_id(db: AsyncSession, meal_id: UUID) -> Meal | None:
     """Get a single meal by ID with meal_types eagerly loaded."""
     result = await db.execute(
@@ -341,6 +502,7 @@ async def create_meal(db: AsyncSession, data: MealCreate) -> Meal:
                 )
             )
         await db.flush()
+        await record_rotation_change(db)
 
     # Reload with relationships
     await db.refresh(meal)
@@ -393,6 +555,14 @@ async def update_meal(db: AsyncSession, meal: Meal, data: MealUpdate) -> Meal:
 
     await db.flush()
 
+    # Planned days carry this meal's macros in the daily rollup
+    if any(getattr(data, column.key) is not None for column in MACRO_SOURCES.values()):
+        await refresh_daily_rollup_for_meal(db, meal.id)
+    if data.meal_type_ids is not None:
+        await record_rotation_change(db)
+    else:
+        await record_catalog_change(db)
+
     # Expire cached relationships and reload
     db.expire(meal, ["meal_types"])
     result = await db.execute(
@@ -405,5 +575,12 @@ async def update_meal(db: AsyncSession, meal: Meal, data: MealUpdate) -> Meal:
 
 async def delete_meal(db: AsyncSession, meal: Meal) -> None:
     """Delete a meal. Cascades to meal_to_meal_type junction table."""
+    result = await db.execute(
+        select(WeeklyPlanSlot.date).where(WeeklyPlanSlot.meal_id == meal.id).distinct()
+    )
+    planned_dates = result.scalars().all()
+
     await db.delete(meal)
     await db.flush()
+    await record_day_changes(db, planned_dates)
+    await record_rotation_change(db)
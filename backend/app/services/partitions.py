@@ -0,0 +1,158 @@
+"""
+Yearly partitions of the plan history tables.
+
+weekly_plan_instance_day and weekly_plan_slot are range-partitioned by date
+(see app.models.weekly_plan): one partition per calendar year, named
+<table>_<year>, plus <table>_default for dates no yearly partition covers.
+Date-range reads (stats, streaks, rollup refreshes) only scan the years
+they touch, and a year of history can be archived by detaching its
+partition instead of deleting rows.
+
+Partitions for the current and next year are created ahead of time by the
+background scheduler (app.scheduler), so generated weeks land in a yearly
+partition. Rows that reached the DEFAULT partition first (e.g. weeks
+generated while the scheduler was disabled) are moved into the yearly
+partition when it is created. Archival (app.services.archive) drops the
+partitions of years it has fully archived with drop_year_partitions.
+
+Detaching a partition locks its parent table ACCESS EXCLUSIVE until the
+transaction ends: it waits for every running read of the plan history, and
+reads queue up behind it. DETACH PARTITION ... CONCURRENTLY would avoid
+that, but Postgres refuses it on a table with a DEFAULT partition, as ours
+have. drop_year_partitions therefore waits at most
+PARTITION_DROP_LOCK_TIMEOUT for the locks and otherwise leaves the year for
+a later run.
+"""
+from collections.abc import Iterable
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Tables partitioned by year of their date column
+PARTITIONED_TABLES = ("weekly_plan_instance_day", "weekly_plan_slot")
+
+# Years after the current one that get their partitions in advance
+PARTITION_YEARS_AHEAD = 1
+
+# Longest wait for the parent table locks when dropping a year's partitions
+PARTITION_DROP_LOCK_TIMEOUT = "1s"
+
+# SQLSTATE of lock_not_available, raised when lock_timeout expires
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def partition_name(table: str, year: int) -> str:
+    """Name of a table's partition for a year."""
+    return f"{table}_{year}"
+
+
+async def get_partition_years(db: AsyncSession, table: str) -> set[int]:
+    """Years with a partition of the table (the DEFAULT partition is left out)."""
+    result = await db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+    prefix = f"{table}_"
+    return {
+        int(name[len(prefix):])
+        for name in result.scalars()
+        if name.startswith(prefix) and name[len(prefix):].isdigit()
+    }
+
+
+async def create_year_partition(db: AsyncSession, table: str, year: int) -> None:
+    """
+    Create a table's partition for a year.
+
+    The partition is built as a plain table, filled with the year's rows from
+    the DEFAULT partition, then attached, since Postgres refuses to create a
+    partition whose rows still sit in the DEFAULT partition. Attaching adds
+    the parent's indexes and foreign keys to it.
+    """
+    name = partition_name(table, year)
+    bounds = {"start": date(year, 1, 1), "end": date(year + 1, 1, 1)}
+    await db.execute(text(
+        f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    await db.execute(
+        text(
+            f"WITH moved AS ("
+            f"DELETE FROM {table}_default WHERE date >= :start AND date < :end RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved"
+        ),
+        bounds,
+    )
+    await db.execute(text(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+    ))
+
+
+async def drop_year_partition(db: AsyncSession, table: str, year: int) -> None:
+    """Detach a table's partition for a year and drop it with its rows."""
+    name = partition_name(table, year)
+    await db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    await db.execute(text(f"DROP TABLE {name}"))
+
+
+async def drop_year_partitions(db: AsyncSession, year: int) -> bool:
+    """
+    Drop every partitioned table's partition for a year, or none of them.
+
+    The drops run in a savepoint with lock_timeout set to
+    PARTITION_DROP_LOCK_TIMEOUT. If a parent table lock is not granted in
+    time, the savepoint is rolled back and the partitions stay. Once granted,
+    the ACCESS EXCLUSIVE locks are held until the caller's transaction ends.
+
+    Returns:
+        Whether the partitions were dropped
+    """
+    set_lock_timeout = text("SELECT set_config('lock_timeout', :timeout, true)")
+    previous = await db.scalar(text("SELECT current_setting('lock_timeout')"))
+    try:
+        async with db.begin_nested():
+            await db.execute(set_lock_timeout, {"timeout": PARTITION_DROP_LOCK_TIMEOUT})
+            for table in PARTITIONED_TABLES:
+                await drop_year_partition(db, table, year)
+    except DBAPIError as exc:
+        if getattr(exc.orig, "sqlstate", None) != LOCK_NOT_AVAILABLE:
+            raise
+        return False
+    finally:
+        await db.execute(set_lock_timeout, {"timeout": previous})
+    return True
+
+
+async def ensure_year_partitions(db: AsyncSession, years: Iterable[int]) -> list[str]:
+    """
+    Create the missing partitions of every partitioned table for the years.
+
+    Callers must keep other sessions from doing the same concurrently (the
+    scheduler runs under its advisory lock).
+
+    Returns:
+        Names of the partitions created
+    """
+    wanted = sorted(set(years))
+    created = []
+    for table in PARTITIONED_TABLES:
+        existing = await get_partition_years(db, table)
+        for year in wanted:
+            if year not in existing:
+                await create_year_partition(db, table, year)
+                created.append(partition_name(table, year))
+    return created
+
+
+async def ensure_upcoming_partitions(db: AsyncSession, today: Optional[date] = None) -> list[str]:
+    """Create the partitions for the current year and PARTITION_YEARS_AHEAD more."""
+    year = (today or date.today()).year
+    return await ensure_year_partitions(db, range(year, year + PARTITION_YEARS_AHEAD + 1))
@@ -0,0 +1,206 @@
+"""
+Service layer for the daily completion rollup.
+
+The daily_completion_rollup table holds one pre-aggregated row per day
+(slot counts by completion status, override flag, per-day macro sums).
+Every service that changes slots, plan days or meal macros calls
+refresh_daily_rollup for the dates it touched; the row for each date is then
+recomputed from the raw weekly_plan_slot / weekly_plan_instance_day rows in a
+single INSERT ... SELECT ... ON CONFLICT statement. Recomputing a whole day
+(a handful of slots) keeps the rollup exact without tracking deltas.
+
+rebuild_daily_rollup recomputes a date range (or everything) for backfills,
+see app/rebuild_rollup.py.
+
+Dates whose week was archived (app/services/archive.py) have no live rows
+left; their rollup rows were refreshed at archival and are kept as they are.
+"""
+import logging
+from collections.abc import Iterable
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import and_, delete, exists, false, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import WeeklyPlanArchiveDay
+from app.models.daily_rollup import DailyCompletionRollup
+from app.models.meal import Meal
+from app.models.weekly_plan import WeeklyPlanInstanceDay, WeeklyPlanSlot
+
+logger = logging.getLogger(__name__)
+
+COMPLETION_STATUSES = ("followed", "adjusted", "skipped", "replaced", "social")
+
+# Rollup macro column -> meal column summed into it
+MACRO_SOURCES = {
+    "calories": Meal.calories_kcal,
+    "protein": Meal.protein_g,
+    "carbs": Meal.carbs_g,
+    "sugar": Meal.sugar_g,
+    "fat": Meal.fat_g,
+    "saturated_fat": Meal.saturated_fat_g,
+    "fiber": Meal.fiber_g,
+}
+
+ROLLUP_COLUMNS = (
+    "date",
+    "total",
+    "unmarked",
+    *COMPLETION_STATUSES,
+    "is_override",
+    *MACRO_SOURCES,
+    "updated_at",
+)
+
+
+def _rollup_source(slot_filter, day_filter):
+    """
+    Build the per-day aggregate SELECT feeding the rollup.
+
+    Slots and plan days are aggregated separately and full-outer-joined on
+    date, so days with slots but no day record (and vice versa) are kept.
+    """
+    # count(*) rather than count(id): every row is a slot, and the slot side
+    # then reads only columns of ix_weekly_plan_slot_date_covering
+    slot_counts = [
+        func.count().label("total"),
+        func.count().filter(WeeklyPlanSlot.completion_status.is_(None)).label("unmarked"),
+    ] + [
+        func.count().filter(WeeklyPlanSlot.completion_status == status).label(status)
+        for status in COMPLETION_STATUSES
+    ]
+    slot_agg = (
+        select(
+            WeeklyPlanSlot.date.label("date"),
+            *slot_counts,
+            *[func.sum(column).label(name) for name, column in MACRO_SOURCES.items()],
+        )
+        .outerjoin(Meal, Meal.id == WeeklyPlanSlot.meal_id)
+        .where(slot_filter)
+        .group_by(WeeklyPlanSlot.date)
+        .subquery("slot_agg")
+    )
+    day_agg = (
+        select(
+            WeeklyPlanInstanceDay.date.label("date"),
+            func.bool_or(WeeklyPlanInstanceDay.is_override).label("is_override"),
+        )
+        .where(day_filter)
+        .group_by(WeeklyPlanInstanceDay.date)
+        .subquery("day_agg")
+    )
+
+    joined = slot_agg.join(day_agg, slot_agg.c.date == day_agg.c.date, full=True)
+    return select(
+        func.coalesce(slot_agg.c.date, day_agg.c.date),
+        *[
+            func.coalesce(slot_agg.c[name], 0)
+            for name in ("total", "unmarked", *COMPLETION_STATUSES)
+        ],
+        func.coalesce(day_agg.c.is_override, false()),
+        *[slot_agg.c[name] for name in MACRO_SOURCES],
+        func.now(),
+    ).select_from(joined)
+
+
+def _upsert_from(source):
+    """INSERT the source rows into the rollup, replacing existing dates."""
+    stmt = pg_insert(DailyCompletionRollup).from_select(list(ROLLUP_COLUMNS), source)
+    return stmt.on_conflict_do_update(
+        index_elements=[DailyCompletionRollup.date],
+        set_={name: stmt.excluded[name] for name in ROLLUP_COLUMNS if name != "date"},
+    )
+
+
+def _has_source_rows():
+    """Correlated check: does the rollup row's date still have slots, a day record or an archived day?"""
+    return or_(
+        exists().where(WeeklyPlanSlot.date == DailyCompletionRollup.date),
+        exists().where(WeeklyPlanInstanceDay.date == DailyCompletionRollup.date),
+        exists().where(WeeklyPlanArchiveDay.date == DailyCompletionRollup.date),
+    )
+
+
+async def refresh_daily_rollup(db: AsyncSession, dates: Iterable[date]) -> None:
+    """
+    Recompute the rollup rows for the given dates.
+
+    Call after flushing any change to slots, plan days or the meals they
+    reference. Dates that no longer have slots or a plan day are removed.
+
+    Args:
+        db: Database session
+        dates: Dates whose rows should be recomputed
+    """
+    target_dates = sorted(set(dates))
+    if not target_dates:
+        return
+
+    await db.execute(_upsert_from(_rollup_source(
+        WeeklyPlanSlot.date.in_(target_dates),
+        WeeklyPlanInstanceDay.date.in_(target_dates),
+    )))
+    await db.execute(
+        delete(DailyCompletionRollup).where(
+            and_(
+                DailyCompletionRollup.date.in_(target_dates),
+                ~_has_source_rows(),
+            )
+        )
+    )
+
+
+async def refresh_daily_rollup_for_meal(db: AsyncSession, meal_id: UUID) -> None:
+    """Recompute the rollup rows of every day that has a slot with this meal."""
+    result = await db.execute(
+        select(WeeklyPlanSlot.date).where(WeeklyPlanSlot.meal_id == meal_id).distinct()
+    )
+    await refresh_daily_rollup(db, result.scalars().all())
+
+
+async def rebuild_daily_rollup(
+    db: AsyncSession,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> int:
+    """
+    Recompute the rollup for a date range (inclusive), or for all dates.
+
+    Used for backfills and after bulk data fixes that bypass the services.
+
+    Args:
+        db: Database session
+        start_date: First date to rebuild; unbounded if None
+        end_date: Last date to rebuild; unbounded if None
+
+    Returns:
+        Number of rollup rows written
+    """
+    def in_range(column):
+        conditions = []
+        if start_date is not None:
+            conditions.append(column >= start_date)
+        if end_date is not None:
+            conditions.append(column <= end_date)
+        return and_(literal(True), *conditions)
+
+    result = await db.execute(_upsert_from(_rollup_source(
+        in_range(WeeklyPlanSlot.date),
+        in_range(WeeklyPlanInstanceDay.date),
+    )))
+    written = result.rowcount
+
+    await db.execute(
+        delete(DailyCompletionRollup).where(
+            and_(in_range(DailyCompletionRollup.date), ~_has_source_rows())
+        )
+    )
+    logger.info(
+        "Rebuilt daily rollup for %s..%s: %d rows",
+        start_date or "start",
+        end_date or "end",
+        written,
+    )
+    return written
@@ -11,17 +11,28 @@ Key properties (ADR-002):
 - Extensible: New meals automatically enter rotation
 - Resilient: Deleted meals don't break state
 
+Advancing is concurrency-safe: every advance locks the meal type's
+round_robin_state row (SELECT ... FOR UPDATE) before reading it, so parallel
+generate / switch-template / clear-override requests queue up per meal type
+instead of picking the same "next" meal and losing an advance.
+
 See Tech Spec section 3.1 for full specification.
 """
-from datetime import datetime, timezone
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import literal_column, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from ..cache import VersionedCache
 from ..models import Meal, MealType, RoundRobinState
 from ..models.meal_to_meal_type import meal_to_meal_type
+from .data_version import ROTATION_CHANGED, ROTATION_SCOPE, get_versions
 
 
 async def get_meals_for_type(
@@ -41,14 +52,116 @@ async def get_meals_for_type(
     Returns:
         List of Meal objects ordered by (created_at, id)
     """
-    stmt = (
+    result = await db.execute(_rotation_select(meal_type_id))
+    return list(result.scalars().all())
+
+
+def _rotation_select(meal_type_id: UUID):
+    """Meals of a type in rotation order: (created_at ASC, id ASC)."""
+    return (
         select(Meal)
         .join(meal_to_meal_type, Meal.id == meal_to_meal_type.c.meal_id)
         .where(meal_to_meal_type.c.meal_type_id == meal_type_id)
         .order_by(Meal.created_at.asc(), Meal.id.asc())
     )
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+
+
+def _successor_statement(meal_type_id: UUID, last_meal_id):
+    """
+    Single statement returning the meal that follows last_meal_id in rotation.
+
+    Two index probes, each LIMIT 1: the first meal after the last meal's
+    (created_at, id) position, and the first meal of the rotation (the
+    wraparound). The first probe finds nothing when there is no last meal,
+    when it was the final meal, or when it is no longer assigned to the type,
+    which gives exactly the restart-at-first behaviour of the list scan.
+
+    Args:
+        meal_type_id: UUID of the meal type
+        last_meal_id: Last meal (a UUID, None, or a SQL expression)
+    """
+    last_meal = aliased(Meal, name="last_meal")
+    last_mtm = meal_to_meal_type.alias("last_mtm")
+    last_position = (
+        select(last_meal.created_at, last_meal.id)
+        .join(last_mtm, last_mtm.c.meal_id == last_meal.id)
+        .where(last_mtm.c.meal_type_id == meal_type_id, last_meal.id == last_meal_id)
+        .scalar_subquery()
+    )
+    after_last = (
+        _rotation_select(meal_type_id)
+        .add_columns(literal_column("0").label("wrapped"))
+        .where(tuple_(Meal.created_at, Meal.id) > last_position)
+        .limit(1)
+    )
+    first = _rotation_select(meal_type_id).add_columns(literal_column("1").label("wrapped")).limit(1)
+
+    candidates = union_all(after_last, first).order_by("wrapped").limit(1)
+    return select(Meal).from_statement(candidates)
+
+
+@dataclass(frozen=True, eq=False)
+class Rotation:
+    """A meal type's rotation: meal ids in rotation order and their positions."""
+
+    meal_ids: tuple[UUID, ...]
+    positions: dict[UUID, int]
+
+    @classmethod
+    def from_ids(cls, meal_ids: Iterable[UUID]) -> "Rotation":
+        ids = tuple(meal_ids)
+        return cls(ids, {meal_id: i for i, meal_id in enumerate(ids)})
+
+    def successor(self, last_meal_id: Optional[UUID]) -> Optional[UUID]:
+        """
+        The meal id after last_meal_id, wrapping around; None if empty.
+
+        No last meal, or one no longer in the rotation, starts at the first meal.
+        """
+        if not self.meal_ids:
+            return None
+        if last_meal_id is None:
+            return self.meal_ids[0]
+        last_index = self.positions.get(last_meal_id, -1)
+        return self.meal_ids[(last_index + 1) % len(self.meal_ids)]
+
+
+# Rotations by meal type, valid for one rotation version (one cache per worker process)
+rotation_cache = VersionedCache()
+
+
+async def get_successor_meal(
+    db: AsyncSession,
+    meal_type_id: UUID,
+    last_meal_id: Optional[UUID],
+) -> Optional[Meal]:
+    """
+    Get the meal that follows last_meal_id in a meal type's rotation.
+
+    When the type's rotation is cached for the current rotation version
+    (see get_rotations), the successor is found in it in O(1) and only the
+    chosen meal is loaded (from the identity map when already present).
+    Otherwise, and in sessions that changed rotations themselves (see
+    record_rotation_change), the successor is computed in the database with
+    one indexed statement, so a single lookup never loads the rotation.
+
+    Args:
+        db: Database session
+        meal_type_id: UUID of the meal type
+        last_meal_id: Last selected meal; None starts at the first meal
+
+    Returns:
+        The next Meal in rotation, or None if the type has no meals
+    """
+    if not db.info.get(ROTATION_CHANGED, False):
+        version = (await get_versions(db, [ROTATION_SCOPE]))[ROTATION_SCOPE]
+        rotation = rotation_cache.get(meal_type_id, version)
+        if rotation is not None:
+            next_meal_id = rotation.successor(last_meal_id)
+            return await db.get(Meal, next_meal_id) if next_meal_id else None
+
+    result = await db.execute(_successor_statement(meal_type_id, last_meal_id))
+    return result.scalars().first()
 
 
 async def get_round_robin_state(
@@ -80,8 +193,8 @@ async def update_round_robin_state(
     """
     Update or create the round-robin state for a meal type.
 
-    This is an upsert operation: if state exists, it's updated;
-    otherwise, a new state record is created.
+    This is a single INSERT ... ON CONFLICT DO UPDATE, so concurrent callers
+    never collide on creating the row.
 
     Args:
         db: Database session
@@ -91,23 +204,63 @@ async def update_round_robin_state(
     Returns:
         The updated or created RoundRobinState
     """
-    state = await get_round_robin_state(db, meal_type_id)
+    stmt = pg_insert(RoundRobinState).values(
+        meal_type_id=meal_type_id,
+        last_meal_id=meal_id,
+        updated_at=datetime.now(timezone.utc),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RoundRobinState.meal_type_id],
+        set_={
+            "last_meal_id": stmt.excluded.last_meal_id,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    ).returning(RoundRobinState)
+    result = await db.scalars(stmt, execution_options={"populate_existing": True})
+    return result.one()
+
+
+async def lock_round_robin_states(
+    db: AsyncSession,
+    meal_type_ids: Iterable[UUID],
+) -> dict[UUID, RoundRobinState]:
+    """
+    Load the round-robin states of meal types, locked until the transaction ends.
 
-    now = datetime.now(timezone.utc)
+    Missing state rows are created first (with no last meal, which selection
+    treats exactly like having no state) so that there is always a row to
+    lock. A concurrent transaction advancing the same meal type then waits
+    for this one to commit and reads the state it left. Rows are locked in
+    meal_type_id order so that batches over overlapping types cannot deadlock.
 
-    if state:
-        state.last_meal_id = meal_id
-        state.updated_at = now
-    else:
-        state = RoundRobinState(
-            meal_type_id=meal_type_id,
-            last_meal_id=meal_id,
-            updated_at=now,
-        )
-        db.add(state)
+    Args:
+        db: Database session
+        meal_type_ids: UUIDs of the meal types about to be advanced
 
-    await db.flush()
-    return state
+    Returns:
+        Dict of meal_type_id -> locked RoundRobinState
+    """
+    type_ids = sorted(set(meal_type_ids))
+    if not type_ids:
+        return {}
+
+    now = datetime.now(timezone.utc)
+    await db.execute(
+        pg_insert(RoundRobinState)
+        .values([
+            {"meal_type_id": type_id, "last_meal_id": None, "updated_at": now}
+            for type_id in type_ids
+        ])
+        .on_conflict_do_nothing(index_elements=[RoundRobinState.meal_type_id])
+    )
+    result = await db.execute(
+        select(RoundRobinState)
+        .where(RoundRobinState.meal_type_id.in_(type_ids))
+        .order_by(RoundRobinState.meal_type_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return {state.meal_type_id: state for state in result.scalars().all()}
 
 
 async def get_next_meal_for_type(
@@ -118,11 +271,17 @@ async def get_next_meal_for_type(
     Select the next meal for a meal type using round-robin rotation.
 
     This is the core algorithm that provides deterministic meal selection:
-    1. Get all meals for the type, ordered by (created_at ASC, id ASC)
+    1. Order the type's meals by (created_at ASC, id ASC)
     2. Find the last-used meal from round-robin state
     3. Return the next meal in sequence (wrapping to start if needed)
     4. Update state with the selected meal
 
+    Steps 1-3 use the cached rotation when it is current, otherwise a
+    single indexed statement (see get_successor_meal); the state row stays locked until
+    the transaction ends (see lock_round_robin_states), so concurrent
+    callers get consecutive meals. A meal type without a state row only
+    gets one once it has a meal to rotate through.
+
     Edge cases handled:
     - No meals: Returns None
     - One meal: Always returns that meal
@@ -137,39 +296,25 @@ async def get_next_meal_for_type(
     Returns:
         The next Meal in rotation, or None if no meals available
     """
-    meals = await get_meals_for_type(db, meal_type_id)
-
-    if not meals:
+    state = await db.scalar(
+        select(RoundRobinState)
+        .where(RoundRobinState.meal_type_id == meal_type_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    if state is None:
+        # Don't leave a state row behind for a meal type without meals
+        if await get_successor_meal(db, meal_type_id, None) is None:
+            return None
+        state = (await lock_round_robin_states(db, [meal_type_id]))[meal_type_id]
+
+    next_meal = await get_successor_meal(db, meal_type_id, state.last_meal_id)
+    if next_meal is None:
         return None
 
-    if len(meals) == 1:
-        # Single meal - always return it, update state
-        await update_round_robin_state(db, meal_type_id, meals[0].id)
-        return meals[0]
-
-    # Get current state
-    state = await get_round_robin_state(db, meal_type_id)
-
-    if state is None or state.last_meal_id is None:
-        # No state - start with first meal
-        next_meal = meals[0]
-    else:
-        # Find index of last used meal
-        last_index = -1
-        for i, meal in enumerate(meals):
-            if meal.id == state.last_meal_id:
-                last_index = i
-                break
-
-        # Compute next index:
-        # - If last meal was deleted (not found, last_index=-1), next_index becomes 0
-        # - Otherwise, advance to next meal with wraparound
-        next_index = (last_index + 1) % len(meals)
-        next_meal = meals[next_index]
-
-    # Update state with selected meal
-    await update_round_robin_state(db, meal_type_id, next_meal.id)
-
+    state.last_meal_id = next_meal.id
+    state.updated_at = datetime.now(timezone.utc)
+    await db.flush()
     return next_meal
 
 
@@ -190,28 +335,10 @@ async def peek_next_meal_for_type(
     Returns:
         The next Meal in rotation, or None if no meals available
     """
-    meals = await get_meals_for_type(db, meal_type_id)
-
-    if not meals:
-        return None
-
-    if len(meals) == 1:
-        return meals[0]
-
     state = await get_round_robin_state(db, meal_type_id)
-
-    if state is None or state.last_meal_id is None:
-        return meals[0]
-
-    # Find index of last used meal
-    last_index = -1
-    for i, meal in enumerate(meals):
-        if meal.id == state.last_meal_id:
-            last_index = i
-            break
-
-    next_index = (last_index + 1) % len(meals)
-    return meals[next_index]
+    return await get_successor_meal(
+        db, meal_type_id, state.last_meal_id if state else None
+    )
 
 
 async def reset_round_robin_state(
@@ -232,3 +359,218 @@ async def reset_round_robin_state(
     if state:
         await db.delete(state)
         await db.flush()
+
+
+# =============================================================================
+# Batch allocation
+# =============================================================================
+
+
+async def get_meals_for_types(
+    db: AsyncSession,
+    meal_type_ids: Iterable[UUID],
+) -> dict[UUID, list[Meal]]:
+    """
+    Get the ordered meal rotation for several meal types in one query.
+
+    Each list uses the same (created_at ASC, id ASC) ordering as
+    get_meals_for_type. Meal types without meals map to an empty list.
+
+    Args:
+        db: Database session
+        meal_type_ids: UUIDs of the meal types to load
+
+    Returns:
+        Dict of meal_type_id -> ordered list of Meal objects
+    """
+    type_ids = set(meal_type_ids)
+    rotations: dict[UUID, list[Meal]] = {type_id: [] for type_id in type_ids}
+    if not type_ids:
+        return rotations
+
+    stmt = (
+        select(meal_to_meal_type.c.meal_type_id, Meal)
+        .join(meal_to_meal_type, Meal.id == meal_to_meal_type.c.meal_id)
+        .where(meal_to_meal_type.c.meal_type_id.in_(type_ids))
+        .order_by(Meal.created_at.asc(), Meal.id.asc())
+    )
+    result = await db.execute(stmt)
+    for meal_type_id, meal in result.all():
+        rotations[meal_type_id].append(meal)
+    return rotations
+
+
+async def get_rotations(
+    db: AsyncSession,
+    meal_type_ids: Iterable[UUID],
+) -> dict[UUID, Rotation]:
+    """
+    Get the rotations of several meal types, from the cache when current.
+
+    One query for the rotation version; the ordered meal ids of the types
+    not cached yet are loaded together in one more query and cached for
+    later lookups (including get_successor_meal). Sessions that changed
+    rotations themselves always load them (see record_rotation_change).
+
+    Args:
+        db: Database session
+        meal_type_ids: UUIDs of the meal types to load
+
+    Returns:
+        Dict of meal_type_id -> Rotation (empty if the type has no meals)
+    """
+    type_ids = set(meal_type_ids)
+    if not type_ids:
+        return {}
+
+    rotations: dict[UUID, Rotation] = {}
+    bypass = db.info.get(ROTATION_CHANGED, False)
+    if not bypass:
+        version = (await get_versions(db, [ROTATION_SCOPE]))[ROTATION_SCOPE]
+        for type_id in type_ids:
+            rotation = rotation_cache.get(type_id, version)
+            if rotation is not None:
+                rotations[type_id] = rotation
+
+    missing = type_ids - rotations.keys()
+    if missing:
+        result = await db.execute(
+            select(meal_to_meal_type.c.meal_type_id, Meal.id)
+            .join(meal_to_meal_type, Meal.id == meal_to_meal_type.c.meal_id)
+            .where(meal_to_meal_type.c.meal_type_id.in_(missing))
+            .order_by(Meal.created_at.asc(), Meal.id.asc())
+        )
+        meal_ids: dict[UUID, list[UUID]] = {type_id: [] for type_id in missing}
+        for meal_type_id, meal_id in result.all():
+            meal_ids[meal_type_id].append(meal_id)
+        for type_id, ids in meal_ids.items():
+            rotations[type_id] = Rotation.from_ids(ids)
+            if not bypass:
+                rotation_cache.put(type_id, version, rotations[type_id])
+    return rotations
+
+
+class RoundRobinAllocator:
+    """
+    In-memory round-robin cursor over several meal types.
+
+    Loads each meal type's rotation (meal ids only) and (locked) state once,
+    hands out meal ids with exactly the same sequence as repeated
+    get_next_meal_for_type calls, in O(1) per slot, and writes the final
+    state back once per meal type in save().
+
+    Usage:
+        allocator = await RoundRobinAllocator.load(db, meal_type_ids)
+        meal_id = allocator.next_meal_id(meal_type_id)
+        ...
+        await allocator.save(db)
+    """
+
+    def __init__(
+        self,
+        rotations: dict[UUID, Rotation],
+        states: dict[UUID, RoundRobinState],
+    ):
+        self._rotations = rotations
+        self._states = states
+        self._last_meal_ids: dict[UUID, Optional[UUID]] = {
+            type_id: state.last_meal_id for type_id, state in states.items()
+        }
+        self._dirty: set[UUID] = set()
+
+    @classmethod
+    async def load(
+        cls,
+        db: AsyncSession,
+        meal_type_ids: Iterable[UUID],
+    ) -> "RoundRobinAllocator":
+        """
+        Load rotations and lock the states of the given meal types.
+
+        Meal types with meals get their state row locked (and created if
+        missing) until the transaction ends, so the allocator's view of the
+        state cannot go stale before save(). Rotations come from the cache
+        (see get_rotations): three queries on a hit, four on a miss,
+        and no state queries if no meal type has meals.
+        """
+        rotations = await get_rotations(db, meal_type_ids)
+        states = await lock_round_robin_states(
+            db, [type_id for type_id, rotation in rotations.items() if rotation.meal_ids]
+        )
+        return cls(rotations, states)
+
+    def next_meal_id(self, meal_type_id: UUID) -> Optional[UUID]:
+        """
+        Select the next meal for a meal type and advance the in-memory state.
+
+        Mirrors get_next_meal_for_type: no meals returns None (state untouched),
+        missing state or a last meal no longer in the rotation restarts at the
+        first meal, otherwise the rotation advances with wraparound.
+        """
+        rotation = self._rotations.get(meal_type_id)
+        if rotation is None:
+            return None
+        next_meal_id = rotation.successor(self._last_meal_ids.get(meal_type_id))
+        if next_meal_id is None:
+            return None
+
+        self._last_meal_ids[meal_type_id] = next_meal_id
+        self._dirty.add(meal_type_id)
+        return next_meal_id
+
+    async def save(self, db: AsyncSession) -> None:
+        """Persist the final state of every advanced meal type in one flush."""
+        if not self._dirty:
+            return
+
+        now = datetime.now(timezone.utc)
+        for meal_type_id in self._dirty:
+            last_meal_id = self._last_meal_ids[meal_type_id]
+            state = self._states.get(meal_type_id)
+            if state:
+                state.last_meal_id = last_meal_id
+                state.updated_at = now
+            else:
+                state = RoundRobinState(
+                    meal_type_id=meal_type_id,
+                    last_meal_id=last_meal_id,
+                    updated_at=now,
+                )
+                db.add(state)
+                self._states[meal_type_id] = state
+
+        await db.flush()
+        self._dirty.clear()
+
+
+async def allocate_meals(
+    db: AsyncSession,
+    demands: Sequence[tuple[date, int, UUID]],
+) -> dict[tuple[date, int], Optional[UUID]]:
+    """
+    Assign meals to a batch of slots using round-robin rotation.
+
+    Demands are processed in the given order, so passing them sorted by
+    (date, position) yields the same assignments as calling
+    get_next_meal_for_type once per slot. Selection runs over meal ids in
+    memory and no meal rows are loaded, so the number of queries is
+    constant regardless of how many slots are requested.
+
+    Args:
+        db: Database session
+        demands: Ordered (date, position, meal_type_id) tuples
+
+    Returns:
+        Dict of (date, position) -> assigned meal id, or None if the meal
+        type has no meals
+    """
+    allocator = await RoundRobinAllocator.load(
+        db, {meal_type_id for _, _, meal_type_id in demands}
+    )
+
+    assignments: dict[tuple[date, int], Optional[UUID]] = {}
+    for slot_date, position, meal_type_id in demands:
+        assignments[(slot_date, position)] = allocator.next_meal_id(meal_type_id)
+
+    await allocator.save(db)
+    return assignments
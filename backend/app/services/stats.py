@@ -6,31 +6,47 @@ and daily data points for the Stats view.
 
 Adherence formula (from Tech Spec section 4.3):
     (followed + adjusted) / (total - social - unmarked)
+
+Per-day figures come from the daily_completion_rollup table (one row per
+day, see services/rollup.py), read once per request for the streak lookback
+window; only the per-meal-type breakdown reads slots, live ones together
+with those of archived weeks (services/archive.py).
 """
 import logging
-from collections import defaultdict
 from datetime import date, timedelta
 from decimal import ROUND_HALF_UP, Decimal
-from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, select, true, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.archive import WeeklyPlanArchiveDay
+from app.models.daily_rollup import DailyCompletionRollup
 from app.models.meal_type import MealType
-from app.models.weekly_plan import (
-    WeeklyPlanInstance,
-    WeeklyPlanInstanceDay,
-    WeeklyPlanSlot,
-)
-from app.schemas.stats import (
-    DailyAdherence,
-    MealTypeAdherence,
-    StatsResponse,
-    StatusBreakdown,
+from app.models.weekly_plan import WeeklyPlanSlot
+from app.schemas.payloads import (
+    DailyAdherencePayload,
+    MealTypeAdherencePayload,
+    StatsPayload,
+    StatusBreakdownPayload,
 )
+from app.services.archive import archived_slots
 
 logger = logging.getLogger(__name__)
 
+# Streaks look back this many days (inclusive of today)
+STREAK_LOOKBACK_DAYS = 365
+
+# StatsPayload average field -> (rollup column, rounding quantum)
+AVG_DAILY_MACROS = {
+    "avg_daily_calories": ("calories", Decimal("1")),
+    "avg_daily_protein": ("protein", Decimal("0.1")),
+    "avg_daily_carbs": ("carbs", Decimal("0.1")),
+    "avg_daily_sugar": ("sugar", Decimal("0.1")),
+    "avg_daily_fat": ("fat", Decimal("0.1")),
+    "avg_daily_saturated_fat": ("saturated_fat", Decimal("0.1")),
+    "avg_daily_fiber": ("fiber", Decimal("0.1")),
+}
+
 
 def _adherence_rate(followed: int, adjusted: int, total: int, social: int, unmarked: int) -> Decimal:
     """Calculate adherence rate. Returns 0 if denominator is zero."""
@@ -41,7 +57,7 @@ def _adherence_rate(followed: int, adjusted: int, total: int, social: int, unmar
     return rate.quantize(Decimal("0.001"), rounding=ROUND_HALF_UP)
 
 
-async def get_stats(db: AsyncSession, days: int) -> StatsResponse:
+async def get_stats(db: AsyncSession, days: int) -> StatsPayload:
     """
     Calculate adherence statistics for the given period.
 
@@ -50,56 +66,30 @@ async def get_stats(db: AsyncSession, days: int) -> StatsResponse:
         days: Number of days to look back (from today inclusive)
 
     Returns:
-        StatsResponse with all computed stats
+        StatsPayload with all computed stats (the body of StatsResponse)
     """
     today = date.today()
     start_date = today - timedelta(days=days - 1)
 
-    # Fetch all slots in the date range
-    slots_query = (
-        select(WeeklyPlanSlot)
-        .where(
-            and_(
-                WeeklyPlanSlot.date >= start_date,
-                WeeklyPlanSlot.date <= today,
-            )
-        )
-        .order_by(WeeklyPlanSlot.date, WeeklyPlanSlot.position)
-    )
-    result = await db.execute(slots_query)
-    slots = result.scalars().all()
-
-    # Fetch override days in range
-    override_query = (
-        select(func.count())
-        .select_from(WeeklyPlanInstanceDay)
-        .where(
-            and_(
-                WeeklyPlanInstanceDay.date >= start_date,
-                WeeklyPlanInstanceDay.date <= today,
-                WeeklyPlanInstanceDay.is_override.is_(True),
-            )
-        )
-    )
-    override_result = await db.execute(override_query)
-    override_days = override_result.scalar() or 0
+    # One read of the per-day rollup covers both the period and the
+    # streak lookback window
+    lookback_start = today - timedelta(days=STREAK_LOOKBACK_DAYS - 1)
+    rollup_days = await _get_rollup_days(db, min(start_date, lookback_start), today)
+    period_days = [day for day in rollup_days if day.date >= start_date]
 
     # Build status breakdown
-    status_counts: dict[str | None, int] = defaultdict(int)
-    for slot in slots:
-        status_counts[slot.completion_status] += 1
-
-    followed = status_counts.get("followed", 0)
-    adjusted = status_counts.get("adjusted", 0)
-    skipped = status_counts.get("skipped", 0)
-    replaced = status_counts.get("replaced", 0)
-    social = status_counts.get("social", 0)
-    unmarked = status_counts.get(None, 0)
-
-    total_slots = len(slots)
+    followed = sum(day.followed for day in period_days)
+    adjusted = sum(day.adjusted for day in period_days)
+    skipped = sum(day.skipped for day in period_days)
+    replaced = sum(day.replaced for day in period_days)
+    social = sum(day.social for day in period_days)
+    unmarked = sum(day.unmarked for day in period_days)
+
+    total_slots = sum(day.total for day in period_days)
     completed_slots = total_slots - unmarked
+    override_days = sum(1 for day in period_days if day.is_override)
 
-    by_status = StatusBreakdown(
+    by_status = StatusBreakdownPayload(
         followed=followed,
         adjusted=adjusted,
         skipped=skipped,
@@ -111,18 +101,18 @@ async def get_stats(db: AsyncSession, days: int) -> StatsResponse:
     adherence_rate = _adherence_rate(followed, adjusted, total_slots, social, unmarked)
 
     # Calculate streaks
-    current_streak, best_streak = await _calculate_streaks(db, today)
+    current_streak, best_streak = _calculate_streaks(rollup_days, today)
 
     # Per-meal-type breakdown
     by_meal_type = await _calculate_meal_type_adherence(db, start_date, today)
 
     # Daily adherence data points
-    daily_adherence = _calculate_daily_adherence(slots, start_date, today)
+    daily_adherence = _calculate_daily_adherence(period_days)
 
     # Average daily macros
-    avg_cal, avg_pro = await _calculate_avg_daily_macros(db, start_date, today)
+    avg_daily_macros = _calculate_avg_daily_macros(period_days)
 
-    return StatsResponse(
+    return StatsPayload(
         period_days=days,
         total_slots=total_slots,
         completed_slots=completed_slots,
@@ -133,12 +123,35 @@ async def get_stats(db: AsyncSession, days: int) -> StatsResponse:
         override_days=override_days,
         by_meal_type=by_meal_type,
         daily_adherence=daily_adherence,
-        avg_daily_calories=avg_cal,
-        avg_daily_protein=avg_pro,
+        **avg_daily_macros,
+    )
+
+
+async def _get_rollup_days(
+    db: AsyncSession, start_date: date, end_date: date
+) -> list[DailyCompletionRollup]:
+    """Fetch rollup rows for a date range (inclusive), ordered by date."""
+    result = await db.execute(
+        select(DailyCompletionRollup)
+        .where(
+            and_(
+                DailyCompletionRollup.date >= start_date,
+                DailyCompletionRollup.date <= end_date,
+            )
+        )
+        .order_by(DailyCompletionRollup.date)
     )
+    return list(result.scalars().all())
+
 
+def _is_streak_day(day: DailyCompletionRollup) -> bool:
+    """A streak day has at least one slot and no unmarked slots."""
+    return day.total > 0 and day.unmarked == 0
 
-async def _calculate_streaks(db: AsyncSession, today: date) -> tuple[int, int]:
+
+def _calculate_streaks(
+    rollup_days: list[DailyCompletionRollup], today: date
+) -> tuple[int, int]:
     """
     Calculate current and best streaks.
 
@@ -149,55 +162,29 @@ async def _calculate_streaks(db: AsyncSession, today: date) -> tuple[int, int]:
     We look back up to 365 days for best streak, and count backwards
     from today for current streak.
     """
-    lookback_start = today - timedelta(days=364)
-
-    # Get per-day counts of total slots and unmarked slots
-    day_stats_query = (
-        select(
-            WeeklyPlanSlot.date,
-            func.count().label("total"),
-            func.count().filter(WeeklyPlanSlot.completion_status.is_(None)).label("unmarked"),
-        )
-        .where(
-            and_(
-                WeeklyPlanSlot.date >= lookback_start,
-                WeeklyPlanSlot.date <= today,
-            )
-        )
-        .group_by(WeeklyPlanSlot.date)
-        .order_by(WeeklyPlanSlot.date)
-    )
-    result = await db.execute(day_stats_query)
-    rows = result.all()
+    lookback_start = today - timedelta(days=STREAK_LOOKBACK_DAYS - 1)
+    streak_dates = {
+        day.date for day in rollup_days
+        if day.date >= lookback_start and _is_streak_day(day)
+    }
 
-    # Build a dict: date -> (total, unmarked)
-    day_map: dict[date, tuple[int, int]] = {}
-    for row in rows:
-        day_map[row.date] = (row.total, row.unmarked)
-
-    # Calculate best streak across all days
+    # Calculate best streak across all days (gaps in dates break a run)
     best_streak = 0
     current_run = 0
-    for row in rows:
-        if row.total > 0 and row.unmarked == 0:
+    previous: date | None = None
+    for d in sorted(streak_dates):
+        if previous is not None and d - previous == timedelta(days=1):
             current_run += 1
-            best_streak = max(best_streak, current_run)
         else:
-            current_run = 0
+            current_run = 1
+        best_streak = max(best_streak, current_run)
+        previous = d
 
     # Calculate current streak (backwards from today)
     current_streak = 0
     d = today
-    while d >= lookback_start:
-        if d in day_map:
-            total, unmarked_count = day_map[d]
-            if total > 0 and unmarked_count == 0:
-                current_streak += 1
-            else:
-                break
-        else:
-            # No slots for this day — streak breaks
-            break
+    while d >= lookback_start and d in streak_dates:
+        current_streak += 1
         d -= timedelta(days=1)
 
     return current_streak, best_streak
@@ -205,46 +192,58 @@ async def _calculate_streaks(db: AsyncSession, today: date) -> tuple[int, int]:
 
 async def _calculate_meal_type_adherence(
     db: AsyncSession, start_date: date, end_date: date
-) -> list[MealTypeAdherence]:
+) -> list[MealTypeAdherencePayload]:
     """
     Calculate per-meal-type adherence, sorted by lowest adherence first.
     """
-    # Get meal type names
-    mt_query = select(MealType.id, MealType.name)
-    mt_result = await db.execute(mt_query)
-    meal_type_names: dict[UUID, str] = {row.id: row.name for row in mt_result.all()}
-
-    # Get per-type stats
-    type_stats_query = (
-        select(
-            WeeklyPlanSlot.meal_type_id,
-            func.count().label("total"),
-            func.count().filter(WeeklyPlanSlot.completion_status == "followed").label("followed_count"),
-            func.count().filter(WeeklyPlanSlot.completion_status == "adjusted").label("adjusted_count"),
-            func.count().filter(WeeklyPlanSlot.completion_status == "social").label("social_count"),
-            func.count().filter(WeeklyPlanSlot.completion_status.is_(None)).label("unmarked_count"),
-        )
-        .where(
+    # Slots of the period, live and archived
+    archived_slot = archived_slots()
+    slots = union_all(
+        select(WeeklyPlanSlot.meal_type_id, WeeklyPlanSlot.completion_status).where(
             and_(
                 WeeklyPlanSlot.date >= start_date,
                 WeeklyPlanSlot.date <= end_date,
                 WeeklyPlanSlot.meal_type_id.isnot(None),
             )
+        ),
+        select(archived_slot.c.meal_type_id, archived_slot.c.completion_status)
+        .select_from(WeeklyPlanArchiveDay)
+        .join(archived_slot, true())
+        .where(
+            and_(
+                WeeklyPlanArchiveDay.date >= start_date,
+                WeeklyPlanArchiveDay.date <= end_date,
+                archived_slot.c.meal_type_id.isnot(None),
+            )
+        ),
+    ).subquery("slots")
+
+    # Get per-type stats with meal type names
+    type_stats_query = (
+        select(
+            slots.c.meal_type_id,
+            MealType.name,
+            func.count().label("total"),
+            func.count().filter(slots.c.completion_status == "followed").label("followed_count"),
+            func.count().filter(slots.c.completion_status == "adjusted").label("adjusted_count"),
+            func.count().filter(slots.c.completion_status == "social").label("social_count"),
+            func.count().filter(slots.c.completion_status.is_(None)).label("unmarked_count"),
         )
-        .group_by(WeeklyPlanSlot.meal_type_id)
+        .outerjoin(MealType, MealType.id == slots.c.meal_type_id)
+        .group_by(slots.c.meal_type_id, MealType.name)
     )
     result = await db.execute(type_stats_query)
     rows = result.all()
 
-    adherence_list: list[MealTypeAdherence] = []
+    adherence_list: list[MealTypeAdherencePayload] = []
     for row in rows:
         mt_id = row.meal_type_id
-        name = meal_type_names.get(mt_id, "Unknown")
+        name = row.name or "Unknown"
         rate = _adherence_rate(
             row.followed_count, row.adjusted_count, row.total, row.social_count, row.unmarked_count
         )
         adherence_list.append(
-            MealTypeAdherence(
+            MealTypeAdherencePayload(
                 meal_type_id=mt_id,
                 name=name,
                 total=row.total,
@@ -258,90 +257,52 @@ async def _calculate_meal_type_adherence(
     return adherence_list
 
 
-async def _calculate_avg_daily_macros(
-    db: AsyncSession, start_date: date, end_date: date
-) -> tuple[Decimal | None, Decimal | None]:
-    """Calculate average daily calories and protein across days with data."""
-    from sqlalchemy.orm import selectinload
-
-    slots_query = (
-        select(WeeklyPlanSlot)
-        .where(
-            and_(
-                WeeklyPlanSlot.date >= start_date,
-                WeeklyPlanSlot.date <= end_date,
-            )
-        )
-        .options(selectinload(WeeklyPlanSlot.meal))
-    )
-    result = await db.execute(slots_query)
-    slots_with_meals = result.scalars().all()
+def _calculate_avg_daily_macros(
+    rollup_days: list[DailyCompletionRollup],
+) -> dict[str, Decimal | None]:
+    """
+    Calculate average daily macros across days with meal data.
 
-    daily_totals: dict[date, dict] = defaultdict(
-        lambda: {"calories": Decimal(0), "protein": Decimal(0), "has_data": False}
-    )
-    for slot in slots_with_meals:
-        if slot.meal:
-            day = daily_totals[slot.date]
-            if slot.meal.calories_kcal is not None:
-                day["calories"] += Decimal(slot.meal.calories_kcal)
-                day["has_data"] = True
-            if slot.meal.protein_g is not None:
-                day["protein"] += slot.meal.protein_g
-                day["has_data"] = True
-
-    days_with_data = [d for d in daily_totals.values() if d["has_data"]]
+    A day has data when any of its macro sums is set; missing values on such
+    a day count as zero. Returns StatsPayload field name -> average.
+    """
+    days_with_data = [
+        day for day in rollup_days
+        if any(getattr(day, column) is not None for column, _ in AVG_DAILY_MACROS.values())
+    ]
     if not days_with_data:
-        return None, None
+        return {field: None for field in AVG_DAILY_MACROS}
 
     n = Decimal(len(days_with_data))
-    avg_cal = (sum(d["calories"] for d in days_with_data) / n).quantize(
-        Decimal("1"), rounding=ROUND_HALF_UP
-    )
-    avg_pro = (sum(d["protein"] for d in days_with_data) / n).quantize(
-        Decimal("0.1"), rounding=ROUND_HALF_UP
-    )
+    averages: dict[str, Decimal | None] = {}
+    for field, (column, quantum) in AVG_DAILY_MACROS.items():
+        total = sum(Decimal(getattr(day, column) or 0) for day in days_with_data)
+        averages[field] = (total / n).quantize(quantum, rounding=ROUND_HALF_UP)
 
-    return avg_cal, avg_pro
+    return averages
 
 
 def _calculate_daily_adherence(
-    slots: list, start_date: date, end_date: date
-) -> list[DailyAdherence]:
+    rollup_days: list[DailyCompletionRollup],
+) -> list[DailyAdherencePayload]:
     """
     Build per-day adherence data points for chart display.
 
     Only includes days that have slots (no empty days generated).
     """
-    # Group slots by date
-    by_date: dict[date, list] = defaultdict(list)
-    for slot in slots:
-        by_date[slot.date].append(slot)
-
-    daily: list[DailyAdherence] = []
-    d = start_date
-    while d <= end_date:
-        day_slots = by_date.get(d)
-        if day_slots:
-            total = len(day_slots)
-            followed_count = sum(
-                1 for s in day_slots if s.completion_status in ("followed", "adjusted")
-            )
-            social_count = sum(
-                1 for s in day_slots if s.completion_status == "social"
-            )
-            unmarked_count = sum(
-                1 for s in day_slots if s.completion_status is None
-            )
-            rate = _adherence_rate(followed_count, 0, total, social_count, unmarked_count)
-            daily.append(
-                DailyAdherence(
-                    date=d,
-                    total=total,
-                    followed=followed_count,
-                    adherence_rate=rate,
-                )
+    daily: list[DailyAdherencePayload] = []
+    for day in rollup_days:
+        if day.total <= 0:
+            continue
+        followed_count = day.followed + day.adjusted
+        rate = _adherence_rate(followed_count, 0, day.total, day.social, day.unmarked)
+        daily.append(
+            DailyAdherencePayload(
+                date=day.date,
+                total=day.total,
+                followed=followed_count,
+                adherence_rate=rate,
             )
-        d += timedelta(days=1)
+        )
 
     return daily
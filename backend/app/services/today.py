@@ -5,17 +5,19 @@ This module contains business logic for:
 - Fetching today's or any day's meal plan
 - Computing is_next indicator for slots
 - Calculating streak statistics
-- Managing slot completion status
+- Managing slot completion status (one slot, or a batch from the offline queue)
 """
+from collections.abc import Sequence
 from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import Date, and_, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ..models import (
+    DailyCompletionRollup,
     WeeklyPlanInstance,
     WeeklyPlanInstanceDay,
     WeeklyPlanSlot,
@@ -23,12 +25,18 @@ from ..models import (
     MealType,
     Meal,
 )
-from ..schemas.common import WEEKDAY_NAMES
+from ..schemas.common import SlotOperationOutcome, WEEKDAY_NAMES
 from ..schemas.today import TodayResponse, TodayStats
-from ..schemas.weekly_plan import WeeklyPlanSlotWithNext
+from ..schemas.weekly_plan import (
+    SlotCompletionOperation,
+    SlotCompletionResult,
+    WeeklyPlanSlotWithNext,
+)
 from ..schemas.day_template import DayTemplateCompact
 from ..schemas.meal import MealCompact
 from ..schemas.meal_type import MealTypeCompact
+from .bulk import insert_plan_slots, update_slot_completions
+from .data_version import record_day_changes
 
 
 async def get_week_start_date(target_date: date) -> date:
@@ -94,50 +102,56 @@ async def get_day_plan(
     return (instance_day, slots)
 
 
+# Maximum streak reported; matches the historical one-year walk-back limit
+STREAK_LOOKBACK_DAYS = 366
+
+
 async def calculate_streak(db: AsyncSession, target_date: date) -> int:
     """
     Calculate the current streak of consecutive days with all meals completed.
 
     A day counts toward the streak if:
     - It has a plan (not an override day)
+    - It has at least one slot
     - All slots have a completion_status (not NULL)
 
-    We count backwards from the day before target_date.
+    We count backwards from the day before target_date, reading the per-day
+    counts from the daily completion rollup. The whole walk is a single
+    gaps-and-islands query: complete days are ranked newest first, and
+    a day belongs to the current streak exactly when its distance from
+    target_date equals its rank (any missing, override, empty or incomplete
+    day opens a gap that breaks the equality for every older day).
     """
-    streak = 0
-    check_date = target_date - timedelta(days=1)
-
-    while True:
-        day_plan = await get_day_plan(db, check_date)
-
-        if not day_plan:
-            # No plan for this day - streak ends
-            break
-
-        instance_day, slots = day_plan
-
-        if instance_day.is_override:
-            # Override days don't count toward streak
-            break
+    window_start = target_date - timedelta(days=STREAK_LOOKBACK_DAYS)
+    window_end = target_date - timedelta(days=1)
 
-        if not slots:
-            # No meals - streak ends
-            break
-
-        # Check if all slots are completed
-        all_completed = all(slot.completion_status is not None for slot in slots)
-
-        if not all_completed:
-            break
-
-        streak += 1
-        check_date -= timedelta(days=1)
+    # Days in the window whose plan is fully marked
+    complete_days = (
+        select(DailyCompletionRollup.date.label("date"))
+        .where(
+            and_(
+                DailyCompletionRollup.date >= window_start,
+                DailyCompletionRollup.date <= window_end,
+                DailyCompletionRollup.is_override.is_(False),
+                DailyCompletionRollup.total > 0,
+                DailyCompletionRollup.unmarked == 0,
+            )
+        )
+        .subquery()
+    )
 
-        # Safety limit to avoid infinite loops
-        if streak > 365:
-            break
+    ranked = select(
+        complete_days.c.date,
+        func.row_number().over(order_by=complete_days.c.date.desc()).label("rank"),
+    ).subquery()
 
-    return streak
+    stmt = (
+        select(func.count())
+        .select_from(ranked)
+        .where(literal(target_date, Date) - ranked.c.date == ranked.c.rank)
+    )
+    result = await db.execute(stmt)
+    return result.scalar() or 0
 
 
 def build_today_response(
@@ -288,6 +302,7 @@ async def complete_slot(
     slot.completed_at = datetime.now(timezone.utc)
 
     await db.flush()
+    await record_day_changes(db, [slot.date])
     return slot
 
 
@@ -309,9 +324,92 @@ async def uncomplete_slot(
     slot.completed_at = None
 
     await db.flush()
+    await record_day_changes(db, [slot.date])
     return slot
 
 
+async def apply_slot_completions(
+    db: AsyncSession,
+    operations: Sequence[SlotCompletionOperation],
+) -> list[SlotCompletionResult]:
+    """
+    Apply a batch of completion changes (offline queue sync).
+
+    Operations are ordered by client timestamp and only the latest one per
+    slot is applied; earlier ones are reported as superseded. All winning
+    changes go to the database in a single UPDATE, and the affected days'
+    rollups and versions are refreshed once.
+
+    A winning operation is superseded as well when the slot was completed
+    after the operation's client timestamp (e.g. on another device since
+    the queue was recorded): the newer completion is kept, and the result
+    reports the slot's stored state.
+
+    A completion's completed_at is its client timestamp (when the meal was
+    marked on the device), capped at the current time. Timestamps without a
+    timezone are taken as UTC.
+
+    Returns:
+        One result per operation, in the order given
+    """
+    now = datetime.now(timezone.utc)
+
+    def client_time(operation: SlotCompletionOperation) -> datetime:
+        timestamp = operation.client_timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return min(timestamp, now)
+
+    # Latest operation per slot (sorted() is stable: ties keep request order)
+    latest: dict[UUID, int] = {}
+    for index in sorted(range(len(operations)), key=lambda i: client_time(operations[i])):
+        latest[operations[index].slot_id] = index
+
+    completions = []
+    for slot_id, index in latest.items():
+        operation = operations[index]
+        changed_at = client_time(operation)
+        if operation.status is None:
+            completions.append((slot_id, None, None, changed_at))
+        else:
+            completions.append((slot_id, operation.status.value, changed_at, changed_at))
+
+    updated = {row.id: row for row in await update_slot_completions(db, completions)}
+    await record_day_changes(db, (row.date for row in updated.values()))
+
+    # Slots left alone were either missing or completed later than the change
+    unchanged = [slot_id for slot_id in latest if slot_id not in updated]
+    current = {}
+    if unchanged:
+        result = await db.execute(
+            select(
+                WeeklyPlanSlot.id,
+                WeeklyPlanSlot.completion_status,
+                WeeklyPlanSlot.completed_at,
+            ).where(WeeklyPlanSlot.id.in_(unchanged))
+        )
+        current = {row.id: row for row in result}
+
+    results = []
+    for index, operation in enumerate(operations):
+        row = updated.get(operation.slot_id) or current.get(operation.slot_id)
+        if row is None:
+            outcome = SlotOperationOutcome.NOT_FOUND
+        elif latest[operation.slot_id] != index or operation.slot_id not in updated:
+            outcome = SlotOperationOutcome.SUPERSEDED
+        else:
+            outcome = SlotOperationOutcome.APPLIED
+        results.append(
+            SlotCompletionResult(
+                slot_id=operation.slot_id,
+                outcome=outcome,
+                completion_status=row.completion_status if row else None,
+                completed_at=row.completed_at if row else None,
+            )
+        )
+    return results
+
+
 async def create_adhoc_slot(
     db: AsyncSession,
     target_date: date,
@@ -366,16 +464,15 @@ async def create_adhoc_slot(
         first_meal_type_id = meal.meal_types[0].id
 
     # Create the ad-hoc slot
-    slot = WeeklyPlanSlot(
-        weekly_plan_instance_id=instance.id,
-        date=target_date,
-        position=next_position,
-        meal_type_id=first_meal_type_id,
-        meal_id=meal_id,
-        is_adhoc=True,
-    )
-    db.add(slot)
-    await db.flush()
+    [slot] = await insert_plan_slots(db, [{
+        "weekly_plan_instance_id": instance.id,
+        "date": target_date,
+        "position": next_position,
+        "meal_type_id": first_meal_type_id,
+        "meal_id": meal_id,
+        "is_adhoc": True,
+    }])
+    await record_day_changes(db, [target_date])
 
     # Eagerly load relationships for the response
     await db.refresh(slot, attribute_names=["meal", "meal_type"])
@@ -401,6 +498,8 @@ async def delete_adhoc_slot(
     if not slot.is_adhoc:
         return False
 
+    slot_date = slot.date
     await db.delete(slot)
     await db.flush()
+    await record_day_changes(db, [slot_date])
     return True
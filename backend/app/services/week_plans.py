@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.week_plan import WeekPlan, WeekPlanDay
+from app.services.data_version import record_definition_change
 from app.schemas.week_plan import WeekPlanCreate, WeekPlanDayCreate, WeekPlanUpdate
 
 logger = logging.getLogger(__name__)
@@ -72,6 +73,7 @@ async def create_week_plan(db: AsyncSession, data: WeekPlanCreate) -> WeekPlan:
 
     # Create day mappings
     await _replace_days(db, plan.id, data.days)
+    await record_definition_change(db)
 
     # Reload with relationships
     return await get_week_plan_by_id(db, plan.id)
@@ -94,6 +96,7 @@ async def update_week_plan(
         await _replace_days(db, plan.id, data.days)
 
     await db.flush()
+    await record_definition_change(db)
 
     # Capture ID before expunging (async SQLAlchemy can't lazy-load after expire)
     plan_id = plan.id
@@ -107,6 +110,7 @@ async def delete_week_plan(db: AsyncSession, plan: WeekPlan) -> None:
     """Delete a week plan. Cascades to week_plan_days."""
     await db.delete(plan)
     await db.flush()
+    await record_definition_change(db)
 
 
 async def set_default_week_plan(db: AsyncSession, plan: WeekPlan) -> WeekPlan:
@@ -114,6 +118,7 @@ async def set_default_week_plan(db: AsyncSession, plan: WeekPlan) -> WeekPlan:
     await _clear_default(db)
     plan.is_default = True
     await db.flush()
+    await record_definition_change(db)
     return await get_week_plan_by_id(db, plan.id)
 
 
@@ -2,31 +2,42 @@
 Service layer for weekly planning operations.
 
 This module contains business logic for:
-- Generating new weekly plan instances
+- Generating new weekly plan instances (on request or ahead of time)
 - Switching day templates
 - Managing day overrides
 - Getting current/specific week plans
 
 See Tech Spec sections 3.2 and 3.3 for algorithm specifications.
 """
+from collections import Counter
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_, delete
+from sqlalchemy import select, and_, delete, union_all
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from ..models import (
-    WeekPlan,
-    WeekPlanDay,
-    DayTemplate,
     DayTemplateSlot,
+    WeeklyPlanArchiveDay,
     WeeklyPlanInstance,
     WeeklyPlanInstanceDay,
     WeeklyPlanSlot,
 )
-from .round_robin import get_next_meal_for_type
+from .archive import ArchivedSlot, ArchivedWeek, get_archived_week
+from .bulk import insert_instance_days, insert_plan_slots, update_slot_meals
+from .data_version import record_day_changes
+from .definitions import (
+    WeekPlanSnapshot,
+    get_day_template_snapshot,
+    get_day_template_snapshots,
+    get_default_week_plan_snapshot,
+    get_week_plan_snapshot,
+)
+from .round_robin import allocate_meals
 
 
 def get_week_start_date(target_date: date) -> date:
@@ -46,28 +57,6 @@ def get_next_monday(from_date: date) -> date:
     return from_date + timedelta(days=days_until_monday)
 
 
-async def get_default_week_plan(db: AsyncSession) -> Optional[WeekPlan]:
-    """Get the default week plan."""
-    stmt = (
-        select(WeekPlan)
-        .where(WeekPlan.is_default == True)
-        .options(selectinload(WeekPlan.days).selectinload(WeekPlanDay.day_template))
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
-
-
-async def get_week_plan_by_id(db: AsyncSession, week_plan_id: UUID) -> Optional[WeekPlan]:
-    """Get a specific week plan by ID."""
-    stmt = (
-        select(WeekPlan)
-        .where(WeekPlan.id == week_plan_id)
-        .options(selectinload(WeekPlan.days).selectinload(WeekPlanDay.day_template))
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
-
-
 async def get_weekly_instance_by_week_start(
     db: AsyncSession, week_start_date: date
 ) -> Optional[WeeklyPlanInstance]:
@@ -79,15 +68,19 @@ async def get_weekly_instance_by_week_start(
     return result.scalar_one_or_none()
 
 
-async def get_day_template_by_id(db: AsyncSession, template_id: UUID) -> Optional[DayTemplate]:
-    """Get a day template by ID with slots eagerly loaded."""
-    stmt = (
-        select(DayTemplate)
-        .where(DayTemplate.id == template_id)
-        .options(selectinload(DayTemplate.slots).selectinload(DayTemplateSlot.meal_type))
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+# Most weeks one range generation may create (a year)
+MAX_GENERATED_WEEKS = 52
+
+
+@dataclass
+class GeneratedWeek:
+    """A newly generated week, the week plan it follows and its size."""
+
+    instance: WeeklyPlanInstance
+    week_plan: WeekPlanSnapshot
+    days: int
+    slots: int
+    unassigned_slots: int
 
 
 async def generate_weekly_plan(
@@ -108,9 +101,11 @@ async def generate_weekly_plan(
         2. For each day (Mon-Sun):
            a. Get day template from week plan
            b. Create weekly_plan_instance_day record
-           c. For each slot in template:
-              - Get next meal via round-robin
-              - Create weekly_plan_slot record
+           c. For each slot in template, queue a round-robin demand
+        3. Assign all meals in one batch and create weekly_plan_slot records
+
+    Templates and round-robin rotations are loaded once for the whole week,
+    so generation takes a constant number of queries.
 
     Returns:
         Complete WeeklyPlanInstance with all relations loaded
@@ -118,6 +113,38 @@ async def generate_weekly_plan(
     Raises:
         ValueError: If no week plan available or week already exists
     """
+    weeks = await generate_weekly_plans(db, week_start_date, 1, week_plan_id)
+    return weeks[0].instance
+
+
+async def generate_weekly_plans(
+    db: AsyncSession,
+    week_start_date: Optional[date] = None,
+    week_count: int = 1,
+    week_plan_id: Optional[UUID] = None,
+) -> list[GeneratedWeek]:
+    """
+    Generate several consecutive weekly plan instances at once.
+
+    The week plan, its templates and the round-robin rotations are loaded
+    once for the whole range, meals are assigned in (date, position) order
+    across all weeks, and days and slots are written with multi-row inserts.
+    The meal sequence is the same as generating the weeks one by one, and
+    the number of queries does not grow with week_count.
+
+    Args:
+        db: Database session
+        week_start_date: Monday of the first week. Defaults to next Monday if not provided.
+        week_count: Number of consecutive weeks (1 to MAX_GENERATED_WEEKS)
+        week_plan_id: Optional specific plan to use; uses default if not provided.
+
+    Returns:
+        The generated weeks in date order
+
+    Raises:
+        ValueError: If no week plan available, the count is out of range,
+            or any of the weeks already exists
+    """
     # Determine week start date
     if week_start_date is None:
         week_start_date = get_next_monday(date.today())
@@ -125,77 +152,198 @@ async def generate_weekly_plan(
     # Validate it's a Monday
     if week_start_date.weekday() != 0:
         raise ValueError(f"week_start_date must be a Monday, got {week_start_date}")
-
-    # Check for existing instance
-    existing = await get_weekly_instance_by_week_start(db, week_start_date)
+    if not 1 <= week_count <= MAX_GENERATED_WEEKS:
+        raise ValueError(f"week_count must be between 1 and {MAX_GENERATED_WEEKS}, got {week_count}")
+
+    week_starts = [week_start_date + timedelta(weeks=offset) for offset in range(week_count)]
+
+    # Check for existing instances, live or archived
+    taken = union_all(
+        select(WeeklyPlanInstance.week_start_date)
+        .where(WeeklyPlanInstance.week_start_date.in_(week_starts)),
+        select(WeeklyPlanArchiveDay.week_start_date)
+        .where(WeeklyPlanArchiveDay.week_start_date.in_(week_starts)),
+    ).subquery()
+    result = await db.execute(
+        select(taken.c.week_start_date).order_by(taken.c.week_start_date).limit(1)
+    )
+    existing = result.scalars().first()
     if existing:
-        raise ValueError(f"Week starting {week_start_date} already exists")
+        raise ValueError(f"Week starting {existing} already exists")
 
     # Get week plan
     if week_plan_id:
-        week_plan = await get_week_plan_by_id(db, week_plan_id)
+        week_plan = await get_week_plan_snapshot(db, week_plan_id)
         if not week_plan:
             raise ValueError(f"Week plan with id {week_plan_id} not found")
     else:
-        week_plan = await get_default_week_plan(db)
+        week_plan = await get_default_week_plan_snapshot(db)
         if not week_plan:
             raise ValueError("No default week plan available")
 
-    # Create instance
-    instance = WeeklyPlanInstance(
-        week_plan_id=week_plan.id,
-        week_start_date=week_start_date,
-    )
-    db.add(instance)
+    # Create instances
+    instances = [
+        WeeklyPlanInstance(week_plan_id=week_plan.id, week_start_date=week_start)
+        for week_start in week_starts
+    ]
+    db.add_all(instances)
     await db.flush()
 
     # Build day map from week plan
-    day_map = {wpd.weekday: wpd.day_template_id for wpd in week_plan.days}
+    day_map = week_plan.day_template_ids
+
+    # Every template used by the week plan, in one go
+    templates = await get_day_template_snapshots(db, day_map.values())
+
+    # Build day rows and collect slot demands in (date, position) order
+    day_rows: list[dict] = []
+    demands: list[tuple[UUID, date, int, UUID]] = []
+    for instance in instances:
+        for day_offset in range(7):
+            current_date = instance.week_start_date + timedelta(days=day_offset)
+            weekday = day_offset  # 0=Monday
+
+            template_id = day_map.get(weekday)
+            if not template_id:
+                # No template for this day - skip (shouldn't happen with complete week plan)
+                continue
 
-    # Generate each day
-    for day_offset in range(7):
-        current_date = week_start_date + timedelta(days=day_offset)
-        weekday = day_offset  # 0=Monday
+            day_rows.append({
+                "weekly_plan_instance_id": instance.id,
+                "date": current_date,
+                "day_template_id": template_id,
+                "is_override": False,
+            })
 
-        template_id = day_map.get(weekday)
-        if not template_id:
-            # No template for this day - skip (shouldn't happen with complete week plan)
-            continue
+            template = templates.get(template_id)
+            if not template:
+                continue
+
+            # Slots are in position order
+            for slot in template.slots:
+                demands.append((instance.id, current_date, slot.position, slot.meal_type_id))
+
+    # Assign meals for the whole range via round-robin
+    assignments = await allocate_meals(db, [demand[1:] for demand in demands])
+
+    # Persist days and slots as multi-row inserts
+    await insert_instance_days(db, day_rows)
+    await insert_plan_slots(db, [
+        _slot_row(
+            instance_id,
+            current_date,
+            position,
+            meal_type_id,
+            assignments[(current_date, position)],
+        )
+        for instance_id, current_date, position, meal_type_id in demands
+    ])
+    await record_day_changes(db, [row["date"] for row in day_rows])
+
+    days = Counter(row["weekly_plan_instance_id"] for row in day_rows)
+    slots = Counter(instance_id for instance_id, *_ in demands)
+    unassigned = Counter(
+        instance_id
+        for instance_id, current_date, position, _ in demands
+        if assignments[(current_date, position)] is None
+    )
+    return [
+        GeneratedWeek(
+            instance=instance,
+            week_plan=week_plan,
+            days=days[instance.id],
+            slots=slots[instance.id],
+            unassigned_slots=unassigned[instance.id],
+        )
+        for instance in instances
+    ]
+
+
+async def get_missing_weeks(
+    db: AsyncSession,
+    weeks_ahead: int,
+    today: Optional[date] = None,
+) -> list[date]:
+    """
+    Week start dates of the weeks_ahead weeks after the current week that
+    have no weekly plan instance yet (one query).
 
-        # Create day record
-        instance_day = WeeklyPlanInstanceDay(
-            weekly_plan_instance_id=instance.id,
-            date=current_date,
-            day_template_id=template_id,
-            is_override=False,
+    The current week is left out: it is generated ahead of time as an
+    upcoming week, and if that did not happen it is left to
+    POST /weekly-plans/generate instead of racing it.
+    """
+    current_week = get_week_start_date(today or date.today())
+    week_starts = [
+        current_week + timedelta(weeks=offset) for offset in range(1, weeks_ahead + 1)
+    ]
+
+    result = await db.execute(
+        select(WeeklyPlanInstance.week_start_date).where(
+            WeeklyPlanInstance.week_start_date.in_(week_starts)
         )
-        db.add(instance_day)
+    )
+    existing = set(result.scalars().all())
+    return [week_start for week_start in week_starts if week_start not in existing]
+
 
-        # Get template with slots
-        template = await get_day_template_by_id(db, template_id)
-        if not template:
+async def pregenerate_weeks(
+    db: AsyncSession,
+    weeks_ahead: int,
+    today: Optional[date] = None,
+) -> list[date]:
+    """
+    Generate the missing weeks among the weeks_ahead weeks after the current week.
+
+    Weeks are generated with the default week plan, in date order so the
+    round-robin rotation continues from one week into the next. Existing
+    weeks are left alone; a week created concurrently (e.g. by
+    POST /weekly-plans/generate) is skipped.
+
+    Args:
+        db: Database session
+        weeks_ahead: Number of weeks after the current one to generate
+        today: Reference date (defaults to today)
+
+    Returns:
+        Week start dates that were generated (empty without a default week plan)
+    """
+    missing = await get_missing_weeks(db, weeks_ahead, today)
+    if not missing:
+        return []
+
+    week_plan = await get_default_week_plan_snapshot(db)
+    if week_plan is None:
+        return []
+
+    generated = []
+    for week_start in missing:
+        try:
+            async with db.begin_nested():
+                await generate_weekly_plan(db, week_start, week_plan.id)
+        except IntegrityError:
+            # Generated by a request in the meantime
             continue
+        generated.append(week_start)
+    return generated
 
-        # Sort slots by position
-        slots = sorted(template.slots, key=lambda s: s.position)
-
-        # Generate meal for each slot
-        for slot in slots:
-            meal = await get_next_meal_for_type(db, slot.meal_type_id)
-
-            plan_slot = WeeklyPlanSlot(
-                weekly_plan_instance_id=instance.id,
-                date=current_date,
-                position=slot.position,
-                meal_type_id=slot.meal_type_id,
-                meal_id=meal.id if meal else None,
-                completion_status=None,
-                completed_at=None,
-            )
-            db.add(plan_slot)
 
-    await db.flush()
-    return instance
+def _slot_row(
+    instance_id: UUID,
+    slot_date: date,
+    position: int,
+    meal_type_id: UUID,
+    meal_id: Optional[UUID],
+) -> dict:
+    """Build the insert row for a freshly generated (uncompleted) slot."""
+    return {
+        "weekly_plan_instance_id": instance_id,
+        "date": slot_date,
+        "position": position,
+        "meal_type_id": meal_type_id,
+        "meal_id": meal_id,
+        "completion_status": None,
+        "completed_at": None,
+    }
 
 
 async def get_current_week_instance(db: AsyncSession) -> Optional[WeeklyPlanInstance]:
@@ -206,14 +354,23 @@ async def get_current_week_instance(db: AsyncSession) -> Optional[WeeklyPlanInst
 
 async def get_week_instance(
     db: AsyncSession, week_start_date: Optional[date] = None
-) -> Optional[WeeklyPlanInstance]:
-    """Get the weekly plan instance for a specific week or current week if not specified."""
+) -> Optional[WeeklyPlanInstance | ArchivedWeek]:
+    """
+    Get the weekly plan instance for a specific week or current week if not specified.
+
+    Weeks moved to the archive are returned as a read-only ArchivedWeek.
+    """
     if week_start_date is None:
         week_start = get_week_start_date(date.today())
     else:
         # Normalize to Monday if not already
         week_start = get_week_start_date(week_start_date)
-    return await get_weekly_instance_by_week_start(db, week_start)
+    instance = await get_weekly_instance_by_week_start(db, week_start)
+    if instance is None:
+        archived = await get_archived_week(db, week_start_date=week_start)
+        if archived:
+            return archived[0]
+    return instance
 
 
 async def get_full_weekly_instance(
@@ -256,6 +413,65 @@ async def get_slots_for_instance_day(
     return list(result.scalars().all())
 
 
+async def get_week_view(
+    db: AsyncSession, instance_id: UUID
+) -> Optional[
+    tuple[WeeklyPlanInstance | ArchivedWeek, dict[date, list[WeeklyPlanSlot | ArchivedSlot]]]
+]:
+    """
+    Load everything needed to render a week in two queries.
+
+    The first query fetches the instance with its week plan, days and day
+    templates; the second fetches every slot of the week with its meal and
+    meal type. Rows already in the session are refreshed from the database so
+    the view reflects any changes flushed earlier in the request. An instance
+    that has been archived is rebuilt from the archive instead.
+
+    Args:
+        db: Database session
+        instance_id: Weekly plan instance to load
+
+    Returns:
+        (instance, slots grouped by date and ordered by position), or None if
+        the instance doesn't exist live or archived
+    """
+    instance_stmt = (
+        select(WeeklyPlanInstance)
+        .where(WeeklyPlanInstance.id == instance_id)
+        .options(
+            joinedload(WeeklyPlanInstance.week_plan),
+            joinedload(WeeklyPlanInstance.days).joinedload(
+                WeeklyPlanInstanceDay.day_template
+            ),
+        )
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(instance_stmt)
+    instance = result.unique().scalar_one_or_none()
+    if not instance:
+        return await get_archived_week(db, instance_id=instance_id)
+
+    slots_stmt = (
+        select(WeeklyPlanSlot)
+        .where(WeeklyPlanSlot.weekly_plan_instance_id == instance_id)
+        .options(
+            joinedload(WeeklyPlanSlot.meal),
+            joinedload(WeeklyPlanSlot.meal_type),
+        )
+        .order_by(WeeklyPlanSlot.date, WeeklyPlanSlot.position)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(slots_stmt)
+
+    slots_by_date: dict[date, list[WeeklyPlanSlot]] = {
+        day.date: [] for day in instance.days
+    }
+    for slot in result.scalars().all():
+        slots_by_date.setdefault(slot.date, []).append(slot)
+
+    return instance, slots_by_date
+
+
 async def get_instance_day(
     db: AsyncSession, instance_id: UUID, target_date: date
 ) -> Optional[WeeklyPlanInstanceDay]:
@@ -308,7 +524,7 @@ async def switch_day_template(
         raise ValueError(f"No day record for {target_date}")
 
     # Verify template exists
-    template = await get_day_template_by_id(db, new_template_id)
+    template = await get_day_template_snapshot(db, new_template_id)
     if not template:
         raise ValueError(f"Day template with id {new_template_id} not found")
 
@@ -327,25 +543,27 @@ async def switch_day_template(
     instance_day.override_reason = None
     instance_day.updated_at = datetime.now(timezone.utc)
 
-    # Get template slots ordered by position
-    slots = sorted(template.slots, key=lambda s: s.position)
-
-    # Generate new meals for each slot
-    for slot in slots:
-        meal = await get_next_meal_for_type(db, slot.meal_type_id)
-
-        plan_slot = WeeklyPlanSlot(
-            weekly_plan_instance_id=instance_id,
-            date=target_date,
-            position=slot.position,
-            meal_type_id=slot.meal_type_id,
-            meal_id=meal.id if meal else None,
-            completion_status=None,
-            completed_at=None,
+    # Template slots are ordered by position
+    slots = template.slots
+
+    # Generate new meals for all slots in one round-robin batch
+    assignments = await allocate_meals(
+        db, [(target_date, slot.position, slot.meal_type_id) for slot in slots]
+    )
+
+    await insert_plan_slots(db, [
+        _slot_row(
+            instance_id,
+            target_date,
+            slot.position,
+            slot.meal_type_id,
+            assignments[(target_date, slot.position)],
         )
-        db.add(plan_slot)
+        for slot in slots
+    ])
 
     await db.flush()
+    await record_day_changes(db, [target_date])
 
     # Refresh to get updated relationships
     await db.refresh(instance_day)
@@ -395,6 +613,7 @@ async def set_day_override(
     instance_day.updated_at = datetime.now(timezone.utc)
 
     await db.flush()
+    await record_day_changes(db, [target_date])
     return instance_day
 
 
@@ -428,7 +647,7 @@ async def clear_day_override(
         raise ValueError(f"No template available for {target_date}")
 
     # Get the template
-    template = await get_day_template_by_id(db, instance_day.day_template_id)
+    template = await get_day_template_snapshot(db, instance_day.day_template_id)
     if not template:
         raise ValueError(f"Template {instance_day.day_template_id} not found")
 
@@ -437,25 +656,27 @@ async def clear_day_override(
     instance_day.override_reason = None
     instance_day.updated_at = datetime.now(timezone.utc)
 
-    # Get template slots ordered by position
-    slots = sorted(template.slots, key=lambda s: s.position)
-
-    # Generate new meals for each slot
-    for slot in slots:
-        meal = await get_next_meal_for_type(db, slot.meal_type_id)
-
-        plan_slot = WeeklyPlanSlot(
-            weekly_plan_instance_id=instance_id,
-            date=target_date,
-            position=slot.position,
-            meal_type_id=slot.meal_type_id,
-            meal_id=meal.id if meal else None,
-            completion_status=None,
-            completed_at=None,
+    # Template slots are ordered by position
+    slots = template.slots
+
+    # Generate new meals for all slots in one round-robin batch
+    assignments = await allocate_meals(
+        db, [(target_date, slot.position, slot.meal_type_id) for slot in slots]
+    )
+
+    await insert_plan_slots(db, [
+        _slot_row(
+            instance_id,
+            target_date,
+            slot.position,
+            slot.meal_type_id,
+            assignments[(target_date, slot.position)],
         )
-        db.add(plan_slot)
+        for slot in slots
+    ])
 
     await db.flush()
+    await record_day_changes(db, [target_date])
     return instance_day
 
 
@@ -468,19 +689,27 @@ def is_date_in_week(target_date: date, week_start: date) -> bool:
 async def regenerate_weekly_plan(
     db: AsyncSession,
     week_start_date: date,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
 ) -> WeeklyPlanInstance:
     """
     Regenerate uncompleted slots in an existing weekly plan.
 
     Only regenerates slots that:
     1. Have no completion_status (uncompleted)
-    2. Are in the future OR are today but not yet completed
+    2. Belong to a template slot of a non-override day
+    3. Fall within [from_date, to_date] when either bound is given
 
-    Preserves all completed slots and their meal assignments.
+    Preserves all completed slots and their meal assignments. The slots to
+    refresh and their template meal types are read in one query, meals are
+    assigned in (date, position) order with a single round-robin batch, and
+    all slots are updated in one statement.
 
     Args:
         db: Database session
         week_start_date: Monday of the target week
+        from_date: First date to regenerate (e.g. today); defaults to the whole week
+        to_date: Last date to regenerate; defaults to the whole week
 
     Returns:
         Updated WeeklyPlanInstance
@@ -499,53 +728,49 @@ async def regenerate_weekly_plan(
     if not instance:
         raise ValueError(f"No week plan exists for week starting {week_start_date}")
 
-    # Get full instance with days
-    full_instance = await get_full_weekly_instance(db, instance.id)
-    if not full_instance:
-        raise ValueError(f"Could not load week plan for {week_start_date}")
-
-    today = date.today()
-
-    # For each day, regenerate uncompleted slots
-    for instance_day in full_instance.days:
-        # Skip override days (no meals to regenerate)
-        if instance_day.is_override:
-            continue
-
-        # Skip if no template
-        if not instance_day.day_template_id:
-            continue
-
-        # Get current slots for this day
-        current_slots = await get_slots_for_instance_day(db, instance.id, instance_day.date)
-
-        # Find uncompleted slots (completion_status is NULL)
-        uncompleted_slots = [s for s in current_slots if s.completion_status is None]
-
-        if not uncompleted_slots:
-            # All slots are completed, nothing to regenerate
-            continue
-
-        # Get the template with its slots
-        template = await get_day_template_by_id(db, instance_day.day_template_id)
-        if not template:
-            continue
-
-        # Build a map of template slot positions to meal types
-        template_slots_by_position = {ts.position: ts for ts in template.slots}
-
-        # Regenerate each uncompleted slot with a new meal
-        for slot in uncompleted_slots:
-            template_slot = template_slots_by_position.get(slot.position)
-            if not template_slot:
-                continue
-
-            # Get a new meal via round-robin
-            new_meal = await get_next_meal_for_type(db, template_slot.meal_type_id)
-
-            # Update the slot with new meal
-            slot.meal_id = new_meal.id if new_meal else None
-            slot.updated_at = datetime.now(timezone.utc)
-
-    await db.flush()
+    # Uncompleted slots with the meal type their template assigns
+    stmt = (
+        select(
+            WeeklyPlanSlot.id,
+            WeeklyPlanSlot.date,
+            WeeklyPlanSlot.position,
+            DayTemplateSlot.meal_type_id,
+        )
+        .join(
+            WeeklyPlanInstanceDay,
+            and_(
+                WeeklyPlanInstanceDay.weekly_plan_instance_id == WeeklyPlanSlot.weekly_plan_instance_id,
+                WeeklyPlanInstanceDay.date == WeeklyPlanSlot.date,
+            ),
+        )
+        .join(
+            DayTemplateSlot,
+            and_(
+                DayTemplateSlot.day_template_id == WeeklyPlanInstanceDay.day_template_id,
+                DayTemplateSlot.position == WeeklyPlanSlot.position,
+            ),
+        )
+        .where(
+            WeeklyPlanSlot.weekly_plan_instance_id == instance.id,
+            WeeklyPlanSlot.completion_status.is_(None),
+            WeeklyPlanInstanceDay.is_override.is_(False),
+        )
+        .order_by(WeeklyPlanSlot.date, WeeklyPlanSlot.position)
+    )
+    if from_date is not None:
+        stmt = stmt.where(WeeklyPlanSlot.date >= from_date)
+    if to_date is not None:
+        stmt = stmt.where(WeeklyPlanSlot.date <= to_date)
+    slots = (await db.execute(stmt)).all()
+    if not slots:
+        return instance
+
+    # Get new meals via round-robin
+    assignments = await allocate_meals(
+        db, [(slot.date, slot.position, slot.meal_type_id) for slot in slots]
+    )
+    await update_slot_meals(
+        db, [(slot.id, assignments[(slot.date, slot.position)]) for slot in slots]
+    )
+    await record_day_changes(db, {slot.date for slot in slots})
     return instance
@@ -0,0 +1 @@
+"""Standalone performance benchmarks (run manually, not part of the test suite)."""
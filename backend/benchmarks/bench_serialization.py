@@ -0,0 +1,182 @@
+"""
+Benchmark: response build and encoding cost of the week view and stats.
+
+Builds a full week (7 days of 6 slots with meals) and a 365-day stats
+payload from in-memory rows and times:
+
+- build:     building the dataclass payload alone
+- fastapi:   the payload returned to FastAPI as its response model:
+             FastAPI's response_model processing and json encoding
+- standard:  the default path of payload_response: the payload validated
+             once into its response model and encoded by Pydantic
+- orjson:    the payload encoded by FastJSONResponse
+             (settings.fast_json_responses)
+
+No database is needed. Run from backend directory:
+    python -m benchmarks.bench_serialization
+"""
+
+import asyncio
+import json
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.responses import FastJSONResponse, ModelJSONResponse
+from app.api.weekly import build_day_response
+from app.schemas.payloads import (
+    DailyAdherencePayload,
+    RefPayload,
+    StatsPayload,
+    StatusBreakdownPayload,
+    WeeklyPlanInstancePayload,
+)
+from app.schemas.stats import StatsResponse
+from app.schemas.weekly_plan import WeeklyPlanInstanceResponse
+from app.services.stats import _calculate_daily_adherence
+
+SLOTS_PER_DAY = 6
+STATS_DAYS = 365
+RUNS = 200
+
+
+def week_rows():
+    """Instance, day and slot rows of a week, shaped like the ORM objects the views read."""
+    instance = SimpleNamespace(
+        id=uuid4(), week_start_date=date(2026, 1, 5),
+        week_plan=SimpleNamespace(id=uuid4(), name="Default"),
+    )
+    meal_types = [SimpleNamespace(id=uuid4(), name=f"Type {n}") for n in range(SLOTS_PER_DAY)]
+    meals = [
+        SimpleNamespace(
+            id=uuid4(), name=f"Meal {n}", portion_description="1 plate",
+            calories_kcal=450 + n, protein_g=Decimal("32.5"), carbs_g=Decimal("41.0"),
+            sugar_g=Decimal("6.2"), fat_g=Decimal("14.8"), saturated_fat_g=Decimal("3.1"),
+            fiber_g=Decimal("7.4"),
+        )
+        for n in range(SLOTS_PER_DAY)
+    ]
+    template = SimpleNamespace(id=uuid4(), name="Work day")
+    days = []
+    for offset in range(7):
+        day = SimpleNamespace(
+            date=instance.week_start_date + timedelta(days=offset), day_template=template,
+            is_override=False, override_reason=None,
+        )
+        slots = [
+            SimpleNamespace(
+                id=uuid4(), position=position + 1, meal=meals[position],
+                meal_type=meal_types[position], completion_status="followed",
+                completed_at=datetime(2026, 1, 5, 8, 15, tzinfo=timezone.utc), is_adhoc=False,
+            )
+            for position in range(SLOTS_PER_DAY)
+        ]
+        days.append((day, slots))
+    return instance, days
+
+
+async def build_week(instance, days) -> WeeklyPlanInstancePayload:
+    """As build_instance_response, from rows already loaded."""
+    return WeeklyPlanInstancePayload(
+        id=instance.id,
+        week_start_date=instance.week_start_date,
+        week_plan=RefPayload(id=instance.week_plan.id, name=instance.week_plan.name),
+        days=[await build_day_response(None, instance.id, day, slots) for day, slots in days],
+    )
+
+
+def stats_rows():
+    """Daily rollup rows of a year."""
+    today = date(2026, 12, 31)
+    return [
+        SimpleNamespace(
+            date=today - timedelta(days=n), total=6, followed=4, adjusted=1,
+            social=0, unmarked=0,
+        )
+        for n in range(STATS_DAYS)
+    ]
+
+
+def build_stats(rows) -> StatsPayload:
+    """As get_stats, from rollup rows already loaded."""
+    daily: list[DailyAdherencePayload] = _calculate_daily_adherence(rows)
+    return StatsPayload(
+        period_days=STATS_DAYS, total_slots=6 * STATS_DAYS, completed_slots=6 * STATS_DAYS,
+        by_status=StatusBreakdownPayload(followed=4 * STATS_DAYS, adjusted=STATS_DAYS),
+        adherence_rate=Decimal("0.833"), current_streak=STATS_DAYS, best_streak=STATS_DAYS,
+        override_days=0, daily_adherence=daily,
+        avg_daily_calories=Decimal("2130"), avg_daily_protein=Decimal("162.5"),
+    )
+
+
+async def response_model_body(field, content) -> bytes:
+    """What FastAPI does with a returned object: validate, serialize, encode."""
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+async def time_runs(make_body) -> float:
+    """Median time per response in microseconds."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await make_body()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(timings)
+
+
+async def main() -> None:
+    instance, days = week_rows()
+    rollup_rows = stats_rows()
+
+    async def week_payload():
+        return await build_week(instance, days)
+
+    async def stats_payload():
+        return build_stats(rollup_rows)
+
+    cases = [
+        ("week", WeeklyPlanInstanceResponse, week_payload),
+        ("stats", StatsResponse, stats_payload),
+    ]
+
+    print(
+        f"{'payload':>8} {'bytes':>7} {'build us':>9} {'fastapi us':>11} "
+        f"{'standard us':>12} {'orjson us':>10}"
+    )
+    for name, model, build in cases:
+        field = create_model_field(name="Response_" + name, type_=model, mode="serialization")
+
+        async def through_fastapi():
+            built = model.model_validate(await build(), from_attributes=True)
+            return await response_model_body(field, built)
+
+        async def standard():
+            return ModelJSONResponse(model.model_validate(await build(), from_attributes=True)).body
+
+        async def fast():
+            return FastJSONResponse(await build()).body
+
+        # All paths produce the same document
+        document = json.loads(await through_fastapi())
+        assert json.loads(await standard()) == document == json.loads(await fast())
+
+        build_us = await time_runs(build)
+        fastapi_us = await time_runs(through_fastapi)
+        standard_us = await time_runs(standard)
+        fast_us = await time_runs(fast)
+        size = len(await fast())
+        print(
+            f"{name:>8} {size:>7} {build_us:>9.0f} {fastapi_us:>11.0f} "
+            f"{standard_us:>12.0f} {fast_us:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
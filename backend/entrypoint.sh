@@ -4,8 +4,15 @@ set -e
 echo "Running database migrations..."
 alembic upgrade head
 
+# Prometheus metrics shared by the gunicorn workers; stale files from a
+# previous run would be aggregated into /metrics, so start empty
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/mealframe-metrics}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 echo "Starting MealFrame API..."
 exec gunicorn app.main:app \
+  --config gunicorn.conf.py \
   --worker-class uvicorn.workers.UvicornWorker \
   --bind 0.0.0.0:8003 \
   --workers "${GUNICORN_WORKERS:-2}" \
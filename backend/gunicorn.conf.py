@@ -0,0 +1,12 @@
+"""
+Gunicorn configuration (loaded by entrypoint.sh).
+
+Workers share Prometheus metrics through PROMETHEUS_MULTIPROC_DIR (see
+app/metrics.py). When a worker exits, its live gauges (in-flight requests,
+pool usage) must stop counting towards the totals.
+"""
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)
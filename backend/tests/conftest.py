@@ -18,11 +18,16 @@ from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.cache import response_cache
 from app.database import Base
 from app.models import Meal, MealType, RoundRobinState
 from app.models.meal_to_meal_type import meal_to_meal_type
+from app.services.data_version import record_rotation_change
+from app.services.definitions import definition_cache
+from app.services.round_robin import rotation_cache
 
 
 # Use test PostgreSQL database (same as dev but isolated via transactions)
@@ -90,6 +95,64 @@ async def db(db_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """
+    Start every test with an empty response cache.
+
+    Test data is rolled back, so data versions repeat between tests and a
+    cached response from one test could otherwise be served to the next.
+    """
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_versioned_caches():
+    """Start every test with empty rotation and definition caches (same reason as above)."""
+    rotation_cache.clear()
+    definition_cache.clear()
+    yield
+    rotation_cache.clear()
+    definition_cache.clear()
+
+
+class QueryCounter:
+    """Counts SQL statements executed on an engine while active."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        # Savepoint bookkeeping from the test fixture is not application work
+        if not statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE", "ROLLBACK")):
+            self.statements.append(statement)
+
+
+@pytest.fixture
+def query_counter(db_engine):
+    """
+    Record every SQL statement sent through the test engine.
+
+    Use for query-count regression tests:
+        query_counter.reset()
+        await some_service(db)
+        assert query_counter.count <= 4
+    """
+    counter = QueryCounter()
+    event.listen(db_engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(db_engine.sync_engine, "before_cursor_execute", counter)
+
+
 @pytest_asyncio.fixture
 async def meal_type(db: AsyncSession) -> MealType:
     """Create a single meal type for testing."""
@@ -124,7 +187,7 @@ async def create_meal(
     meal_type: MealType,
     created_at: datetime | None = None,
 ) -> Meal:
-    """Helper to create a meal with a specific creation time."""
+    """Helper to create a meal with a specific creation time (recorded as a rotation change)."""
     meal = Meal(
         id=uuid4(),
         name=name,
@@ -142,6 +205,7 @@ async def create_meal(
         )
     )
     await db.flush()
+    await record_rotation_change(db)
 
     return meal
 
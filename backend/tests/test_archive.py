@@ -0,0 +1,214 @@
+"""
+Tests for the archival of past weeks.
+
+These tests verify:
+- Archived weeks leave the live tables and keep their rollup rows
+- Archived weeks are still served by the week view and the weekly API
+- Per-meal-type stats count archived slots
+- Archived weeks cannot be generated again
+- Recent weeks are never archived
+- Partitions of fully archived years are dropped
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.main import app
+from app.models import (
+    DailyCompletionRollup,
+    DayTemplate,
+    Meal,
+    MealType,
+    WeekPlan,
+    WeeklyPlanArchiveDay,
+    WeeklyPlanInstance,
+    WeeklyPlanInstanceDay,
+    WeeklyPlanSlot,
+)
+from app.services import partitions
+from app.services.archive import MIN_RETENTION_DAYS, archive_weeks
+from app.services.partitions import ensure_year_partitions, get_partition_years
+from app.services.rollup import refresh_daily_rollup
+from app.services.stats import get_stats
+from app.services.weekly import generate_weekly_plan, get_week_instance, get_week_view
+
+from .conftest import create_meal
+
+
+@pytest_asyncio.fixture
+async def client(db: AsyncSession):
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+def past_monday(weeks_ago: int) -> date:
+    today = date.today()
+    return today - timedelta(days=today.weekday(), weeks=weeks_ago)
+
+
+async def add_week(
+    db: AsyncSession, week_start: date, meal_type: MealType, meal: Meal
+) -> WeeklyPlanInstance:
+    """A week with one template day per date and two slots a day: followed, skipped."""
+    template = DayTemplate(id=uuid4(), name=f"Archive Template {uuid4().hex[:8]}")
+    week_plan = WeekPlan(id=uuid4(), name=f"Archive Plan {uuid4().hex[:8]}", is_default=False)
+    db.add_all([template, week_plan])
+    await db.flush()
+    instance = WeeklyPlanInstance(id=uuid4(), week_plan_id=week_plan.id, week_start_date=week_start)
+    db.add(instance)
+    await db.flush()
+    for offset in range(7):
+        day = week_start + timedelta(days=offset)
+        db.add(WeeklyPlanInstanceDay(
+            id=uuid4(), weekly_plan_instance_id=instance.id, date=day,
+            day_template_id=template.id, is_override=False,
+        ))
+        for position, status in ((1, "followed"), (2, "skipped")):
+            db.add(WeeklyPlanSlot(
+                id=uuid4(), weekly_plan_instance_id=instance.id, date=day, position=position,
+                meal_type_id=meal_type.id, meal_id=meal.id, completion_status=status,
+            ))
+    await db.flush()
+    await refresh_daily_rollup(db, [week_start + timedelta(days=offset) for offset in range(7)])
+    return instance
+
+
+@pytest_asyncio.fixture
+async def old_week(db: AsyncSession, meal_type: MealType) -> WeeklyPlanInstance:
+    meal = await create_meal(db, f"Archive Meal {uuid4().hex[:8]}", meal_type)
+    return await add_week(db, past_monday(5), meal_type, meal)
+
+
+async def archive_old_weeks(db: AsyncSession):
+    return await archive_weeks(db, date.today() - timedelta(days=MIN_RETENTION_DAYS))
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_week_and_keeps_rollup(db: AsyncSession, old_week):
+    """The week becomes seven archive rows; its rollup rows survive."""
+    instance_id, week_start = old_week.id, old_week.week_start_date
+    rollup_before = await db.get(DailyCompletionRollup, week_start)
+    assert rollup_before.followed == 1
+
+    result = await archive_old_weeks(db)
+
+    assert week_start in result.weeks
+    archived = (await db.execute(
+        select(WeeklyPlanArchiveDay).where(WeeklyPlanArchiveDay.week_start_date == week_start)
+    )).scalars().all()
+    assert len(archived) == 7
+    assert all(len(row.slots) == 2 for row in archived)
+    assert await db.scalar(
+        select(func.count()).select_from(WeeklyPlanSlot)
+        .where(WeeklyPlanSlot.weekly_plan_instance_id == instance_id)
+    ) == 0
+
+    await refresh_daily_rollup(db, [week_start])
+    db.expire_all()
+    rollup = await db.get(DailyCompletionRollup, week_start)
+    assert (rollup.total, rollup.followed, rollup.skipped) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_archived_week_is_readable(db: AsyncSession, client: AsyncClient, old_week):
+    """The week view and GET /weekly-plans/current serve the archived week."""
+    instance_id, week_start = old_week.id, old_week.week_start_date
+    await archive_old_weeks(db)
+
+    week = await get_week_instance(db, week_start)
+    assert week.id == instance_id
+    view_week, slots_by_date = await get_week_view(db, instance_id)
+    assert [day.date for day in view_week.days] == [
+        week_start + timedelta(days=offset) for offset in range(7)
+    ]
+    assert [slot.completion_status for slot in slots_by_date[week_start]] == ["followed", "skipped"]
+
+    response = await client.get(
+        "/api/v1/weekly-plans/current", params={"week_start_date": week_start.isoformat()}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == str(instance_id)
+    assert len(data["days"]) == 7
+    assert data["days"][0]["slots"][0]["meal"] is not None
+    assert data["days"][0]["completion_summary"] == {"completed": 2, "total": 2}
+
+
+@pytest.mark.asyncio
+async def test_stats_include_archived_slots(db: AsyncSession, meal_type: MealType, old_week):
+    """Per-meal-type adherence is the same before and after archival."""
+    def entry(stats):
+        return next(t for t in stats.by_meal_type if t.meal_type_id == meal_type.id)
+
+    before = entry(await get_stats(db, 60))
+    await archive_old_weeks(db)
+    after = entry(await get_stats(db, 60))
+
+    assert after == before
+    assert after.adherence_rate == Decimal("0.500")
+
+
+@pytest.mark.asyncio
+async def test_archived_week_cannot_be_generated_again(db: AsyncSession, old_week):
+    week_start = old_week.week_start_date
+    await archive_old_weeks(db)
+
+    with pytest.raises(ValueError, match="already exists"):
+        await generate_weekly_plan(db, week_start)
+
+
+@pytest.mark.asyncio
+async def test_recent_weeks_are_never_archived(db: AsyncSession):
+    with pytest.raises(ValueError, match="Cannot archive"):
+        await archive_weeks(db, date.today() - timedelta(days=MIN_RETENTION_DAYS - 1))
+
+
+@pytest.mark.asyncio
+async def test_fully_archived_year_partitions_are_dropped(db: AsyncSession, meal_type: MealType):
+    """A past year with no live rows left loses its partitions."""
+    year = 2001
+    await ensure_year_partitions(db, [year])
+    meal = await create_meal(db, f"Archive Meal {uuid4().hex[:8]}", meal_type)
+    await add_week(db, date(year, 3, 5), meal_type, meal)
+
+    result = await archive_weeks(db, date(year + 1, 1, 7))
+
+    assert f"weekly_plan_slot_{year}" in result.partitions_dropped
+    assert year not in await get_partition_years(db, "weekly_plan_slot")
+    assert year not in await get_partition_years(db, "weekly_plan_instance_day")
+
+
+@pytest.mark.asyncio
+async def test_partition_drop_gives_up_on_busy_tables(
+    db: AsyncSession, db_engine, meal_type: MealType, monkeypatch
+):
+    """While the plan history is being read, archival keeps the partitions instead of waiting."""
+    monkeypatch.setattr(partitions, "PARTITION_DROP_LOCK_TIMEOUT", "100ms")
+    year = 2002
+    await ensure_year_partitions(db, [year])
+    meal = await create_meal(db, f"Archive Meal {uuid4().hex[:8]}", meal_type)
+    await add_week(db, date(year, 3, 4), meal_type, meal)
+
+    async with db_engine.connect() as reader:
+        await reader.execute(text("LOCK TABLE ONLY weekly_plan_slot IN ACCESS SHARE MODE"))
+        result = await archive_weeks(db, date(year + 1, 1, 6))
+        await reader.rollback()
+
+    assert result.weeks == [date(year, 3, 4)]
+    assert result.partitions_dropped == []
+    assert year in await get_partition_years(db, "weekly_plan_slot")
+    assert year in await get_partition_years(db, "weekly_plan_instance_day")
+    assert await db.scalar(text("SHOW lock_timeout")) == "0"
@@ -0,0 +1,257 @@
+"""
+Tests for the response cache and versioned caches.
+
+These tests verify:
+- LRU eviction and TTL expiry of the in-memory backend
+- Hit/miss accounting and backend swapping in ResponseCache
+- Data versions change the cache key when the underlying day changes
+- Versioned caches and the plan definition snapshots built on them
+"""
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import LRUCacheBackend, ResponseCache, VersionedCache
+from app.models import MealType
+from app.schemas.day_template import DayTemplateCreate, DayTemplateSlotCreate, DayTemplateUpdate
+from app.schemas.week_plan import WeekPlanCreate, WeekPlanDayCreate
+from app.services.data_version import (
+    CATALOG_SCOPE,
+    DEFINITIONS_CHANGED,
+    HISTORY_SCOPE,
+    bump_versions,
+    day_scope,
+    get_versions,
+    today_cache_key,
+    week_cache_key,
+)
+from app.services.day_templates import create_day_template, update_day_template
+from app.services.definitions import get_day_template_snapshot, get_default_week_plan_snapshot
+from app.services.week_plans import create_week_plan, set_default_week_plan
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCacheBackend:
+    """Tests for the in-memory backend."""
+
+    def test_evicts_least_recently_used(self):
+        """Reading an entry protects it from eviction."""
+        backend = LRUCacheBackend(max_entries=2, ttl_seconds=60)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        assert backend.get("a") == 1
+
+        backend.set("c", 3)
+
+        assert backend.get("b") is None
+        assert backend.get("a") == 1
+        assert backend.get("c") == 3
+        assert len(backend) == 2
+
+    def test_entries_expire_after_ttl(self):
+        """Entries older than the TTL are misses."""
+        clock = FakeClock()
+        backend = LRUCacheBackend(max_entries=10, ttl_seconds=5, clock=clock)
+        backend.set("a", 1)
+
+        clock.now = 4.9
+        assert backend.get("a") == 1
+        clock.now = 5.0
+        assert backend.get("a") is None
+        assert len(backend) == 0
+
+
+class TestResponseCache:
+    """Tests for hit/miss accounting."""
+
+    @pytest.mark.asyncio
+    async def test_counts_hits_and_misses(self):
+        """The builder runs once per key; later lookups are hits."""
+        cache = ResponseCache(LRUCacheBackend(max_entries=10, ttl_seconds=60))
+        builds = []
+
+        async def build():
+            builds.append(1)
+            return {"value": len(builds)}
+
+        first = await cache.get_or_build("k", build)
+        second = await cache.get_or_build("k", build)
+
+        assert first == second == {"value": 1}
+        assert len(builds) == 1
+        assert cache.stats() == {"enabled": True, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_builds(self):
+        """A disabled cache neither stores nor counts."""
+        cache = ResponseCache(LRUCacheBackend(max_entries=10, ttl_seconds=60), enabled=False)
+
+        async def build():
+            return object()
+
+        assert await cache.get_or_build("k", build) is not await cache.get_or_build("k", build)
+        assert cache.stats()["hits"] == 0
+        assert cache.stats()["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_use_backend(self):
+        """The storage backend can be swapped."""
+        other = LRUCacheBackend(max_entries=10, ttl_seconds=60)
+        other.set("k", "from other")
+        cache = ResponseCache(LRUCacheBackend(max_entries=10, ttl_seconds=60))
+
+        cache.use_backend(other)
+
+        async def build():
+            return "built"
+
+        assert await cache.get_or_build("k", build) == "from other"
+
+
+class TestDataVersions:
+    """Tests for version counters and cache keys."""
+
+    DAY = date(2170, 5, 6)
+
+    @pytest.mark.asyncio
+    async def test_bump_creates_and_increments(self, db: AsyncSession):
+        """Unknown scopes read as 0; each bump adds one."""
+        scope = day_scope(self.DAY)
+        assert (await get_versions(db, [scope]))[scope] == 0
+
+        await bump_versions(db, [scope])
+        await bump_versions(db, [scope, scope])
+
+        assert (await get_versions(db, [scope]))[scope] == 2
+
+    @pytest.mark.asyncio
+    async def test_today_key_tracks_day_history_and_catalog(self, db: AsyncSession):
+        """The today key changes with its day, the history or the catalog."""
+        keys = [await today_cache_key(db, self.DAY)]
+        for scopes in ([day_scope(self.DAY)], [HISTORY_SCOPE], [CATALOG_SCOPE]):
+            await bump_versions(db, scopes)
+            keys.append(await today_cache_key(db, self.DAY))
+
+        assert len(set(keys)) == 4
+
+    @pytest.mark.asyncio
+    async def test_week_key_ignores_other_weeks(self, db: AsyncSession):
+        """Changing a day outside the week leaves the week key alone."""
+        week_start = date(2170, 5, 5)
+        key = await week_cache_key(db, "instance", week_start)
+
+        await bump_versions(db, [day_scope(date(2170, 5, 12)), HISTORY_SCOPE])
+        assert await week_cache_key(db, "instance", week_start) == key
+
+        await bump_versions(db, [day_scope(date(2170, 5, 11))])
+        assert await week_cache_key(db, "instance", week_start) != key
+
+
+class TestVersionedCache:
+    """Tests for the version-scoped in-process cache."""
+
+    def test_entries_belong_to_one_version(self):
+        """A newer version drops the entries of the older one."""
+        cache = VersionedCache()
+        cache.put("a", 1, "old")
+
+        assert cache.get("a", 1) == "old"
+        assert cache.get("a", 2) is None
+
+        cache.put("b", 2, "new")
+        assert cache.get("a", 2) is None
+        assert cache.get("a", 1) is None
+        assert cache.get("b", 2) == "new"
+
+
+class TestDefinitionSnapshots:
+    """Tests for cached day template and week plan snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_template_snapshot_cached(
+        self, db: AsyncSession, meal_types: list[MealType], query_counter
+    ):
+        """A repeated lookup only reads the definitions version."""
+        template = await create_day_template(db, DayTemplateCreate(
+            name=f"Snapshot Day {uuid4().hex[:8]}",
+            slots=[
+                DayTemplateSlotCreate(position=2, meal_type_id=meal_types[1].id),
+                DayTemplateSlotCreate(position=1, meal_type_id=meal_types[0].id),
+            ],
+        ))
+        # As seen by a later request
+        db.info.pop(DEFINITIONS_CHANGED)
+
+        snapshot = await get_day_template_snapshot(db, template.id)
+        query_counter.reset()
+        assert await get_day_template_snapshot(db, template.id) is snapshot
+
+        assert query_counter.count == 1
+        assert [slot.meal_type_id for slot in snapshot.slots] == [
+            meal_types[0].id, meal_types[1].id,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_template_update_invalidates(
+        self, db: AsyncSession, meal_types: list[MealType]
+    ):
+        """Changing a template's slots is seen on the next lookup."""
+        template = await create_day_template(db, DayTemplateCreate(
+            name=f"Snapshot Day {uuid4().hex[:8]}",
+            slots=[DayTemplateSlotCreate(position=1, meal_type_id=meal_types[0].id)],
+        ))
+        db.info.pop(DEFINITIONS_CHANGED)
+        assert len((await get_day_template_snapshot(db, template.id)).slots) == 1
+
+        template = await update_day_template(db, template, DayTemplateUpdate(slots=[
+            DayTemplateSlotCreate(position=1, meal_type_id=meal_types[0].id),
+            DayTemplateSlotCreate(position=2, meal_type_id=meal_types[2].id),
+        ]))
+        db.info.pop(DEFINITIONS_CHANGED)
+
+        assert len((await get_day_template_snapshot(db, template.id)).slots) == 2
+
+    @pytest.mark.asyncio
+    async def test_default_week_plan_follows_set_default(
+        self, db: AsyncSession, meal_types: list[MealType]
+    ):
+        """Changing the default week plan is seen on the next lookup."""
+        template = await create_day_template(db, DayTemplateCreate(
+            name=f"Snapshot Day {uuid4().hex[:8]}",
+            slots=[DayTemplateSlotCreate(position=1, meal_type_id=meal_types[0].id)],
+        ))
+        days = [WeekPlanDayCreate(weekday=weekday, day_template_id=template.id) for weekday in range(7)]
+        first = await create_week_plan(db, WeekPlanCreate(name="First", is_default=True, days=days))
+        second = await create_week_plan(db, WeekPlanCreate(name="Second", days=days))
+        db.info.pop(DEFINITIONS_CHANGED)
+        assert (await get_default_week_plan_snapshot(db)).id == first.id
+
+        await set_default_week_plan(db, second)
+        db.info.pop(DEFINITIONS_CHANGED)
+
+        snapshot = await get_default_week_plan_snapshot(db)
+        assert snapshot.id == second.id
+        assert snapshot.day_template_ids == {weekday: template.id for weekday in range(7)}
+
+    @pytest.mark.asyncio
+    async def test_session_with_changes_bypasses_cache(
+        self, db: AsyncSession, meal_types: list[MealType]
+    ):
+        """Uncommitted definitions are never cached."""
+        template = await create_day_template(db, DayTemplateCreate(
+            name=f"Snapshot Day {uuid4().hex[:8]}",
+            slots=[DayTemplateSlotCreate(position=1, meal_type_id=meal_types[0].id)],
+        ))
+
+        snapshot = await get_day_template_snapshot(db, template.id)
+
+        assert await get_day_template_snapshot(db, template.id) is not snapshot
@@ -99,6 +99,38 @@ async def test_list_day_templates(
     assert " → " in tmpl["slot_preview"]
 
 
+@pytest.mark.asyncio
+async def test_list_day_templates_single_query(
+    client: AsyncClient, db: AsyncSession, sample_meal_types: list[MealType], query_counter
+):
+    """GET /day-templates takes one query however many templates exist."""
+    suffix = uuid4().hex[:8]
+    templates = [DayTemplate(id=uuid4(), name=f"Bulk {suffix} {i}") for i in range(5)]
+    db.add_all(templates)
+    await db.flush()
+    # Slots added out of position order; the preview follows position
+    for template in templates[:4]:
+        for position, mt in reversed(list(enumerate(sample_meal_types, 1))):
+            db.add(DayTemplateSlot(
+                id=uuid4(), day_template_id=template.id, position=position, meal_type_id=mt.id,
+            ))
+    await db.flush()
+
+    query_counter.reset()
+    response = await client.get("/api/v1/day-templates")
+    assert response.status_code == 200
+    assert query_counter.count == 1
+
+    by_id = {t["id"]: t for t in response.json()}
+    expected_preview = " → ".join(mt.name for mt in sample_meal_types)
+    for template in templates[:4]:
+        assert by_id[str(template.id)]["slot_count"] == 3
+        assert by_id[str(template.id)]["slot_preview"] == expected_preview
+    empty = by_id[str(templates[4].id)]
+    assert empty["slot_count"] == 0
+    assert empty["slot_preview"] is None
+
+
 # =============================================================================
 # GET /api/v1/day-templates/{id} - Get single template
 # =============================================================================
@@ -0,0 +1,111 @@
+"""
+Tests for per-request SQL instrumentation.
+
+These tests verify:
+- Responses carry X-DB-Queries and Server-Timing headers
+- Statements are only recorded while a request is served
+- Each request logs one summary line, and slow statements are logged
+"""
+import logging
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.instrumentation import (
+    QueryInstrumentationMiddleware,
+    QueryStats,
+    current_query_stats,
+    install_query_instrumentation,
+)
+from app.main import app
+
+
+@pytest_asyncio.fixture
+async def client(db: AsyncSession, db_engine):
+    """HTTP client whose requests are timed on the test engine."""
+    install_query_instrumentation(db_engine.sync_engine)
+    # Open the fixture's savepoint now so it is not counted in the first request
+    await db.execute(text("SELECT 1"))
+
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+def query_app(db: AsyncSession, statements: int):
+    """Bare ASGI app that runs SELECT 1 a number of times, then answers 204."""
+
+    async def inner(scope, receive, send):
+        for _ in range(statements):
+            await db.execute(text("SELECT 1"))
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return inner
+
+
+def test_query_stats_tracks_slowest():
+    """The slowest statement and the running total are kept."""
+    stats = QueryStats()
+    stats.record("SELECT 1", 2.0)
+    stats.record("SELECT 2", 5.0)
+    stats.record("SELECT 3", 1.0)
+
+    assert stats.count == 3
+    assert stats.total_ms == 8.0
+    assert stats.slowest_ms == 5.0
+    assert stats.slowest_statement == "SELECT 2"
+
+
+@pytest.mark.asyncio
+async def test_response_headers(client: AsyncClient):
+    """API responses report their statement count and DB time."""
+    response = await client.get("/api/v1/day-templates")
+
+    assert response.status_code == 200
+    # The template list is a single aggregated query
+    assert response.headers["X-DB-Queries"] == "1"
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="1 queries"' in response.headers["Server-Timing"]
+    assert "app;dur=" in response.headers["Server-Timing"]
+
+
+@pytest.mark.asyncio
+async def test_statements_outside_requests_are_not_recorded(db: AsyncSession, db_engine):
+    """Without a request in flight there is nothing to record into."""
+    install_query_instrumentation(db_engine.sync_engine)
+    await db.execute(text("SELECT 1"))
+    assert current_query_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_logs_summary_and_slow_statement(db: AsyncSession, db_engine, caplog):
+    """One summary line per request; slow statements are logged with their SQL."""
+    install_query_instrumentation(db_engine.sync_engine)
+    await db.execute(text("SELECT 1"))
+    middleware = QueryInstrumentationMiddleware(query_app(db, 3), slow_query_ms=0)
+
+    with caplog.at_level(logging.INFO, logger="app.instrumentation"):
+        async with AsyncClient(
+            transport=ASGITransport(app=middleware), base_url="http://test"
+        ) as client:
+            response = await client.get("/probe")
+
+    assert response.headers["X-DB-Queries"] == "3"
+    summary, slow = [r.getMessage() for r in caplog.records]
+    assert "path=/probe status=204" in summary
+    assert "db_queries=3" in summary
+    assert "statement=SELECT 1" in slow
@@ -3,6 +3,7 @@ Integration tests for the Meal CRUD API endpoints.
 
 Tests cover:
 - GET /api/v1/meals - List meals (paginated, search, filter)
+- GET /api/v1/meals/search - Meal picker search (keyset paginated)
 - GET /api/v1/meals/{id} - Get single meal
 - POST /api/v1/meals - Create meal
 - PUT /api/v1/meals/{id} - Update meal
@@ -13,6 +14,7 @@ These tests verify:
 - Pagination returns correct metadata
 - Search filters by meal name (case-insensitive)
 - Meal type filter works
+- Search cursors walk every match exactly once; ranked search covers notes
 - Meal type associations are created/updated/deleted
 - 404 for non-existent meals
 - Validation errors for invalid data
@@ -224,6 +226,121 @@ async def test_list_meals_filter_by_meal_type(
     assert data["items"][0]["name"] == f"Oatmeal {suffix}"
 
 
+# =============================================================================
+# GET /api/v1/meals/search - Meal picker search
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_search_meals_walks_pages_by_cursor(client: AsyncClient, db: AsyncSession):
+    """Following next_cursor returns every match once, in name order."""
+    suffix = uuid4().hex[:8]
+    # Duplicate names exercise the id tie-breaker
+    names = [f"Keyset {suffix} {letter}" for letter in "EDCBA"] + [f"Keyset {suffix} C"]
+    for name in names:
+        db.add(Meal(id=uuid4(), name=name, portion_description="1 bowl"))
+    await db.flush()
+
+    seen, cursor = [], None
+    for _ in range(len(names)):
+        params = {"q": f"keyset {suffix}", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/meals/search", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        seen.extend(data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [item["name"] for item in seen] == sorted(names)
+    assert len({item["id"] for item in seen}) == len(names)
+
+
+@pytest.mark.asyncio
+async def test_search_meals_total_and_type_filter(
+    client: AsyncClient, db: AsyncSession, sample_meal_types: list[MealType]
+):
+    """include_total counts all matches; meal_type_id narrows them."""
+    suffix = uuid4().hex[:8]
+    meals = [Meal(id=uuid4(), name=f"Total {suffix} {i}", portion_description="1 plate") for i in range(3)]
+    db.add_all(meals)
+    await db.flush()
+    await db.execute(
+        meal_to_meal_type.insert().values(meal_id=meals[0].id, meal_type_id=sample_meal_types[0].id)
+    )
+    await db.flush()
+
+    response = await client.get(
+        "/api/v1/meals/search", params={"q": suffix, "limit": 1, "include_total": "true"}
+    )
+    data = response.json()
+    assert data["total"] == 3
+    assert len(data["items"]) == 1
+    assert data["next_cursor"] is not None
+
+    response = await client.get(
+        "/api/v1/meals/search",
+        params={"q": suffix, "meal_type_id": str(sample_meal_types[0].id)},
+    )
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [str(meals[0].id)]
+    assert data["items"][0]["meal_types"][0]["name"] == sample_meal_types[0].name
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_search_meals_escapes_wildcards(client: AsyncClient, db: AsyncSession):
+    """LIKE wildcards in the query match literally."""
+    suffix = uuid4().hex[:8]
+    db.add(Meal(id=uuid4(), name=f"Yogurt 2% {suffix}", portion_description="200g"))
+    db.add(Meal(id=uuid4(), name=f"Yogurt 25 {suffix}", portion_description="200g"))
+    await db.flush()
+
+    response = await client.get("/api/v1/meals/search", params={"q": f"2% {suffix}"})
+    assert [item["name"] for item in response.json()["items"]] == [f"Yogurt 2% {suffix}"]
+
+
+@pytest.mark.asyncio
+async def test_search_meals_ranked_matches_notes(client: AsyncClient, db: AsyncSession):
+    """Ranked search also matches words in portion and notes, best first."""
+    suffix = uuid4().hex[:8]
+    term = f"wasabi{suffix}"
+    weak = Meal(id=uuid4(), name=f"Poke {suffix}", portion_description="1 bowl", notes=f"Add {term}")
+    strong = Meal(
+        id=uuid4(), name=f"Sushi {term}", portion_description=f"8 pieces, {term}", notes=f"Extra {term}"
+    )
+    db.add_all([weak, strong])
+    await db.flush()
+
+    response = await client.get("/api/v1/meals/search", params={"q": term})
+    assert [item["id"] for item in response.json()["items"]] == [str(strong.id)]
+
+    response = await client.get("/api/v1/meals/search", params={"q": term, "ranked": "true"})
+    assert [item["id"] for item in response.json()["items"]] == [str(strong.id), str(weak.id)]
+
+    # Ranked cursors continue after the rank of the last row
+    response = await client.get(
+        "/api/v1/meals/search", params={"q": term, "ranked": "true", "limit": 1}
+    )
+    cursor = response.json()["next_cursor"]
+    response = await client.get(
+        "/api/v1/meals/search", params={"q": term, "ranked": "true", "limit": 1, "cursor": cursor}
+    )
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [str(weak.id)]
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_search_meals_invalid_cursor(client: AsyncClient):
+    """A malformed cursor is a 400, not a 500."""
+    response = await client.get("/api/v1/meals/search", params={"q": "x", "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
 # =============================================================================
 # GET /api/v1/meals/{id} - Get single meal
 # =============================================================================
@@ -13,8 +13,11 @@ These tests verify:
 - Meal type associations are created correctly
 - Duplicate meal names are allowed
 - Trailing blank rows are ignored
+- Streamed, batched imports keep row numbering and file order
+- Streams are read off the event loop thread
 """
 import io
+import threading
 from uuid import uuid4
 
 
@@ -32,6 +35,7 @@ from app.main import app
 from app.models import Meal, MealType
 from app.models.meal_to_meal_type import meal_to_meal_type
 from app.database import get_db
+from app.services.meals import import_meals_from_csv
 
 
 @pytest_asyncio.fixture
@@ -468,3 +472,95 @@ async def test_import_utf8_bom(client: AsyncClient, db: AsyncSession):
 
     result = await db.execute(select(Meal).where(Meal.name == f"BOM Meal {uid}"))
     assert result.scalars().first() is not None
+
+
+# --- Streaming / Batching Tests ---
+
+
+@pytest.mark.asyncio
+async def test_import_spans_multiple_batches(
+    client: AsyncClient, db: AsyncSession, monkeypatch
+):
+    """Rows across batch boundaries keep order, associations and new types."""
+    monkeypatch.setattr("app.services.meals.IMPORT_BATCH_SIZE", 3)
+    uid = _uid()
+    new_type = f"Batch Type {uid}"
+    rows = [f'Batch Meal {uid} {i:02d},1 portion,"{new_type}"' for i in range(7)]
+    rows.insert(4, f",missing name,{new_type}")
+    csv_data = _make_csv("name,portion_description,meal_types", *rows)
+
+    response = await client.post(
+        "/api/v1/meals/import",
+        files={"file": ("meals.csv", io.BytesIO(csv_data), "text/csv")},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["summary"] == {
+        "total_rows": 8,
+        "created": 7,
+        "skipped": 1,
+        "warnings": 1,
+        "created_meal_types": [new_type],
+    }
+    assert data["errors"] == [{"row": 5, "message": "Missing required field: name"}]
+    assert data["warnings"] == [{"row": 1, "message": f"Created new meal type: '{new_type}'"}]
+
+    # Meals enter the rotation in file order
+    result = await db.execute(
+        select(Meal.name)
+        .join(meal_to_meal_type, meal_to_meal_type.c.meal_id == Meal.id)
+        .join(MealType, MealType.id == meal_to_meal_type.c.meal_type_id)
+        .where(MealType.name == new_type)
+        .order_by(Meal.created_at, Meal.id)
+    )
+    assert result.scalars().all() == [f"Batch Meal {uid} {i:02d}" for i in range(7)]
+
+
+@pytest.mark.asyncio
+async def test_import_service_accepts_line_stream(db: AsyncSession):
+    """The service parses any iterable of lines, not just a string."""
+    uid = _uid()
+    lines = iter([
+        "name,portion_description,calories_kcal\n",
+        f"Stream Meal {uid},1 bowl,410\n",
+        f"Stream Meal {uid} 2,1 plate,oops\n",
+    ])
+
+    result = await import_meals_from_csv(db, lines)
+
+    assert result.summary.created == 2
+    assert result.warnings[0].row == 2
+    assert "calories_kcal" in result.warnings[0].message
+
+
+@pytest.mark.asyncio
+async def test_import_service_reads_stream_in_worker_thread(db: AsyncSession):
+    """A blocking stream is never read on the event loop thread."""
+    uid = _uid()
+    reading_threads = set()
+
+    def lines():
+        for line in ("name,portion_description\n", f"Thread Meal {uid},1 bowl\n"):
+            reading_threads.add(threading.get_ident())
+            yield line
+
+    result = await import_meals_from_csv(db, lines())
+
+    assert result.summary.created == 1
+    assert reading_threads
+    assert threading.get_ident() not in reading_threads
+
+
+@pytest.mark.asyncio
+async def test_import_invalid_utf8(client: AsyncClient):
+    """Bytes that are not UTF-8 are rejected with 400."""
+    csv_data = b"name,portion_description\nCaf\xe9 Meal,1 cup\n"
+
+    response = await client.post(
+        "/api/v1/meals/import",
+        files={"file": ("meals.csv", io.BytesIO(csv_data), "text/csv")},
+    )
+
+    assert response.status_code == 400
+    assert "UTF-8" in response.json()["detail"]
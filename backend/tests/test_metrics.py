@@ -0,0 +1,117 @@
+"""
+Tests for the Prometheus metrics.
+
+These tests verify:
+- /metrics serves the Prometheus text format
+- Requests are counted under their route template, unmatched paths apart
+- Pool gauges follow connection checkout and checkin
+- CSV import rows are counted by outcome
+"""
+import io
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.database import get_db
+from app.main import app
+from app.metrics import install_pool_metrics
+
+from .conftest import TEST_DATABASE_URL
+
+
+@pytest_asyncio.fixture
+async def client(db: AsyncSession):
+    """Create an async HTTP client with database override."""
+
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+def sample(name: str, **labels) -> float:
+    """Current value of a sample (0 if it was never recorded)."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient):
+    """/metrics answers in the Prometheus text format."""
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "mealframe_http_request_duration_seconds" in response.text
+
+
+@pytest.mark.asyncio
+async def test_requests_labelled_by_route_template(client: AsyncClient):
+    """Path parameters do not leak into the route label."""
+    route = "/api/v1/meals/{meal_id}"
+    before = sample("mealframe_http_requests_total", method="GET", route=route, status="404")
+    observed = sample("mealframe_http_request_duration_seconds_count", method="GET", route=route)
+
+    await client.get(f"/api/v1/meals/{uuid4()}")
+    await client.get(f"/api/v1/meals/{uuid4()}")
+
+    assert sample("mealframe_http_requests_total", method="GET", route=route, status="404") == before + 2
+    assert sample("mealframe_http_request_duration_seconds_count", method="GET", route=route) == observed + 2
+
+
+@pytest.mark.asyncio
+async def test_unmatched_paths_share_one_label(client: AsyncClient):
+    """Unknown paths are counted together, not one series per path."""
+    before = sample("mealframe_http_requests_total", method="GET", route="unmatched", status="404")
+
+    await client.get(f"/no-such-page/{uuid4()}")
+
+    assert sample("mealframe_http_requests_total", method="GET", route="unmatched", status="404") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_pool_gauges_follow_checkouts():
+    """The checked-out gauge rises while a connection is held."""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    install_pool_metrics(engine.sync_engine)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert sample("mealframe_db_pool_checked_out") == 1
+        assert sample("mealframe_db_pool_checked_out") == 0
+        assert sample("mealframe_db_pool_overflow") == 0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_import_rows_counted(client: AsyncClient):
+    """Created and skipped import rows are counted separately."""
+    created = sample("mealframe_meal_import_rows_total", outcome="created")
+    skipped = sample("mealframe_meal_import_rows_total", outcome="skipped")
+    csv_data = (
+        "name,portion_description\n"
+        f"Metric Meal {uuid4().hex[:8]},1 bowl\n"
+        f"Metric Meal {uuid4().hex[:8]},\n"
+    ).encode()
+
+    response = await client.post(
+        "/api/v1/meals/import",
+        files={"file": ("meals.csv", io.BytesIO(csv_data), "text/csv")},
+    )
+
+    assert response.status_code == 200
+    assert sample("mealframe_meal_import_rows_total", outcome="created") == created + 1
+    assert sample("mealframe_meal_import_rows_total", outcome="skipped") == skipped + 1
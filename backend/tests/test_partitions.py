@@ -0,0 +1,106 @@
+"""
+Tests for the yearly partitions of the plan history tables.
+
+These tests verify:
+- Missing yearly partitions are created for every partitioned table
+- Rows already in the DEFAULT partition move into the new partition
+- Date-range queries only scan the partitions of the years they touch
+
+Partition DDL runs inside the test transaction and is rolled back with it.
+"""
+import json
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import MealType, WeekPlan, WeeklyPlanInstance, WeeklyPlanSlot
+from app.services.partitions import (
+    PARTITIONED_TABLES,
+    ensure_upcoming_partitions,
+    ensure_year_partitions,
+    get_partition_years,
+)
+
+# Far enough ahead that no other test has data in it
+YEAR = 2090
+
+
+async def add_slot(db: AsyncSession, slot_date: date, meal_type: MealType) -> WeeklyPlanSlot:
+    week_plan = WeekPlan(id=uuid4(), name=f"Partition Plan {uuid4().hex[:8]}", is_default=False)
+    db.add(week_plan)
+    await db.flush()
+    instance = WeeklyPlanInstance(id=uuid4(), week_plan_id=week_plan.id, week_start_date=slot_date)
+    db.add(instance)
+    await db.flush()
+    slot = WeeklyPlanSlot(
+        id=uuid4(),
+        weekly_plan_instance_id=instance.id,
+        date=slot_date,
+        position=1,
+        meal_type_id=meal_type.id,
+    )
+    db.add(slot)
+    await db.flush()
+    return slot
+
+
+async def stored_in(db: AsyncSession, slot: WeeklyPlanSlot) -> str:
+    """Name of the partition holding a slot."""
+    result = await db.execute(
+        text("SELECT tableoid::regclass::text FROM weekly_plan_slot WHERE id = :id"),
+        {"id": slot.id},
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_creates_missing_partitions(db: AsyncSession):
+    """Every partitioned table gets the year; a second call is a no-op."""
+    created = await ensure_year_partitions(db, [YEAR])
+
+    assert created == [f"{table}_{YEAR}" for table in PARTITIONED_TABLES]
+    for table in PARTITIONED_TABLES:
+        assert YEAR in await get_partition_years(db, table)
+    assert await ensure_year_partitions(db, [YEAR]) == []
+
+
+@pytest.mark.asyncio
+async def test_upcoming_partitions_cover_next_year(db: AsyncSession):
+    """The current and the next year are kept partitioned."""
+    await ensure_upcoming_partitions(db, today=date(YEAR, 6, 1))
+
+    assert {YEAR, YEAR + 1} <= await get_partition_years(db, "weekly_plan_slot")
+
+
+@pytest.mark.asyncio
+async def test_rows_move_out_of_default_partition(db: AsyncSession, meal_type: MealType):
+    """Rows written before their year had a partition are moved into it."""
+    slot = await add_slot(db, date(YEAR, 3, 2), meal_type)
+    assert await stored_in(db, slot) == "weekly_plan_slot_default"
+
+    await ensure_year_partitions(db, [YEAR])
+
+    assert await stored_in(db, slot) == f"weekly_plan_slot_{YEAR}"
+
+
+@pytest.mark.asyncio
+async def test_date_range_query_prunes_partitions(db: AsyncSession):
+    """A one-year range scans only that year's partition."""
+    await ensure_year_partitions(db, [YEAR, YEAR + 1])
+
+    result = await db.execute(
+        text(
+            "EXPLAIN (FORMAT JSON) SELECT count(*) FROM weekly_plan_slot "
+            "WHERE date >= :start AND date < :end"
+        ),
+        {"start": date(YEAR, 1, 1), "end": date(YEAR, 12, 31)},
+    )
+    plan = result.scalar()
+    plan_text = plan if isinstance(plan, str) else json.dumps(plan)
+
+    assert f"weekly_plan_slot_{YEAR}" in plan_text
+    assert f"weekly_plan_slot_{YEAR + 1}" not in plan_text
+    assert "weekly_plan_slot_default" not in plan_text
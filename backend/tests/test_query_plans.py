@@ -0,0 +1,182 @@
+"""
+Query plan tests for the weekly_plan_slot indexes.
+
+These tests verify that the hot slot queries can be served from an index:
+- Today view: slots of a day (uq_weekly_plan_slot_position)
+- Week view: slots of a week (uq_weekly_plan_slot_position)
+- Stats: date-range aggregates (ix_weekly_plan_slot_date_covering)
+- Regeneration: unmarked slots (ix_weekly_plan_slot_unmarked)
+
+The statements each service actually sends are recorded and run through
+EXPLAIN with sequential scans disabled. Test tables are far too small for the
+planner to prefer an index on cost alone, so this checks that an index path
+exists, not which plan production data would get. The table is partitioned,
+so plans read partitions through their copies of the indexes; these are
+mapped back to the parent index names.
+"""
+import json
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    DayTemplate,
+    DayTemplateSlot,
+    MealType,
+    WeekPlan,
+    WeeklyPlanInstance,
+    WeeklyPlanInstanceDay,
+    WeeklyPlanSlot,
+)
+from app.services.partitions import ensure_upcoming_partitions
+from app.services.stats import get_stats
+from app.services.today import get_today_response
+from app.services.weekly import get_week_view, regenerate_weekly_plan
+
+from .conftest import create_meal
+
+SLOT_TABLE = "weekly_plan_slot"
+
+
+class SlotQueryRecorder:
+    """Records SELECTs reading weekly_plan_slot, with their parameters."""
+
+    def __init__(self):
+        self.queries: list[tuple[str, tuple]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and SLOT_TABLE in statement:
+            self.queries.append((statement, parameters))
+
+
+@pytest.fixture
+def slot_queries(db_engine):
+    recorder = SlotQueryRecorder()
+    event.listen(db_engine.sync_engine, "before_cursor_execute", recorder)
+    yield recorder
+    event.remove(db_engine.sync_engine, "before_cursor_execute", recorder)
+
+
+async def explain(db: AsyncSession, statement: str, parameters: tuple) -> dict:
+    """The plan of a recorded statement (JSON format), sequential scans disabled."""
+    conn = await db.connection()
+    await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    try:
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar()
+    finally:
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = on")
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def slot_scans(plan: dict) -> list[dict]:
+    """Plan nodes reading weekly_plan_slot or one of its partitions."""
+    nodes = [plan] if plan.get("Relation Name", "").startswith(SLOT_TABLE) else []
+    for child in plan.get("Plans", []):
+        nodes.extend(slot_scans(child))
+    return nodes
+
+
+def index_names(node: dict) -> set[str]:
+    """Indexes used by a scan node (bitmap scans keep them in child nodes)."""
+    names = {node["Index Name"]} if "Index Name" in node else set()
+    for child in node.get("Plans", []):
+        names |= index_names(child)
+    return names
+
+
+async def assert_slot_indexes(
+    db: AsyncSession,
+    recorder: SlotQueryRecorder,
+    expected_index: str,
+) -> None:
+    """Every recorded slot scan uses an index, expected_index among them."""
+    assert recorder.queries, "no weekly_plan_slot query was recorded"
+    queries = list(recorder.queries)
+    # Partition index -> partitioned (parent) index
+    parent_index = dict((await db.execute(text(
+        "SELECT child.relname, parent.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relkind = 'I'"
+    ))).all())
+    used: set[str] = set()
+    for statement, parameters in queries:
+        for node in slot_scans(await explain(db, statement, parameters)):
+            assert node["Node Type"] != "Seq Scan", statement
+            used |= {parent_index.get(name, name) for name in index_names(node)}
+    assert expected_index in used
+
+
+@pytest_asyncio.fixture
+async def planned_week(db: AsyncSession, meal_type: MealType) -> WeeklyPlanInstance:
+    """A generated-looking current week: one template slot per day, none marked."""
+    await ensure_upcoming_partitions(db)
+    meal = await create_meal(db, f"Plan Meal {uuid4().hex[:8]}", meal_type)
+    template = DayTemplate(id=uuid4(), name=f"Plan Template {uuid4().hex[:8]}")
+    db.add(template)
+    await db.flush()
+    db.add(DayTemplateSlot(
+        id=uuid4(), day_template_id=template.id, position=1, meal_type_id=meal_type.id,
+    ))
+    week_plan = WeekPlan(id=uuid4(), name=f"Plan Week {uuid4().hex[:8]}", is_default=False)
+    db.add(week_plan)
+    await db.flush()
+
+    today = date.today()
+    week_start = today - timedelta(days=today.weekday())
+    instance = WeeklyPlanInstance(id=uuid4(), week_plan_id=week_plan.id, week_start_date=week_start)
+    db.add(instance)
+    await db.flush()
+    for offset in range(7):
+        day = week_start + timedelta(days=offset)
+        db.add(WeeklyPlanInstanceDay(
+            id=uuid4(), weekly_plan_instance_id=instance.id, date=day,
+            day_template_id=template.id, is_override=False,
+        ))
+        db.add(WeeklyPlanSlot(
+            id=uuid4(), weekly_plan_instance_id=instance.id, date=day, position=1,
+            meal_type_id=meal_type.id, meal_id=meal.id,
+        ))
+    await db.flush()
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_today_query_uses_index(db: AsyncSession, planned_week, slot_queries):
+    """The day's slots are read through the (instance, date, position) index."""
+    await get_today_response(db, date.today())
+
+    await assert_slot_indexes(db, slot_queries, "uq_weekly_plan_slot_position")
+
+
+@pytest.mark.asyncio
+async def test_week_query_uses_index(db: AsyncSession, planned_week, slot_queries):
+    """The week's slots are read through the (instance, date, position) index."""
+    await get_week_view(db, planned_week.id)
+
+    await assert_slot_indexes(db, slot_queries, "uq_weekly_plan_slot_position")
+
+
+@pytest.mark.asyncio
+async def test_stats_query_uses_covering_index(db: AsyncSession, planned_week, slot_queries):
+    """Per-meal-type adherence scans the covering date index."""
+    await get_stats(db, 30)
+
+    await assert_slot_indexes(db, slot_queries, "ix_weekly_plan_slot_date_covering")
+
+
+@pytest.mark.asyncio
+async def test_regeneration_query_uses_partial_index(
+    db: AsyncSession, planned_week, slot_queries
+):
+    """Regeneration reads unmarked slots through the partial index."""
+    await regenerate_weekly_plan(db, planned_week.week_start_date)
+
+    await assert_slot_indexes(db, slot_queries, "ix_weekly_plan_slot_unmarked")
@@ -0,0 +1,159 @@
+"""
+Tests for the orjson response path (settings.fast_json_responses).
+
+These tests verify:
+- The week view and the stats encode to the same JSON either way
+- Fast responses keep the ETag and Cache-Control validators
+- The default path caches validated week models and never validates a hit
+- Values orjson cannot encode are rejected
+"""
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import FastJSONResponse
+from app.cache import response_cache
+from app.config import settings
+from app.database import get_db
+from app.main import app
+from app.models import (
+    DayTemplate,
+    MealType,
+    WeekPlan,
+    WeeklyPlanInstance,
+    WeeklyPlanInstanceDay,
+    WeeklyPlanSlot,
+)
+from app.schemas.weekly_plan import WeeklyPlanInstanceResponse
+from app.services.rollup import refresh_daily_rollup
+
+from .conftest import create_meal
+
+
+@pytest_asyncio.fixture
+async def client(db: AsyncSession):
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def week_start(db: AsyncSession, meal_type: MealType) -> date:
+    """A current week with macros, completion times and an empty slot."""
+    meal = await create_meal(db, f"Fast Meal {uuid4().hex[:8]}", meal_type)
+    meal.calories_kcal = 512
+    meal.protein_g = Decimal("31.5")
+    template = DayTemplate(id=uuid4(), name=f"Fast Template {uuid4().hex[:8]}")
+    week_plan = WeekPlan(id=uuid4(), name=f"Fast Plan {uuid4().hex[:8]}", is_default=False)
+    db.add_all([template, week_plan])
+    await db.flush()
+
+    today = date.today()
+    start = today - timedelta(days=today.weekday())
+    instance = WeeklyPlanInstance(id=uuid4(), week_plan_id=week_plan.id, week_start_date=start)
+    db.add(instance)
+    await db.flush()
+    completed_at = datetime(2026, 1, 5, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    for offset in range(7):
+        day = start + timedelta(days=offset)
+        db.add(WeeklyPlanInstanceDay(
+            id=uuid4(), weekly_plan_instance_id=instance.id, date=day,
+            day_template_id=template.id if offset else None,
+            is_override=offset == 6, override_reason="Dinner out" if offset == 6 else None,
+        ))
+        db.add(WeeklyPlanSlot(
+            id=uuid4(), weekly_plan_instance_id=instance.id, date=day, position=1,
+            meal_type_id=meal_type.id, meal_id=meal.id,
+            completion_status="followed", completed_at=completed_at,
+        ))
+        db.add(WeeklyPlanSlot(
+            id=uuid4(), weekly_plan_instance_id=instance.id, date=day, position=2,
+        ))
+    await db.flush()
+    await refresh_daily_rollup(db, [start + timedelta(days=offset) for offset in range(7)])
+    return start
+
+
+async def get_both_ways(client: AsyncClient, monkeypatch, url: str, params: dict):
+    """The response with the fast path off, then on."""
+    monkeypatch.setattr(settings, "fast_json_responses", False)
+    standard = await client.get(url, params=params)
+    response_cache.clear()
+    monkeypatch.setattr(settings, "fast_json_responses", True)
+    fast = await client.get(url, params=params)
+    return standard, fast
+
+
+@pytest.mark.asyncio
+async def test_week_view_encodes_the_same(client: AsyncClient, monkeypatch, week_start):
+    standard, fast = await get_both_ways(
+        client, monkeypatch, "/api/v1/weekly-plans/current",
+        {"week_start_date": week_start.isoformat()},
+    )
+
+    assert standard.status_code == fast.status_code == 200
+    assert fast.json() == standard.json()
+    slot = fast.json()["days"][0]["slots"][0]
+    assert slot["completed_at"] == "2026-01-05T12:30:15.123456Z"
+    assert slot["meal"]["protein_g"] == "31.5"
+
+
+@pytest.mark.asyncio
+async def test_stats_encode_the_same(client: AsyncClient, monkeypatch, week_start):
+    standard, fast = await get_both_ways(client, monkeypatch, "/api/v1/stats", {"days": 365})
+
+    assert standard.status_code == fast.status_code == 200
+    assert fast.json() == standard.json()
+    assert fast.json()["daily_adherence"]
+
+
+@pytest.mark.asyncio
+async def test_fast_response_keeps_validators(client: AsyncClient, monkeypatch, week_start):
+    monkeypatch.setattr(settings, "fast_json_responses", True)
+    params = {"week_start_date": week_start.isoformat()}
+
+    response = await client.get("/api/v1/weekly-plans/current", params=params)
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["cache-control"] == "no-cache"
+    etag = response.headers["etag"]
+    response = await client.get(
+        "/api/v1/weekly-plans/current", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_default_path_validates_week_once(client: AsyncClient, monkeypatch, week_start):
+    monkeypatch.setattr(settings, "fast_json_responses", False)
+    params = {"week_start_date": week_start.isoformat()}
+    validate = WeeklyPlanInstanceResponse.model_validate
+    calls = []
+
+    def counting_validate(*args, **kwargs):
+        calls.append(args)
+        return validate(*args, **kwargs)
+
+    monkeypatch.setattr(WeeklyPlanInstanceResponse, "model_validate", counting_validate)
+
+    first = await client.get("/api/v1/weekly-plans/current", params=params)
+    second = await client.get("/api/v1/weekly-plans/current", params=params)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+    assert len(calls) == 1
+
+
+def test_unsupported_values_are_rejected():
+    with pytest.raises(TypeError):
+        FastJSONResponse({"value": object()})
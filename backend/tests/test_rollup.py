@@ -0,0 +1,236 @@
+"""
+Tests for the daily completion rollup.
+
+These tests verify:
+- Per-day counts, override flag and macro sums are computed from slots
+- Services that mutate slots, days or meal macros keep the rollup in sync
+- Rows disappear when a date loses all of its plan data
+- A range rebuild reproduces what incremental refreshes wrote
+"""
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    DailyCompletionRollup,
+    Meal,
+    MealType,
+    WeeklyPlanInstance,
+    WeeklyPlanInstanceDay,
+    WeeklyPlanSlot,
+)
+from app.schemas.meal import MealUpdate
+from app.services.meals import update_meal
+from app.services.rollup import rebuild_daily_rollup, refresh_daily_rollup
+from app.services.today import complete_slot, uncomplete_slot
+from app.services.weekly import set_day_override
+
+from .conftest import create_meal
+
+# Far-future week keeps these tests clear of any seeded data
+WEEK_START = date(2160, 3, 3)
+DAY = date(2160, 3, 4)
+
+
+@pytest_asyncio.fixture
+async def meal(db: AsyncSession, meal_type: MealType) -> Meal:
+    """A meal without macros, assigned to meal_type."""
+    return await create_meal(db, f"Rollup meal {uuid4().hex[:8]}", meal_type)
+
+
+async def create_day(
+    db: AsyncSession,
+    meal_type: MealType,
+    meal: Meal | None,
+    statuses: list[str | None],
+    day_date: date = DAY,
+) -> tuple[WeeklyPlanInstance, list[WeeklyPlanSlot]]:
+    """Create an instance, a plan day and one slot per status (no rollup refresh)."""
+    instance = WeeklyPlanInstance(id=uuid4(), week_start_date=WEEK_START)
+    db.add(instance)
+    await db.flush()
+    db.add(WeeklyPlanInstanceDay(
+        id=uuid4(), weekly_plan_instance_id=instance.id, date=day_date,
+    ))
+    slots = [
+        WeeklyPlanSlot(
+            id=uuid4(),
+            weekly_plan_instance_id=instance.id,
+            date=day_date,
+            position=position,
+            meal_type_id=meal_type.id,
+            meal_id=meal.id if meal else None,
+            completion_status=status,
+        )
+        for position, status in enumerate(statuses, 1)
+    ]
+    db.add_all(slots)
+    await db.flush()
+    return instance, slots
+
+
+async def get_rollup(db: AsyncSession, day_date: date = DAY) -> DailyCompletionRollup | None:
+    """Read the rollup row for a date, bypassing the identity map."""
+    result = await db.execute(
+        select(DailyCompletionRollup)
+        .where(DailyCompletionRollup.date == day_date)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def create_meal_with_macros(
+    db: AsyncSession, meal_type: MealType, calories: int, protein: str
+) -> Meal:
+    """Create a meal with calories and protein set."""
+    meal = await create_meal(db, f"Macro meal {uuid4().hex[:8]}", meal_type)
+    meal.calories_kcal = calories
+    meal.protein_g = Decimal(protein)
+    await db.flush()
+    return meal
+
+
+class TestRefreshDailyRollup:
+    """Tests for refresh_daily_rollup."""
+
+    @pytest.mark.asyncio
+    async def test_counts_statuses_and_sums_macros(
+        self, db: AsyncSession, meal_type: MealType
+    ):
+        """Each status is counted and macros are summed over assigned meals."""
+        meal = await create_meal_with_macros(db, meal_type, 500, "30.5")
+        await create_day(
+            db, meal_type, meal, ["followed", "followed", "skipped", "social", None]
+        )
+
+        await refresh_daily_rollup(db, [DAY])
+
+        row = await get_rollup(db)
+        assert row.total == 5
+        assert row.unmarked == 1
+        assert row.followed == 2
+        assert row.skipped == 1
+        assert row.social == 1
+        assert row.adjusted == 0
+        assert row.replaced == 0
+        assert row.is_override is False
+        assert row.calories == 2500
+        assert row.protein == Decimal("152.5")
+
+    @pytest.mark.asyncio
+    async def test_macros_null_without_meal_data(
+        self, db: AsyncSession, meal_type: MealType
+    ):
+        """Days whose slots have no meal (or no macros) keep NULL macros."""
+        await create_day(db, meal_type, None, ["followed"])
+
+        await refresh_daily_rollup(db, [DAY])
+
+        row = await get_rollup(db)
+        assert row.total == 1
+        assert row.calories is None
+        assert row.protein is None
+
+    @pytest.mark.asyncio
+    async def test_removes_row_when_day_has_no_data(
+        self, db: AsyncSession, meal_type: MealType, meal: Meal
+    ):
+        """A date that loses its slots and plan day loses its rollup row."""
+        instance, _ = await create_day(db, meal_type, meal, ["followed"])
+        await refresh_daily_rollup(db, [DAY])
+        assert await get_rollup(db) is not None
+
+        await db.delete(instance)
+        await db.flush()
+        await refresh_daily_rollup(db, [DAY])
+
+        assert await get_rollup(db) is None
+
+    @pytest.mark.asyncio
+    async def test_empty_dates_is_noop(self, db: AsyncSession, query_counter):
+        """No dates means no statements."""
+        query_counter.reset()
+        await refresh_daily_rollup(db, [])
+        assert query_counter.count == 0
+
+
+class TestRollupMaintenance:
+    """Services that mutate plan data keep the rollup current."""
+
+    @pytest.mark.asyncio
+    async def test_complete_and_uncomplete_slot(
+        self, db: AsyncSession, meal_type: MealType, meal: Meal
+    ):
+        """Completing and undoing a slot moves it between status counts."""
+        _, [slot, _] = await create_day(db, meal_type, meal, [None, None])
+        await refresh_daily_rollup(db, [DAY])
+
+        await complete_slot(db, slot.id, "adjusted")
+        row = await get_rollup(db)
+        assert row.adjusted == 1
+        assert row.unmarked == 1
+
+        await uncomplete_slot(db, slot.id)
+        row = await get_rollup(db)
+        assert row.adjusted == 0
+        assert row.unmarked == 2
+
+    @pytest.mark.asyncio
+    async def test_set_day_override(
+        self, db: AsyncSession, meal_type: MealType, meal: Meal
+    ):
+        """Overriding a day clears its slots and flags it."""
+        instance, _ = await create_day(db, meal_type, meal, ["followed", None])
+        await refresh_daily_rollup(db, [DAY])
+
+        await set_day_override(db, instance.id, DAY, reason="Travel")
+
+        row = await get_rollup(db)
+        assert row.is_override is True
+        assert row.total == 0
+
+    @pytest.mark.asyncio
+    async def test_update_meal_macros(
+        self, db: AsyncSession, meal_type: MealType
+    ):
+        """Changing a meal's macros updates every day it is planned on."""
+        meal = await create_meal_with_macros(db, meal_type, 400, "20")
+        await create_day(db, meal_type, meal, ["followed", None])
+        await refresh_daily_rollup(db, [DAY])
+
+        await update_meal(db, meal, MealUpdate(calories_kcal=600))
+
+        row = await get_rollup(db)
+        assert row.calories == 1200
+        assert row.protein == Decimal("40.0")
+
+
+class TestRebuildDailyRollup:
+    """Tests for rebuild_daily_rollup."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_repairs_stale_rows(
+        self, db: AsyncSession, meal_type: MealType, meal: Meal
+    ):
+        """A range rebuild recomputes rows changed behind the services' back."""
+        _, [slot] = await create_day(db, meal_type, meal, [None])
+        await refresh_daily_rollup(db, [DAY])
+
+        await db.execute(
+            update(WeeklyPlanSlot)
+            .where(WeeklyPlanSlot.id == slot.id)
+            .values(completion_status="replaced")
+        )
+        assert (await get_rollup(db)).unmarked == 1
+
+        written = await rebuild_daily_rollup(db, WEEK_START, WEEK_START.replace(day=9))
+
+        assert written == 1
+        row = await get_rollup(db)
+        assert row.unmarked == 0
+        assert row.replaced == 1
@@ -7,22 +7,35 @@ These tests verify:
 - Rotation behavior (advancing through meals)
 - Edge cases (no meals, one meal, deleted meals)
 - Fairness (all meals get equal rotation)
+- Concurrent advances in separate transactions never repeat or skip a meal
+- Rotations are cached per meal type and rotation version, shared by
+  lookups and the allocator, and reloaded after rotation changes; single
+  lookups compute the successor with one indexed statement on a miss
 
 See Tech Spec section 3.1 and ADR-002 for algorithm specification.
 """
-from datetime import datetime, timedelta, timezone
+import asyncio
+from datetime import date, datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models import Meal, MealType, RoundRobinState
 from app.models.meal_to_meal_type import meal_to_meal_type
+from app.schemas.meal import MealCreate
+from app.services.data_version import ROTATION_CHANGED, record_rotation_change
+from app.services.meals import create_meal as create_meal_service
 from app.services.round_robin import (
+    RoundRobinAllocator,
+    allocate_meals,
     get_meals_for_type,
     get_next_meal_for_type,
+    get_rotations,
     get_round_robin_state,
+    get_successor_meal,
     peek_next_meal_for_type,
     reset_round_robin_state,
     update_round_robin_state,
@@ -118,9 +131,10 @@ class TestGetNextMealForType:
     async def test_returns_none_when_no_meals(
         self, db: AsyncSession, meal_type: MealType
     ):
-        """No meals for type returns None."""
+        """No meals for type returns None and creates no state record."""
         meal = await get_next_meal_for_type(db, meal_type.id)
         assert meal is None
+        assert await get_round_robin_state(db, meal_type.id) is None
 
     @pytest.mark.asyncio
     async def test_returns_only_meal_when_single_meal(
@@ -287,6 +301,7 @@ class TestEdgeCases:
             )
         )
         await db.flush()
+        await record_rotation_change(db)
 
         # Now meals list is [meal1, meal3] but state still points to meal2
         # Meal2 is not in the list, so it won't be found (index=-1)
@@ -348,6 +363,107 @@ class TestEdgeCases:
         assert result4.id == meal1.id
 
 
+class TestRotationCache:
+    """Rotations are cached per meal type; single lookups fall back to one indexed statement."""
+
+    @pytest.mark.asyncio
+    async def test_get_successor_meal(self, db: AsyncSession, meal_type: MealType):
+        """Successor of a meal, wraparound, and start when there is no last meal."""
+        meals = await create_meals_with_timestamps(db, meal_type, 3)
+
+        assert (await get_successor_meal(db, meal_type.id, None)).id == meals[0].id
+        assert (await get_successor_meal(db, meal_type.id, meals[0].id)).id == meals[1].id
+        assert (await get_successor_meal(db, meal_type.id, meals[2].id)).id == meals[0].id
+        assert (await get_successor_meal(db, meal_type.id, uuid4())).id == meals[0].id
+
+    @pytest.mark.asyncio
+    async def test_no_successor_without_meals(self, db: AsyncSession, meal_type: MealType):
+        """An empty type has no successor, cached or not."""
+        db.info.pop(ROTATION_CHANGED, None)
+        assert await get_successor_meal(db, meal_type.id, None) is None
+        await get_rotations(db, [meal_type.id])
+        assert await get_successor_meal(db, meal_type.id, None) is None
+
+    @pytest.mark.asyncio
+    async def test_statement_count_independent_of_pool_size(
+        self, db: AsyncSession, meal_types: list[MealType], query_counter
+    ):
+        """Advancing a 40-meal rotation costs the same as a 2-meal one."""
+        small, large, _ = meal_types
+        await create_meals_with_timestamps(db, small, 2)
+        await create_meals_with_timestamps(db, large, 40)
+        # As seen by a later request
+        db.info.pop(ROTATION_CHANGED)
+
+        query_counter.reset()
+        await get_next_meal_for_type(db, small.id)
+        small_count = query_counter.count
+        query_counter.reset()
+        await get_next_meal_for_type(db, large.id)
+        assert query_counter.count == small_count
+
+        # State, rotation version and the successor statement on a miss
+        query_counter.reset()
+        await peek_next_meal_for_type(db, large.id)
+        assert query_counter.count == 3
+
+    @pytest.mark.asyncio
+    async def test_allocator_fills_cache_for_lookups(
+        self, db: AsyncSession, meal_type: MealType, query_counter
+    ):
+        """After one allocation, lookups and allocations skip the rotation query."""
+        meals = await create_meals_with_timestamps(db, meal_type, 3)
+        db.info.pop(ROTATION_CHANGED)
+        day = date(2026, 3, 2)
+        await allocate_meals(db, [(day, 1, meal_type.id)])
+        db.expunge_all()
+
+        query_counter.reset()
+        meal = await get_successor_meal(db, meal_type.id, meals[0].id)
+        assert meal.id == meals[1].id
+        # Rotation version and the chosen meal
+        assert query_counter.count == 2
+
+        query_counter.reset()
+        assignments = await allocate_meals(db, [(day, 2, meal_type.id)])
+        assert assignments[(day, 2)] == meals[1].id
+        assert not any("meal_to_meal_type" in statement for statement in query_counter.statements)
+
+    @pytest.mark.asyncio
+    async def test_rotation_change_invalidates(self, db: AsyncSession, meal_type: MealType):
+        """Adding a meal to the type bumps the version, so the rotation is reloaded."""
+        meals = await create_meals_with_timestamps(db, meal_type, 2)
+        db.info.pop(ROTATION_CHANGED)
+        rotation = (await get_rotations(db, [meal_type.id]))[meal_type.id]
+        assert rotation.meal_ids == (meals[0].id, meals[1].id)
+
+        meal = await create_meal_service(
+            db,
+            MealCreate(
+                name="Late Addition",
+                portion_description="1 plate",
+                meal_type_ids=[meal_type.id],
+            ),
+        )
+        db.info.pop(ROTATION_CHANGED)
+
+        assert (await get_successor_meal(db, meal_type.id, meals[1].id)).id == meal.id
+        rotation = (await get_rotations(db, [meal_type.id]))[meal_type.id]
+        assert rotation.meal_ids == (meals[0].id, meals[1].id, meal.id)
+
+    @pytest.mark.asyncio
+    async def test_session_with_rotation_changes_bypasses_cache(
+        self, db: AsyncSession, meal_type: MealType, query_counter
+    ):
+        """Uncommitted rotations are never cached: each lookup runs the statement."""
+        meals = await create_meals_with_timestamps(db, meal_type, 2)
+
+        for _ in range(2):
+            query_counter.reset()
+            assert (await get_successor_meal(db, meal_type.id, None)).id == meals[0].id
+            assert query_counter.count == 1
+
+
 class TestPeekNextMealForType:
     """Tests for peek_next_meal_for_type function."""
 
@@ -491,3 +607,194 @@ class TestUpdateRoundRobinState:
         # Note: In fast tests, timestamps might be equal
         # Just verify the field exists and is set
         assert state2.updated_at is not None
+
+
+class TestAllocateMeals:
+    """Tests for the batch allocator used by week generation."""
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential_selection(
+        self, db: AsyncSession, meal_types: list[MealType]
+    ):
+        """Batch allocation yields the same meals as per-slot selection."""
+        breakfast, lunch, _ = meal_types
+        await create_meals_with_timestamps(db, breakfast, 3)
+        await create_meals_with_timestamps(db, lunch, 2)
+
+        start = date(2026, 3, 2)
+        demands = []
+        for offset in range(7):
+            day = start + timedelta(days=offset)
+            demands.append((day, 1, breakfast.id))
+            demands.append((day, 2, lunch.id))
+            demands.append((day, 3, breakfast.id))
+
+        assignments = await allocate_meals(db, demands)
+        batch_ids = [assignments[(d, p)] for d, p, _ in demands]
+
+        await reset_round_robin_state(db, breakfast.id)
+        await reset_round_robin_state(db, lunch.id)
+        sequential_ids = [
+            (await get_next_meal_for_type(db, mt_id)).id for _, _, mt_id in demands
+        ]
+
+        assert batch_ids == sequential_ids
+
+    @pytest.mark.asyncio
+    async def test_continues_from_existing_state(
+        self, db: AsyncSession, meal_type: MealType
+    ):
+        """Allocation resumes after the last meal recorded in state."""
+        meals = await create_meals_with_timestamps(db, meal_type, 3)
+        await update_round_robin_state(db, meal_type.id, meals[1].id)
+
+        day = date(2026, 3, 2)
+        assignments = await allocate_meals(
+            db, [(day, 1, meal_type.id), (day, 2, meal_type.id)]
+        )
+
+        assert assignments[(day, 1)] == meals[2].id
+        assert assignments[(day, 2)] == meals[0].id
+
+    @pytest.mark.asyncio
+    async def test_persists_final_state(
+        self, db: AsyncSession, meal_type: MealType
+    ):
+        """Only the last assigned meal is written to state."""
+        meals = await create_meals_with_timestamps(db, meal_type, 4)
+
+        day = date(2026, 3, 2)
+        await allocate_meals(db, [(day, p, meal_type.id) for p in range(1, 4)])
+
+        state = await get_round_robin_state(db, meal_type.id)
+        assert state is not None
+        assert state.last_meal_id == meals[2].id
+
+    @pytest.mark.asyncio
+    async def test_no_meals_returns_none_without_state(
+        self, db: AsyncSession, meal_type: MealType
+    ):
+        """Meal types without meals get None and no state record."""
+        day = date(2026, 3, 2)
+        assignments = await allocate_meals(db, [(day, 1, meal_type.id)])
+
+        assert assignments[(day, 1)] is None
+        assert await get_round_robin_state(db, meal_type.id) is None
+
+    @pytest.mark.asyncio
+    async def test_query_count_independent_of_slot_count(
+        self, db: AsyncSession, meal_types: list[MealType], query_counter
+    ):
+        """A full week costs the same number of queries as a single slot."""
+        breakfast, lunch, dinner = meal_types
+        for mt in meal_types:
+            await create_meals_with_timestamps(db, mt, 3)
+
+        day = date(2026, 3, 2)
+        query_counter.reset()
+        await allocate_meals(db, [(day, 1, breakfast.id)])
+        single_slot = query_counter.count
+
+        await reset_round_robin_state(db, breakfast.id)
+        start = date(2026, 3, 9)
+        demands = [
+            (start + timedelta(days=offset), position, mt.id)
+            for offset in range(7)
+            for position, mt in enumerate([breakfast, lunch, dinner, breakfast, lunch, dinner], 1)
+        ]
+        query_counter.reset()
+        await allocate_meals(db, demands)
+
+        assert query_counter.count == single_slot
+
+    @pytest.mark.asyncio
+    async def test_allocator_skips_meal_removed_from_type(
+        self, db: AsyncSession, meal_types: list[MealType]
+    ):
+        """A last meal that left the rotation restarts at the first meal."""
+        breakfast, lunch, _ = meal_types
+        meals = await create_meals_with_timestamps(db, breakfast, 2)
+        other = await create_meal(db, "Lunch only", lunch)
+        await update_round_robin_state(db, breakfast.id, other.id)
+
+        allocator = await RoundRobinAllocator.load(db, [breakfast.id])
+
+        assert allocator.next_meal_id(breakfast.id) == meals[0].id
+
+
+class TestConcurrentAdvances:
+    """
+    Parallel advances in separate, committed transactions.
+
+    These tests commit real data (the usual db fixture rolls back and would
+    hide races), so they clean up after themselves.
+    """
+
+    PARALLEL = 8
+
+    @pytest_asyncio.fixture
+    async def session_factory(self, db_engine):
+        return async_sessionmaker(db_engine, expire_on_commit=False)
+
+    @pytest_asyncio.fixture
+    async def committed_rotation(self, session_factory):
+        """A meal type with 2 * PARALLEL committed meals; removed afterwards."""
+        async with session_factory() as session:
+            meal_type = MealType(id=uuid4(), name=f"Concurrent {uuid4().hex[:8]}")
+            session.add(meal_type)
+            await session.flush()
+            meals = await create_meals_with_timestamps(session, meal_type, 2 * self.PARALLEL)
+            await session.commit()
+
+        yield meal_type, meals
+
+        async with session_factory() as session:
+            await session.execute(delete(Meal).where(Meal.id.in_([m.id for m in meals])))
+            await session.execute(delete(MealType).where(MealType.id == meal_type.id))
+            await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_parallel_single_advances_are_consecutive(
+        self, session_factory, committed_rotation
+    ):
+        """N parallel get_next_meal_for_type calls return the first N meals."""
+        meal_type, meals = committed_rotation
+
+        async def advance():
+            async with session_factory() as session:
+                meal = await get_next_meal_for_type(session, meal_type.id)
+                # Hold the transaction open so the advances overlap
+                await asyncio.sleep(0.01)
+                await session.commit()
+                return meal.id
+
+        picked = await asyncio.gather(*(advance() for _ in range(self.PARALLEL)))
+
+        assert sorted(picked, key=[m.id for m in meals].index) == [
+            m.id for m in meals[: self.PARALLEL]
+        ]
+        async with session_factory() as session:
+            state = await get_round_robin_state(session, meal_type.id)
+            assert state.last_meal_id == meals[self.PARALLEL - 1].id
+
+    @pytest.mark.asyncio
+    async def test_parallel_batch_allocations_do_not_overlap(
+        self, session_factory, committed_rotation
+    ):
+        """Parallel two-slot allocations together cover the rotation exactly once."""
+        meal_type, meals = committed_rotation
+        day = date(2026, 3, 2)
+
+        async def allocate():
+            async with session_factory() as session:
+                assignments = await allocate_meals(
+                    session, [(day, 1, meal_type.id), (day, 2, meal_type.id)]
+                )
+                await asyncio.sleep(0.01)
+                await session.commit()
+                return [assignments[(day, 1)], assignments[(day, 2)]]
+
+        batches = await asyncio.gather(*(allocate() for _ in range(self.PARALLEL)))
+
+        picked = [meal_id for batch in batches for meal_id in batch]
+        assert sorted(picked, key=[m.id for m in meals].index) == [m.id for m in meals]
@@ -0,0 +1,118 @@
+"""
+Tests for the background week pre-generation scheduler.
+
+These tests verify:
+- Only the worker holding the advisory lock runs; others skip
+- Failed runs are counted instead of stopping the loop
+- Runs create the partitions of the current and next year
+- A failed archival is counted separately and keeps the generated weeks
+- The background task starts and stops cleanly
+
+Runs open their own sessions (as in production), so they only ever see
+committed data.
+"""
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.scheduler import PREGENERATION_LOCK_KEY, WeekPregenerationScheduler
+from app.services.partitions import get_partition_years
+
+
+def make_scheduler(engine, archive_retention_days: int | None = None) -> WeekPregenerationScheduler:
+    return WeekPregenerationScheduler(
+        async_sessionmaker(engine, expire_on_commit=False),
+        weeks_ahead=1,
+        interval_seconds=3600,
+        archive_retention_days=archive_retention_days,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_skipped_while_another_worker_holds_lock(db_engine):
+    """A worker that does not get the lock leaves the run to the lock holder."""
+    scheduler = make_scheduler(db_engine)
+
+    async with db_engine.connect() as conn, conn.begin():
+        await conn.execute(select(func.pg_advisory_xact_lock(PREGENERATION_LOCK_KEY)))
+        assert await scheduler.run_once() is None
+
+    assert scheduler.stats.skipped_runs == 1
+    assert scheduler.stats.runs == 0
+
+
+@pytest.mark.asyncio
+async def test_run_with_lock(db_engine):
+    """With the lock free the run completes and is counted."""
+    scheduler = make_scheduler(db_engine)
+
+    generated = await scheduler.run_once()
+
+    assert generated is not None
+    assert scheduler.stats.runs == 1
+    assert scheduler.stats.weeks_generated == len(generated)
+    assert scheduler.stats.last_error is None
+    assert scheduler.stats.last_run_at is not None
+
+
+@pytest.mark.asyncio
+async def test_run_creates_upcoming_partitions(db_engine):
+    """Generated weeks always have a yearly partition to land in."""
+    scheduler = make_scheduler(db_engine)
+
+    await scheduler.run_once()
+
+    async with AsyncSession(db_engine) as db:
+        years = await get_partition_years(db, "weekly_plan_slot")
+    assert {date.today().year, date.today().year + 1} <= years
+
+
+@pytest.mark.asyncio
+async def test_failed_run_is_counted():
+    """Database errors are recorded, not raised."""
+    engine = create_async_engine("postgresql+asyncpg://nobody@127.0.0.1:1/none")
+    scheduler = make_scheduler(engine)
+    try:
+        assert await scheduler.run_once() is None
+    finally:
+        await engine.dispose()
+
+    assert scheduler.stats.failed_runs == 1
+    assert scheduler.stats.last_error is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_archival_keeps_generated_weeks(db_engine):
+    """Archival runs after pre-generation commits; its failure is counted on its own."""
+    # Below MIN_RETENTION_DAYS, so archive_weeks refuses to run
+    scheduler = make_scheduler(db_engine, archive_retention_days=1)
+
+    generated = await scheduler.run_once()
+
+    assert generated is not None
+    assert scheduler.stats.runs == 1
+    assert scheduler.stats.failed_runs == 0
+    assert scheduler.stats.last_error is None
+    assert scheduler.stats.archive_runs == 0
+    assert scheduler.stats.failed_archive_runs == 1
+    assert "Cannot archive" in scheduler.stats.last_archive_error
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop(db_engine):
+    """The task runs immediately on start and is cancelled on stop."""
+    scheduler = make_scheduler(db_engine)
+
+    scheduler.start()
+    assert scheduler.running
+    for _ in range(100):
+        if scheduler.stats.runs:
+            break
+        await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    assert scheduler.stats.runs == 1
+    assert not scheduler.running
@@ -23,8 +23,17 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
-from app.models import MealType, Meal, WeeklyPlanInstance, WeeklyPlanInstanceDay, WeeklyPlanSlot
+from app.models import (
+    DailyCompletionRollup,
+    MealType,
+    Meal,
+    WeeklyPlanInstance,
+    WeeklyPlanInstanceDay,
+    WeeklyPlanSlot,
+)
 from app.database import get_db
+from app.services.rollup import refresh_daily_rollup
+from app.services.stats import _calculate_avg_daily_macros, get_stats
 
 
 @pytest_asyncio.fixture
@@ -141,6 +150,7 @@ async def _create_slots(
             db.add(slot)
 
     await db.flush()
+    await refresh_daily_rollup(db, [day_data["date"] for day_data in days_data])
 
 
 @pytest_asyncio.fixture
@@ -454,6 +464,91 @@ async def test_stats_daily_adherence(
     assert dates == sorted(dates)
 
 
+# =============================================================================
+# Average daily macros
+# =============================================================================
+
+
+def test_avg_daily_macros_over_days_with_data():
+    """Averages cover days with any macro set; missing values count as zero."""
+    days = [
+        DailyCompletionRollup(
+            date=date(2030, 1, 1), calories=2000, protein=Decimal("150.0"),
+            carbs=Decimal("200.0"), fat=Decimal("70.0"), fiber=Decimal("30.0"),
+        ),
+        DailyCompletionRollup(
+            date=date(2030, 1, 2), calories=2501, protein=Decimal("120.5"),
+            carbs=Decimal("250.0"), fat=Decimal("81.0"), sugar=Decimal("40.0"),
+        ),
+        # Day without meal data is ignored
+        DailyCompletionRollup(date=date(2030, 1, 3)),
+    ]
+
+    averages = _calculate_avg_daily_macros(days)
+
+    assert averages["avg_daily_calories"] == Decimal("2251")
+    assert averages["avg_daily_protein"] == Decimal("135.3")
+    assert averages["avg_daily_carbs"] == Decimal("225.0")
+    assert averages["avg_daily_fat"] == Decimal("75.5")
+    assert averages["avg_daily_sugar"] == Decimal("20.0")
+    assert averages["avg_daily_saturated_fat"] == Decimal("0.0")
+    assert averages["avg_daily_fiber"] == Decimal("15.0")
+
+
+def test_avg_daily_macros_none_without_data():
+    """No days with meal data gives no averages."""
+    averages = _calculate_avg_daily_macros([DailyCompletionRollup(date=date(2030, 1, 1))])
+    assert set(averages.values()) == {None}
+
+
+@pytest.mark.asyncio
+async def test_stats_reads_period_once(
+    db: AsyncSession, meal_type: MealType, meal: Meal, query_counter
+):
+    """Stats need one rollup read plus the per-meal-type aggregate."""
+    today = date.today()
+    await _create_slots(db, meal_type, meal, [
+        {"date": today - timedelta(days=i), "slots": ["followed", None]}
+        for i in range(5)
+    ])
+
+    query_counter.reset()
+    stats = await get_stats(db, 365)
+
+    assert query_counter.count == 2
+    assert stats.total_slots >= 10
+
+
+# =============================================================================
+# GET /api/v1/stats - Conditional requests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_stats_etag_round_trip(
+    client: AsyncClient, db: AsyncSession, meal_type: MealType, meal: Meal
+):
+    """A current ETag gets a 304; a completed slot or another period does not."""
+    today = date.today()
+    await _create_slots(db, meal_type, meal, [{"date": today, "slots": [None]}])
+
+    etag = (await client.get("/api/v1/stats?days=7")).headers["etag"]
+
+    response = await client.get("/api/v1/stats?days=7", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = await client.get("/api/v1/stats?days=30", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    slot = (await db.execute(
+        select(WeeklyPlanSlot).where(WeeklyPlanSlot.date == today, WeeklyPlanSlot.position == 100)
+    )).scalars().first()
+    await client.post(f"/api/v1/slots/{slot.id}/complete", json={"status": "followed"})
+
+    response = await client.get("/api/v1/stats?days=7", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
 # =============================================================================
 # GET /api/v1/stats - Query parameter validation
 # =============================================================================
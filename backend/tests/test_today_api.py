@@ -6,6 +6,7 @@ Tests cover:
 - GET /api/v1/yesterday - Yesterday's plan
 - POST /api/v1/slots/{id}/complete - Mark slot complete
 - DELETE /api/v1/slots/{id}/complete - Undo completion
+- POST /api/v1/slots/completions - Batch completion (offline queue sync)
 
 These tests use the database fixtures from conftest.py and create
 weekly plan instances with slots for testing.
@@ -16,6 +17,7 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
@@ -31,7 +33,10 @@ from app.models import (
     WeeklyPlanSlot,
 )
 from app.models.meal_to_meal_type import meal_to_meal_type
+from app.cache import response_cache
 from app.database import get_db
+from app.services.rollup import refresh_daily_rollup
+from app.services.today import calculate_streak
 
 
 # Fixture to override database dependency
@@ -389,6 +394,82 @@ class TestGetToday:
         assert data["stats"]["total"] == 3
 
 
+    @pytest.mark.asyncio
+    async def test_cached_until_slot_completed(
+        self,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """Repeat reads come from the cache; completing a slot invalidates it."""
+        _, slot = weekly_plan_with_today
+
+        await client.get("/api/v1/today")
+        await client.get("/api/v1/today")
+        assert response_cache.stats()["hits"] == 1
+
+        response = await client.post(
+            f"/api/v1/slots/{slot.id}/complete", json={"status": "followed"}
+        )
+        assert response.status_code == 200
+
+        data = (await client.get("/api/v1/today")).json()
+        assert data["slots"][0]["completion_status"] == "followed"
+        assert data["stats"]["completed"] == 1
+        assert response_cache.stats()["misses"] == 2
+
+
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match on GET /today."""
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304(
+        self,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+        query_counter,
+    ):
+        """A current ETag gets an empty 304 after a single version lookup."""
+        first = await client.get("/api/v1/today")
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "no-cache"
+
+        query_counter.reset()
+        response = await client.get("/api/v1/today", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert query_counter.count == 1
+
+    @pytest.mark.asyncio
+    async def test_etag_changes_after_completion(
+        self,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """Completing a slot makes the old ETag stale."""
+        _, slot = weekly_plan_with_today
+        etag = (await client.get("/api/v1/today")).headers["etag"]
+
+        await client.post(f"/api/v1/slots/{slot.id}/complete", json={"status": "followed"})
+        response = await client.get("/api/v1/today", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["stats"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_weak_and_listed_etags_match(self, client: AsyncClient):
+        """If-None-Match accepts weak validators and lists of tags."""
+        etag = (await client.get("/api/v1/today")).headers["etag"]
+
+        response = await client.get(
+            "/api/v1/today", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+
+
 class TestGetYesterday:
     """Tests for GET /api/v1/yesterday endpoint."""
 
@@ -580,6 +661,234 @@ class TestUncompleteSlot:
         assert response.status_code == 404
 
 
+class TestBatchComplete:
+    """Tests for POST /api/v1/slots/completions endpoint."""
+
+    @staticmethod
+    async def add_slot(db: AsyncSession, slot: WeeklyPlanSlot, position: int) -> WeeklyPlanSlot:
+        other = WeeklyPlanSlot(
+            id=uuid4(),
+            weekly_plan_instance_id=slot.weekly_plan_instance_id,
+            date=slot.date,
+            position=position,
+            meal_type_id=slot.meal_type_id,
+            meal_id=slot.meal_id,
+        )
+        db.add(other)
+        await db.flush()
+        return other
+
+    @staticmethod
+    async def slot_state(db: AsyncSession, slot_id) -> tuple:
+        result = await db.execute(
+            select(WeeklyPlanSlot.completion_status, WeeklyPlanSlot.completed_at)
+            .where(WeeklyPlanSlot.id == slot_id)
+        )
+        return tuple(result.one())
+
+    @pytest.mark.asyncio
+    async def test_applies_operations_with_client_timestamps(
+        self,
+        db: AsyncSession,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """Each slot gets its status, completed at the client's timestamp."""
+        _, slot = weekly_plan_with_today
+        other = await self.add_slot(db, slot, position=2)
+        marked_at = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=2)
+
+        response = await client.post(
+            "/api/v1/slots/completions",
+            json={
+                "operations": [
+                    {"slot_id": str(slot.id), "status": "followed",
+                     "client_timestamp": marked_at.isoformat()},
+                    {"slot_id": str(other.id), "status": "skipped",
+                     "client_timestamp": (marked_at + timedelta(minutes=5)).isoformat()},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["outcome"] for r in results] == ["applied", "applied"]
+        assert results[0]["completion_status"] == "followed"
+        assert await self.slot_state(db, slot.id) == ("followed", marked_at)
+        assert await self.slot_state(db, other.id) == ("skipped", marked_at + timedelta(minutes=5))
+
+    @pytest.mark.asyncio
+    async def test_latest_operation_per_slot_wins(
+        self,
+        db: AsyncSession,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """Operations are ordered by client timestamp, not request order."""
+        _, slot = weekly_plan_with_today
+        now = datetime.now(timezone.utc)
+
+        response = await client.post(
+            "/api/v1/slots/completions",
+            json={
+                "operations": [
+                    {"slot_id": str(slot.id), "status": None,
+                     "client_timestamp": (now - timedelta(minutes=1)).isoformat()},
+                    {"slot_id": str(slot.id), "status": "adjusted",
+                     "client_timestamp": (now - timedelta(minutes=10)).isoformat()},
+                ]
+            },
+        )
+
+        results = response.json()["results"]
+        assert [r["outcome"] for r in results] == ["applied", "superseded"]
+        assert all(r["completion_status"] is None for r in results)
+        assert await self.slot_state(db, slot.id) == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_stale_operation_keeps_newer_completion(
+        self,
+        db: AsyncSession,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """A queued change older than the stored completion is not applied."""
+        _, slot = weekly_plan_with_today
+        now = datetime.now(timezone.utc)
+        await client.post(f"/api/v1/slots/{slot.id}/complete", json={"status": "followed"})
+        completed = await self.slot_state(db, slot.id)
+
+        response = await client.post(
+            "/api/v1/slots/completions",
+            json={
+                "operations": [
+                    {"slot_id": str(slot.id), "status": "skipped",
+                     "client_timestamp": (now - timedelta(minutes=10)).isoformat()},
+                    {"slot_id": str(slot.id), "status": None,
+                     "client_timestamp": (now - timedelta(minutes=5)).isoformat()},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["outcome"] for r in results] == ["superseded", "superseded"]
+        assert all(r["completion_status"] == "followed" for r in results)
+        assert await self.slot_state(db, slot.id) == completed
+
+    @pytest.mark.asyncio
+    async def test_unknown_slot_does_not_fail_batch(
+        self,
+        db: AsyncSession,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """Missing slots are reported per item; the rest is applied."""
+        _, slot = weekly_plan_with_today
+        now = datetime.now(timezone.utc).isoformat()
+
+        response = await client.post(
+            "/api/v1/slots/completions",
+            json={
+                "operations": [
+                    {"slot_id": str(uuid4()), "status": "followed", "client_timestamp": now},
+                    {"slot_id": str(slot.id), "status": "social", "client_timestamp": now},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["outcome"] for r in results] == ["not_found", "applied"]
+        assert results[0]["completion_status"] is None
+        assert (await self.slot_state(db, slot.id))[0] == "social"
+
+    @pytest.mark.asyncio
+    async def test_future_timestamp_is_capped(
+        self,
+        db: AsyncSession,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """A client clock running ahead never stores completed_at in the future."""
+        _, slot = weekly_plan_with_today
+        future = datetime.now(timezone.utc) + timedelta(days=1)
+
+        await client.post(
+            "/api/v1/slots/completions",
+            json={
+                "operations": [
+                    {"slot_id": str(slot.id), "status": "followed",
+                     "client_timestamp": future.isoformat()},
+                ]
+            },
+        )
+
+        _, completed_at = await self.slot_state(db, slot.id)
+        assert completed_at <= datetime.now(timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_today_reflects_batch(
+        self,
+        client: AsyncClient,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """The batch invalidates cached day views like a single completion."""
+        _, slot = weekly_plan_with_today
+        await client.get("/api/v1/today")
+
+        await client.post(
+            "/api/v1/slots/completions",
+            json={
+                "operations": [
+                    {"slot_id": str(slot.id), "status": "replaced",
+                     "client_timestamp": datetime.now(timezone.utc).isoformat()},
+                ]
+            },
+        )
+
+        data = (await client.get("/api/v1/today")).json()
+        assert data["slots"][0]["completion_status"] == "replaced"
+        assert data["stats"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_single_update_for_many_slots(
+        self,
+        db: AsyncSession,
+        client: AsyncClient,
+        query_counter,
+        weekly_plan_with_today: tuple[WeeklyPlanInstance, WeeklyPlanSlot],
+    ):
+        """All slots are written by one UPDATE statement."""
+        _, slot = weekly_plan_with_today
+        slots = [slot] + [await self.add_slot(db, slot, position=p) for p in range(2, 12)]
+        now = datetime.now(timezone.utc).isoformat()
+
+        query_counter.reset()
+        response = await client.post(
+            "/api/v1/slots/completions",
+            json={
+                "operations": [
+                    {"slot_id": str(s.id), "status": "followed", "client_timestamp": now}
+                    for s in slots
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        slot_updates = [
+            s for s in query_counter.statements if s.lstrip().startswith("UPDATE weekly_plan_slot")
+        ]
+        assert len(slot_updates) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_rejected(self, client: AsyncClient):
+        """At least one operation is required."""
+        response = await client.post("/api/v1/slots/completions", json={"operations": []})
+
+        assert response.status_code == 422
+
+
 class TestStreakCalculation:
     """Tests for streak calculation in the stats."""
 
@@ -645,6 +954,7 @@ class TestStreakCalculation:
             )
             db.add(slot)
             await db.flush()
+        await refresh_daily_rollup(db, [yesterday, day_before])
 
         response = await client.get("/api/v1/today")
 
@@ -737,6 +1047,7 @@ class TestStreakCalculation:
         )
         db.add(slot_before)
         await db.flush()
+        await refresh_daily_rollup(db, [yesterday, day_before])
 
         response = await client.get("/api/v1/today")
 
@@ -745,3 +1056,156 @@ class TestStreakCalculation:
 
         # Streak should be 0 because yesterday is incomplete
         assert data["stats"]["streak_days"] == 0
+
+
+async def create_day_history(
+    db: AsyncSession,
+    meal_type: MealType,
+    meal: Meal,
+    days: dict[date, list[str | None] | None],
+) -> None:
+    """
+    Create instance days and slots for streak tests.
+
+    days maps a date to its slot statuses; None marks an override day.
+    """
+    instances: dict[date, WeeklyPlanInstance] = {}
+    for day_date, statuses in sorted(days.items()):
+        week_start = get_week_start(day_date)
+        if week_start not in instances:
+            instances[week_start] = WeeklyPlanInstance(id=uuid4(), week_start_date=week_start)
+            db.add(instances[week_start])
+            await db.flush()
+        instance = instances[week_start]
+
+        db.add(WeeklyPlanInstanceDay(
+            id=uuid4(),
+            weekly_plan_instance_id=instance.id,
+            date=day_date,
+            is_override=statuses is None,
+        ))
+        for position, status in enumerate(statuses or [], 1):
+            db.add(WeeklyPlanSlot(
+                id=uuid4(),
+                weekly_plan_instance_id=instance.id,
+                date=day_date,
+                position=position,
+                meal_type_id=meal_type.id,
+                meal_id=meal.id,
+                completion_status=status,
+            ))
+    await db.flush()
+    await refresh_daily_rollup(db, days)
+
+
+class TestStreakQuery:
+    """Tests for the single-query streak computation."""
+
+    # Far-future target keeps these tests clear of any seeded data
+    TARGET = date(2150, 6, 15)
+
+    def _days_before(self, n: int) -> date:
+        return self.TARGET - timedelta(days=n)
+
+    @pytest.mark.asyncio
+    async def test_no_history_is_zero(self, db: AsyncSession):
+        """Without any plan before the target date the streak is 0."""
+        assert await calculate_streak(db, self.TARGET) == 0
+
+    @pytest.mark.asyncio
+    async def test_counts_consecutive_complete_days(
+        self, db: AsyncSession, test_meal_type: MealType, test_meal: Meal
+    ):
+        """Consecutive fully marked days ending yesterday form the streak."""
+        await create_day_history(db, test_meal_type, test_meal, {
+            self._days_before(n): ["followed", "skipped"] for n in range(1, 11)
+        })
+
+        assert await calculate_streak(db, self.TARGET) == 10
+
+    @pytest.mark.asyncio
+    async def test_target_day_itself_is_ignored(
+        self, db: AsyncSession, test_meal_type: MealType, test_meal: Meal
+    ):
+        """The target day's own completion does not affect the streak."""
+        await create_day_history(db, test_meal_type, test_meal, {
+            self.TARGET: [None],
+            self._days_before(1): ["followed"],
+        })
+
+        assert await calculate_streak(db, self.TARGET) == 1
+
+    @pytest.mark.asyncio
+    async def test_override_day_breaks_streak(
+        self, db: AsyncSession, test_meal_type: MealType, test_meal: Meal
+    ):
+        """An override day ends the streak even if older days are complete."""
+        await create_day_history(db, test_meal_type, test_meal, {
+            self._days_before(1): ["followed"],
+            self._days_before(2): None,
+            self._days_before(3): ["followed"],
+        })
+
+        assert await calculate_streak(db, self.TARGET) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_day_breaks_streak(
+        self, db: AsyncSession, test_meal_type: MealType, test_meal: Meal
+    ):
+        """A planned day without slots ends the streak."""
+        await create_day_history(db, test_meal_type, test_meal, {
+            self._days_before(1): ["followed"],
+            self._days_before(2): ["adjusted"],
+            self._days_before(3): [],
+            self._days_before(4): ["followed"],
+        })
+
+        assert await calculate_streak(db, self.TARGET) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_day_breaks_streak(
+        self, db: AsyncSession, test_meal_type: MealType, test_meal: Meal
+    ):
+        """A day without any plan record ends the streak."""
+        await create_day_history(db, test_meal_type, test_meal, {
+            self._days_before(1): ["followed"],
+            self._days_before(3): ["followed"],
+        })
+
+        assert await calculate_streak(db, self.TARGET) == 1
+
+    @pytest.mark.asyncio
+    async def test_partially_marked_day_breaks_streak(
+        self, db: AsyncSession, test_meal_type: MealType, test_meal: Meal
+    ):
+        """One unmarked slot is enough to end the streak."""
+        await create_day_history(db, test_meal_type, test_meal, {
+            self._days_before(1): ["followed", None],
+            self._days_before(2): ["followed"],
+        })
+
+        assert await calculate_streak(db, self.TARGET) == 0
+
+    @pytest.mark.asyncio
+    async def test_streak_is_capped(
+        self, db: AsyncSession, test_meal_type: MealType, test_meal: Meal
+    ):
+        """Streaks longer than the lookback window are capped at 366 days."""
+        await create_day_history(db, test_meal_type, test_meal, {
+            self._days_before(n): ["followed"] for n in range(1, 401)
+        })
+
+        assert await calculate_streak(db, self.TARGET) == 366
+
+    @pytest.mark.asyncio
+    async def test_single_query_regardless_of_length(
+        self, db: AsyncSession, test_meal_type: MealType, test_meal: Meal, query_counter
+    ):
+        """A long streak costs the same single query as no streak."""
+        await create_day_history(db, test_meal_type, test_meal, {
+            self._days_before(n): ["followed"] for n in range(1, 121)
+        })
+
+        query_counter.reset()
+        assert await calculate_streak(db, self.TARGET) == 120
+        assert query_counter.count == 1
@@ -4,6 +4,8 @@ Integration tests for the weekly planning API endpoints.
 Tests cover:
 - GET /api/v1/weekly-plans/current - Current week's plan
 - POST /api/v1/weekly-plans/generate - Generate a new week
+- POST /api/v1/weekly-plans/generate-range - Generate several weeks at once
+- GET /api/v1/weekly-plans/scheduler - Week pre-generation status
 - PUT /api/v1/weekly-plans/current/days/{date}/template - Switch day template
 - PUT /api/v1/weekly-plans/current/days/{date}/override - Mark day as "no plan"
 - DELETE /api/v1/weekly-plans/current/days/{date}/override - Remove override
@@ -16,6 +18,7 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
@@ -32,7 +35,17 @@ from app.models import (
 )
 from app.models.meal_to_meal_type import meal_to_meal_type
 from app.database import get_db
-from app.services.weekly import get_week_start_date, get_next_monday
+from app.services.bulk import insert_instance_days, insert_plan_slots, update_slot_meals
+from app.services.weekly import (
+    generate_weekly_plan,
+    generate_weekly_plans,
+    get_missing_weeks,
+    get_next_monday,
+    get_week_start_date,
+    get_weekly_instance_by_week_start,
+    pregenerate_weeks,
+    regenerate_weekly_plan,
+)
 
 
 # Fixture to override database dependency
@@ -316,6 +329,67 @@ class TestGetCurrentWeek:
         assert data["id"] == str(current_week_instance.id)
         assert data["week_start_date"] == week_start
 
+    @pytest.mark.asyncio
+    async def test_week_view_query_count_is_constant(
+        self,
+        client: AsyncClient,
+        current_week_instance: WeeklyPlanInstance,
+        query_counter,
+    ):
+        """The week view loads in a fixed number of queries, not one per day."""
+        query_counter.reset()
+        response = await client.get("/api/v1/weekly-plans/current")
+
+        assert response.status_code == 200
+        # Instance lookup, cache key versions, instance with days and
+        # templates, all slots
+        assert query_counter.count == 4
+
+    @pytest.mark.asyncio
+    async def test_week_view_served_from_cache_until_changed(
+        self,
+        client: AsyncClient,
+        current_week_instance: WeeklyPlanInstance,
+        query_counter,
+    ):
+        """Repeat reads hit the cache; a day change invalidates the week."""
+        first = await client.get("/api/v1/weekly-plans/current")
+
+        query_counter.reset()
+        second = await client.get("/api/v1/weekly-plans/current")
+        assert second.json() == first.json()
+        # Instance lookup and cache key versions only
+        assert query_counter.count == 2
+
+        monday = current_week_instance.week_start_date
+        response = await client.put(
+            f"/api/v1/weekly-plans/current/days/{monday}/override",
+            json={"reason": "Travel"},
+        )
+        assert response.status_code == 200
+
+        third = await client.get("/api/v1/weekly-plans/current")
+        assert third.json()["days"][0]["is_override"] is True
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304(
+        self,
+        client: AsyncClient,
+        current_week_instance: WeeklyPlanInstance,
+        query_counter,
+    ):
+        """A current ETag gets a 304 without loading the week."""
+        etag = (await client.get("/api/v1/weekly-plans/current")).headers["etag"]
+
+        query_counter.reset()
+        response = await client.get(
+            "/api/v1/weekly-plans/current", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        # Instance lookup and version lookup only
+        assert query_counter.count == 2
+
     @pytest.mark.asyncio
     async def test_returns_404_for_nonexistent_week(
         self,
@@ -441,6 +515,49 @@ class TestGenerateWeek:
         if original_meal_id:
             assert regen_slot["meal"]["id"] == original_meal_id, "Meal assignment should be preserved"
 
+    @pytest.mark.asyncio
+    async def test_regenerate_from_date_keeps_earlier_slots(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+    ):
+        """Only slots on or after regenerate_from are reassigned."""
+        week_start = date(2094, 1, 4)
+        cutoff = week_start + timedelta(days=4)
+        instance = await generate_weekly_plan(db, week_start_date=week_start)
+        slots_stmt = select(WeeklyPlanSlot.id, WeeklyPlanSlot.date, WeeklyPlanSlot.meal_id).where(
+            WeeklyPlanSlot.weekly_plan_instance_id == instance.id
+        )
+        before = {slot.id: slot.meal_id for slot in (await db.execute(slots_stmt)).all()}
+
+        await regenerate_weekly_plan(db, week_start, from_date=cutoff)
+
+        after = (await db.execute(slots_stmt)).all()
+        changed = {slot.date for slot in after if slot.meal_id != before[slot.id]}
+        assert changed
+        assert min(changed) >= cutoff
+
+    @pytest.mark.asyncio
+    async def test_regenerate_query_count_is_constant(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+        query_counter,
+    ):
+        """Regeneration does not issue queries per day or per slot."""
+        week_start = date(2094, 2, 1)
+        await generate_weekly_plan(db, week_start_date=week_start)
+
+        query_counter.reset()
+        await regenerate_weekly_plan(db, week_start, from_date=week_start + timedelta(days=6))
+        single_day = query_counter.count
+
+        query_counter.reset()
+        await regenerate_weekly_plan(db, week_start)
+        assert query_counter.count == single_day
+
     @pytest.mark.asyncio
     async def test_generate_week_fails_without_default_plan(
         self, client: AsyncClient
@@ -501,6 +618,78 @@ class TestGenerateWeek:
                 assert slot["meal"]["name"] is not None
 
 
+class TestPregenerateWeeks:
+    """Tests for background week pre-generation."""
+
+    @pytest.mark.asyncio
+    async def test_generates_upcoming_weeks(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+    ):
+        """Missing weeks are generated once, in date order."""
+        today = date(2096, 3, 7)  # A Wednesday
+        current_week = get_week_start_date(today)
+
+        generated = await pregenerate_weeks(db, weeks_ahead=2, today=today)
+
+        assert generated == [current_week + timedelta(weeks=1), current_week + timedelta(weeks=2)]
+        assert await pregenerate_weeks(db, weeks_ahead=2, today=today) == []
+
+    @pytest.mark.asyncio
+    async def test_current_week_is_left_to_requests(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+    ):
+        """The current week is never generated in the background."""
+        current_week = date(2096, 4, 2)  # A Monday
+
+        assert await get_missing_weeks(db, weeks_ahead=1, today=current_week) == [
+            current_week + timedelta(weeks=1)
+        ]
+        await pregenerate_weeks(db, weeks_ahead=1, today=current_week)
+        assert await get_weekly_instance_by_week_start(db, current_week) is None
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_weeks(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+    ):
+        """Weeks generated on request are left alone."""
+        current_week = date(2096, 5, 7)  # A Monday
+        await generate_weekly_plan(db, week_start_date=current_week + timedelta(weeks=1))
+
+        generated = await pregenerate_weeks(db, weeks_ahead=2, today=current_week)
+
+        assert generated == [current_week + timedelta(weeks=2)]
+
+    @pytest.mark.asyncio
+    async def test_nothing_generated_without_default_plan(self, db: AsyncSession):
+        """Without a default week plan there is nothing to pre-generate."""
+        assert await pregenerate_weeks(db, weeks_ahead=1, today=date(2096, 7, 2)) == []
+
+    @pytest.mark.asyncio
+    async def test_scheduler_status(
+        self,
+        client: AsyncClient,
+        current_week_instance: WeeklyPlanInstance,
+    ):
+        """The status lists the weeks still missing from the window."""
+        response = await client.get("/api/v1/weekly-plans/scheduler")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["running"] is False
+        assert data["runs"] >= 0
+        missing = [date.fromisoformat(week) for week in data["missing_weeks"]]
+        assert current_week_instance.week_start_date not in missing
+
+
 class TestSwitchDayTemplate:
     """Tests for PUT /api/v1/weekly-plans/current/days/{date}/template endpoint."""
 
@@ -780,3 +969,264 @@ class TestWeekGenerationRoundRobin:
 
         # Should use at least 2 different meals (we have 2 per type)
         assert len(unique_meals) >= 1
+
+    @pytest.mark.asyncio
+    async def test_generation_query_count_is_constant(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+        query_counter,
+    ):
+        """Generating a week does not issue queries per slot."""
+        query_counter.reset()
+        instance = await generate_weekly_plan(db, week_start_date=date(2090, 2, 6))
+
+        assert instance.week_start_date == date(2090, 2, 6)
+        # 17 slots across 7 days; the per-slot path needed well over 50 queries
+        # (includes creating and locking the round-robin state rows, and
+        # loading the rotations into the rotation cache)
+        assert query_counter.count <= 18
+
+        # With the rotations cached, only their version is read
+        query_counter.reset()
+        await generate_weekly_plan(db, week_start_date=date(2090, 2, 13))
+        assert query_counter.count <= 17
+
+
+class TestGenerateWeekRange:
+    """Tests for POST /api/v1/weekly-plans/generate-range."""
+
+    @staticmethod
+    async def meal_sequence(db: AsyncSession, first: date, last: date) -> list:
+        result = await db.execute(
+            select(WeeklyPlanSlot.meal_id)
+            .where(WeeklyPlanSlot.date.between(first, last))
+            .order_by(WeeklyPlanSlot.date, WeeklyPlanSlot.position)
+        )
+        return list(result.scalars().all())
+
+    @pytest.mark.asyncio
+    async def test_generates_weeks_and_returns_summary(
+        self,
+        client: AsyncClient,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+    ):
+        """Each week is summarized instead of returned in full."""
+        response = await client.post(
+            "/api/v1/weekly-plans/generate-range",
+            json={"week_start_date": "2095-01-03", "weeks": 3},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["week_plan"]["id"] == str(test_week_plan.id)
+        assert [week["week_start_date"] for week in data["weeks"]] == [
+            "2095-01-03", "2095-01-10", "2095-01-17",
+        ]
+        # 5 full days of 3 slots and 2 light days of 1 slot per week
+        assert all(week["days"] == 7 and week["slots"] == 17 for week in data["weeks"])
+        assert all(week["unassigned_slots"] == 0 for week in data["weeks"])
+        assert data["total_slots"] == 51
+
+    @pytest.mark.asyncio
+    async def test_same_meals_as_sequential_generation(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+    ):
+        """A range assigns the same meals as generating its weeks one by one."""
+        first = date(2095, 3, 7)
+        last = first + timedelta(weeks=3, days=-1)
+
+        savepoint = await db.begin_nested()
+        await generate_weekly_plans(db, first, week_count=3)
+        ranged = await self.meal_sequence(db, first, last)
+        await savepoint.rollback()
+
+        for offset in range(3):
+            await generate_weekly_plan(db, first + timedelta(weeks=offset))
+        sequential = await self.meal_sequence(db, first, last)
+
+        assert len(ranged) == 51
+        assert ranged == sequential
+
+    @pytest.mark.asyncio
+    async def test_conflict_when_a_week_exists(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+    ):
+        """Nothing is generated if any week in the range already exists."""
+        await generate_weekly_plan(db, date(2095, 5, 9))
+
+        response = await client.post(
+            "/api/v1/weekly-plans/generate-range",
+            json={"week_start_date": "2095-05-02", "weeks": 2},
+        )
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["error"]["code"] == "CONFLICT"
+        assert await get_weekly_instance_by_week_start(db, date(2095, 5, 2)) is None
+
+    @pytest.mark.asyncio
+    async def test_rejects_too_many_weeks(self, client: AsyncClient):
+        """The week count is bounded."""
+        response = await client.post(
+            "/api/v1/weekly-plans/generate-range",
+            json={"week_start_date": "2095-05-02", "weeks": 53},
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_query_count_independent_of_week_count(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+        query_counter,
+    ):
+        """Generating 8 weeks costs the same queries as generating one."""
+        # Warm the plan definition cache
+        await generate_weekly_plans(db, date(2095, 6, 27), week_count=1)
+
+        query_counter.reset()
+        await generate_weekly_plans(db, date(2095, 7, 4), week_count=1)
+        single = query_counter.count
+
+        query_counter.reset()
+        await generate_weekly_plans(db, date(2095, 7, 11), week_count=8)
+        assert query_counter.count == single
+
+
+class TestBulkInsert:
+    """Tests for the multi-row insert and update helpers used by generation."""
+
+    @pytest.mark.asyncio
+    async def test_update_slot_meals_single_statement(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meals: list[Meal],
+        query_counter,
+    ):
+        """All slots are reassigned at once; loaded slots reload their new meal."""
+        instance = await generate_weekly_plan(db, week_start_date=date(2090, 4, 3))
+        result = await db.execute(
+            select(WeeklyPlanSlot).where(WeeklyPlanSlot.weekly_plan_instance_id == instance.id)
+        )
+        slots = result.scalars().all()
+
+        query_counter.reset()
+        await update_slot_meals(
+            db, [(slot.id, test_meals[0].id) for slot in slots[:-1]] + [(slots[-1].id, None)]
+        )
+        assert query_counter.count == 1
+
+        result = await db.execute(
+            select(WeeklyPlanSlot).where(WeeklyPlanSlot.weekly_plan_instance_id == instance.id)
+        )
+        meal_ids = {slot.id: slot.meal_id for slot in result.scalars().all()}
+        assert all(meal_ids[slot.id] == test_meals[0].id for slot in slots[:-1])
+        assert meal_ids[slots[-1].id] is None
+
+    @pytest.mark.asyncio
+    async def test_inserted_rows_build_week_response(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_day_templates: list[DayTemplate],
+        test_meal_types: list[MealType],
+        test_meals: list[Meal],
+        query_counter,
+    ):
+        """Days and slots come back as ORM objects usable for responses."""
+        from app.api.weekly import build_instance_response
+
+        week_start = date(2090, 3, 6)
+        instance = WeeklyPlanInstance(week_plan_id=test_week_plan.id, week_start_date=week_start)
+        db.add(instance)
+        await db.flush()
+
+        query_counter.reset()
+        days = await insert_instance_days(db, [
+            {
+                "weekly_plan_instance_id": instance.id,
+                "date": week_start + timedelta(days=offset),
+                "day_template_id": test_day_templates[0].id,
+                "is_override": False,
+            }
+            for offset in range(7)
+        ])
+        slots = await insert_plan_slots(db, [
+            {
+                "weekly_plan_instance_id": instance.id,
+                "date": day.date,
+                "position": position,
+                "meal_type_id": mt.id,
+                "meal_id": test_meals[(position - 1) * 2].id,
+            }
+            for day in days
+            for position, mt in enumerate(test_meal_types, 1)
+        ])
+
+        assert query_counter.count == 2
+        assert [d.date for d in days] == [week_start + timedelta(days=o) for o in range(7)]
+        assert all(d.id is not None for d in days)
+        assert len(slots) == 21
+        assert slots[0].position == 1 and slots[-1].position == 3
+        assert all(s.is_adhoc is False and s.completion_status is None for s in slots)
+
+        response = await build_instance_response(db, instance)
+        assert len(response.days) == 7
+        assert [s.meal.id for s in response.days[0].slots] == [
+            test_meals[0].id, test_meals[2].id, test_meals[4].id
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rows_cannot_choose_ids(
+        self,
+        db: AsyncSession,
+        test_week_plan: WeekPlan,
+        test_meal_types: list[MealType],
+    ):
+        """Ids are always generated, so a partition can never repeat one of another."""
+        week_start = date(2090, 3, 13)
+        instance = WeeklyPlanInstance(week_plan_id=test_week_plan.id, week_start_date=week_start)
+        db.add(instance)
+        await db.flush()
+        [slot] = await insert_plan_slots(db, [{
+            "weekly_plan_instance_id": instance.id,
+            "date": week_start,
+            "position": 1,
+            "meal_type_id": test_meal_types[0].id,
+        }])
+
+        # The same id a year later would land in another partition
+        with pytest.raises(ValueError, match="generated"):
+            await insert_plan_slots(db, [{
+                "id": slot.id,
+                "weekly_plan_instance_id": instance.id,
+                "date": week_start + timedelta(days=365),
+                "position": 1,
+            }])
+        with pytest.raises(ValueError, match="generated"):
+            await insert_instance_days(db, [{
+                "id": uuid4(),
+                "weekly_plan_instance_id": instance.id,
+                "date": week_start,
+                "is_override": False,
+            }])
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_issue_no_query(self, db: AsyncSession, query_counter):
+        """Empty batches are a no-op."""
+        query_counter.reset()
+        assert await insert_instance_days(db, []) == []
+        assert await insert_plan_slots(db, []) == []
+        assert query_counter.count == 0
@@ -6,7 +6,7 @@ import { Button } from '@/components/ui/button'
 import { Search, Plus, Upload, ChevronDown } from 'lucide-react'
 import { MealEditor, type MealFormData } from '@/components/mealframe/meal-editor'
 import { CSVImporter } from '@/components/mealframe/csv-importer'
-import { useMeals, useCreateMeal, useUpdateMeal, useDeleteMeal } from '@/hooks/use-meals'
+import { useMealSearch, useCreateMeal, useUpdateMeal, useDeleteMeal } from '@/hooks/use-meals'
 import { useMealTypes } from '@/hooks/use-meal-types'
 import type { MealListItem } from '@/lib/types'
 
@@ -29,8 +29,14 @@ export default function MealsPage() {
     }, 300)
   }, [])
 
-  const { data: mealsData, isLoading, error } = useMeals({
-    pageSize: 100,
+  const {
+    data: mealsData,
+    isLoading,
+    error,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useMealSearch({
     search: debouncedSearch || undefined,
     mealTypeId: selectedTypeId || undefined,
   })
@@ -40,8 +46,8 @@ export default function MealsPage() {
   const updateMealMutation = useUpdateMeal()
   const deleteMealMutation = useDeleteMeal()
 
-  const meals = mealsData?.items ?? []
-  const totalCount = mealsData?.total ?? 0
+  const meals = mealsData?.pages.flatMap((page) => page.items) ?? []
+  const totalCount = mealsData?.pages[0]?.total ?? 0
 
   const handleAddMeal = () => {
     setEditingMeal(undefined)
@@ -323,6 +329,17 @@ export default function MealsPage() {
                 </div>
               </button>
             ))}
+
+            {hasNextPage && (
+              <Button
+                variant="outline"
+                className="w-full"
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+              >
+                {isFetchingNextPage ? 'Loading...' : 'Load more'}
+              </Button>
+            )}
           </div>
         )}
       </div>
@@ -1,7 +1,7 @@
 'use client'
 
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
-import { getMeals, getMeal, createMeal, updateMeal, deleteMeal } from '@/lib/api'
+import { useInfiniteQuery, useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { getMeals, getMeal, searchMeals, createMeal, updateMeal, deleteMeal } from '@/lib/api'
 import type { MealCreate, MealUpdate, MealListItem, MealResponse, PaginatedResponse } from '@/lib/types'
 
 interface UseMealsParams {
@@ -19,6 +19,32 @@ export function useMeals({ page = 1, pageSize = 50, search, mealTypeId }: UseMea
   })
 }
 
+interface UseMealSearchParams {
+  search?: string
+  mealTypeId?: string
+  pageSize?: number
+}
+
+/**
+ * Cursor-paginated meal search. The first page also carries the total count;
+ * further pages are fetched with fetchNextPage.
+ */
+export function useMealSearch({ search, mealTypeId, pageSize = 30 }: UseMealSearchParams = {}) {
+  return useInfiniteQuery({
+    queryKey: ['meals', 'search', { search, mealTypeId, pageSize }],
+    queryFn: ({ pageParam }) =>
+      searchMeals(search, {
+        mealTypeId,
+        cursor: pageParam,
+        limit: pageSize,
+        includeTotal: !pageParam,
+      }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+    staleTime: 1000 * 60 * 5,
+  })
+}
+
 export function useMeal(id: string | null) {
   return useQuery<MealResponse>({
     queryKey: ['meal', id],
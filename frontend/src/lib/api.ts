@@ -10,6 +10,8 @@ import type {
   YesterdayReviewResponse,
   CompleteSlotRequest,
   CompleteSlotResponse,
+  BatchCompleteRequest,
+  BatchCompleteResponse,
   WeeklyPlanInstanceResponse,
   WeeklyPlanGenerateRequest,
   SwitchTemplateRequest,
@@ -20,6 +22,7 @@ import type {
   MealCreate,
   MealUpdate,
   MealListItem,
+  MealSearchResponse,
   MealImportResult,
   MealTypeResponse,
   MealTypeCreate,
@@ -136,6 +139,19 @@ export async function uncompleteSlot(slotId: string): Promise<CompleteSlotRespon
   })
 }
 
+/**
+ * Apply many completion changes in one request (offline queue sync).
+ * The latest operation per slot (by client_timestamp) wins.
+ */
+export async function batchCompleteSlots(
+  request: BatchCompleteRequest
+): Promise<BatchCompleteResponse> {
+  return fetchApi<BatchCompleteResponse>('/slots/completions', {
+    method: 'POST',
+    body: JSON.stringify(request),
+  })
+}
+
 // ============================================================================
 // Weekly Planning Endpoints
 // ============================================================================
@@ -230,6 +246,27 @@ export async function getMeals(
   return fetchApi<PaginatedResponse<MealListItem>>(`/meals?${params}`)
 }
 
+/**
+ * Search meals (cursor-paginated; pass next_cursor to get the next page).
+ */
+export async function searchMeals(
+  query?: string,
+  {
+    mealTypeId,
+    cursor,
+    limit = 30,
+    includeTotal = false,
+  }: { mealTypeId?: string; cursor?: string; limit?: number; includeTotal?: boolean } = {}
+): Promise<MealSearchResponse> {
+  const params = new URLSearchParams({ limit: String(limit) })
+  if (query) params.set('q', query)
+  if (mealTypeId) params.set('meal_type_id', mealTypeId)
+  if (cursor) params.set('cursor', cursor)
+  if (includeTotal) params.set('include_total', 'true')
+
+  return fetchApi<MealSearchResponse>(`/meals/search?${params}`)
+}
+
 /**
  * Get a single meal by ID.
  */
@@ -482,6 +519,7 @@ export const api = {
   getYesterday,
   completeSlot,
   uncompleteSlot,
+  batchCompleteSlots,
 
   // Weekly
   getWeek,
@@ -493,6 +531,7 @@ export const api = {
 
   // Meals
   getMeals,
+  searchMeals,
   getMeal,
   createMeal,
   updateMeal,
@@ -3,14 +3,17 @@
  *
  * Persists pending completion mutations to localStorage so they survive
  * app restarts. When the app comes back online, pending actions are
- * replayed against the API.
+ * sent to the batch completion endpoint, a few hundred per request.
  */
 
-import { completeSlot, uncompleteSlot } from './api'
-import type { CompletionStatus } from './types'
+import { batchCompleteSlots } from './api'
+import type { CompletionStatus, SlotCompletionOperation } from './types'
 
 const QUEUE_KEY = 'mealframe:offline-queue'
 
+// Maximum operations per batch request (server limit)
+const BATCH_SIZE = 500
+
 interface QueuedComplete {
   type: 'complete'
   slotId: string
@@ -65,35 +68,43 @@ export function enqueueUncomplete(slotId: string) {
   saveQueue(filtered)
 }
 
+function toOperation(action: QueuedAction): SlotCompletionOperation {
+  return {
+    slot_id: action.slotId,
+    status: action.type === 'complete' ? action.status : null,
+    client_timestamp: new Date(action.timestamp).toISOString(),
+  }
+}
+
 /**
- * Replay all pending actions in order.
+ * Sync all pending actions in batch requests.
+ * The server applies them by timestamp, so completions keep the time they
+ * were marked offline. Actions for slots that no longer exist are dropped;
+ * batches that fail (e.g. still offline) stay queued for the next attempt.
  * Returns the number of successfully synced actions.
  */
 export async function flushQueue(): Promise<number> {
   const queue = getQueue()
   if (queue.length === 0) return 0
 
-  // Sort by timestamp to replay in order
-  queue.sort((a, b) => a.timestamp - b.timestamp)
-
   let synced = 0
-  const failed: QueuedAction[] = []
+  const sent: QueuedAction[] = []
 
-  for (const action of queue) {
+  for (let i = 0; i < queue.length; i += BATCH_SIZE) {
+    const batch = queue.slice(i, i + BATCH_SIZE)
     try {
-      if (action.type === 'complete') {
-        await completeSlot(action.slotId, { status: action.status })
-      } else {
-        await uncompleteSlot(action.slotId)
-      }
-      synced++
+      const { results } = await batchCompleteSlots({ operations: batch.map(toOperation) })
+      synced += results.filter((r) => r.outcome !== 'not_found').length
+      sent.push(...batch)
     } catch {
-      // Keep failed actions for next attempt
-      failed.push(action)
+      // Keep the batch for next attempt
     }
   }
 
-  saveQueue(failed)
+  // Drop what was sent, keeping actions queued while the requests ran
+  const isSent = (a: QueuedAction) =>
+    sent.some((s) => s.slotId === a.slotId && s.timestamp === a.timestamp)
+  saveQueue(getQueue().filter((a) => !isSent(a)))
   return synced
 }
 
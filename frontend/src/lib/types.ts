@@ -103,6 +103,12 @@ export interface MealListItem {
   meal_types: MealTypeCompact[]
 }
 
+export interface MealSearchResponse {
+  items: MealListItem[]
+  next_cursor: string | null
+  total: number | null
+}
+
 export interface MealCreate {
   name: string
   portion_description: string
@@ -309,8 +315,33 @@ export interface CompleteSlotResponse {
   completed_at: string | null
 }
 
+export interface SlotCompletionOperation {
+  slot_id: string
+  /** null undoes completion */
+  status: CompletionStatus | null
+  client_timestamp: string
+}
+
+export interface BatchCompleteRequest {
+  operations: SlotCompletionOperation[]
+}
+
+export type SlotOperationOutcome = 'applied' | 'superseded' | 'not_found'
+
+export interface SlotCompletionResult {
+  slot_id: string
+  outcome: SlotOperationOutcome
+  completion_status: CompletionStatus | null
+  completed_at: string | null
+}
+
+export interface BatchCompleteResponse {
+  results: SlotCompletionResult[]
+}
+
 export interface WeeklyPlanGenerateRequest {
   week_start_date?: string | null
+  regenerate_from?: string | null
 }
 
 export interface SwitchTemplateRequest {
@@ -396,6 +427,11 @@ export interface StatsResponse {
   daily_adherence: DailyAdherence[]
   avg_daily_calories: string | null
   avg_daily_protein: string | null
+  avg_daily_carbs: string | null
+  avg_daily_sugar: string | null
+  avg_daily_fat: string | null
+  avg_daily_saturated_fat: string | null
+  avg_daily_fiber: string | null
 }
 
 // ============================================================================